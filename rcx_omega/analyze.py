@@ -6,15 +6,18 @@ Given a TraceResult, compute a simple classification:
 - maxed (hit max-steps, no detected cycle)
 - cycle (repeat detected in trace steps)
 
-This is intentionally conservative and string-based. We do NOT depend
-on Motif hashing or internal evaluator APIs.
+This is intentionally conservative and text-based: steps are compared by a
+blake2b digest of their structure, equal when their str() renderings are.
+We do NOT depend on Motif hashing or internal evaluator APIs.
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, Optional
+from hashlib import blake2b
+from typing import Any, Dict, Optional
 
+from rcx_pi.core.motif import Motif
 from rcx_omega.trace import TraceResult
 
 
@@ -26,28 +29,63 @@ class TraceAnalysis:
     note: str = ""
 
 
+def _structure_digest(x: Any, memo: Dict[int, bytes]) -> bytes:
+    """
+    128-bit blake2b digest of x's structure, Merkle style: a μ node streams
+    b"(" and its children's fixed-size digests into the hash; a non-Motif
+    item hashes b"'" + its repr. Equal digests <=> equal str() renderings,
+    up to blake2b collisions.
+
+    Iterative post-order; memo (id -> digest) hashes each distinct subtree
+    object once, and the caller must keep the hashed objects alive.
+    """
+    stack = [(x, False)]
+    while stack:
+        m, ready = stack.pop()
+        if id(m) in memo:
+            continue
+        if not isinstance(m, Motif):
+            r = repr(m).encode("utf-8", "surrogatepass")
+            memo[id(m)] = blake2b(b"'" + r, digest_size=16).digest()
+            continue
+        s = m.structure
+        if s and not ready:
+            stack.append((m, True))
+            for c in s:
+                if id(c) not in memo:
+                    stack.append((c, False))
+            continue
+        h = blake2b(b"(", digest_size=16)
+        for c in s:
+            h.update(memo[id(c)])
+        memo[id(m)] = h.digest()
+    return memo[id(x)]
+
+
 def analyze_trace(tr: TraceResult) -> TraceAnalysis:
     if tr.converged:
         return TraceAnalysis(kind="fixedpoint", note="nxt == cur detected")
 
     # If we didn't converge, try to detect a cycle inside the recorded steps.
-    # Use string representations for robustness.
-    seen: Dict[str, int] = {}
-    values = [str(s.value) for s in tr.steps]
-
-    for i, v in enumerate(values):
-        if v in seen:
-            start = seen[v]
-            period = i - start
-            if period > 0:
-                return TraceAnalysis(
-                    kind="cycle",
-                    period=period,
-                    cycle_start=start,
-                    note="repeat detected in trace steps",
-                )
-        else:
-            seen[v] = i
+    # Steps are keyed by a structure digest instead of str(): no formatting,
+    # no recursion, and consecutive steps share subtree objects, which are
+    # hashed once (ids are stable, tr.steps keeps values alive). Each node
+    # costs one short blake2b stream of its children's digests, so keys stay
+    # 16 bytes however large the step. One pass: each key is checked
+    # against earlier steps as it is made.
+    seen: Dict[bytes, int] = {}
+    keys: Dict[int, bytes] = {}
+    for i, s in enumerate(tr.steps):
+        key = _structure_digest(s.value, keys)
+        start = seen.get(key)
+        if start is not None:
+            return TraceAnalysis(
+                kind="cycle",
+                period=i - start,
+                cycle_start=start,
+                note="repeat detected in trace steps",
+            )
+        seen[key] = i
 
     # No cycle detected. If trace_reduce hit max, label maxed.
     if tr.maxed:
@@ -0,0 +1,165 @@
+"""
+RCX-Ω CLI JSON output.
+
+dumps_payload() is the shared JSON writer for Ω CLI payloads;
+emit_payload() is the shared --json output path of the Ω CLIs. It applies
+the opt-in schema fields (rcx_omega.json_versioning) and writes motif
+fields straight from the motifs with write_motif_json().
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import sys
+from typing import Any, Callable, List, Mapping, Optional, TextIO
+
+from rcx_pi import VOID, UNIT
+from rcx_pi.core.motif import Motif
+from rcx_omega.core.motif_codec import _children
+from rcx_omega.json_versioning import maybe_add_schema_fields
+
+try:  # optional: faster payload encoding; output is identical without it
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+
+_NON_ASCII = re.compile(r"[^\x00-\x7f]")
+
+
+def _escape_non_ascii(m: "re.Match[str]") -> str:
+    # json.dumps' ensure_ascii escapes: \uXXXX, surrogate pairs above the BMP
+    c = ord(m.group())
+    if c < 0x10000:
+        return "\\u%04x" % c
+    c -= 0x10000
+    return "\\u%04x\\u%04x" % (0xD800 | (c >> 10), 0xDC00 | (c & 0x3FF))
+
+
+# Maximal runs of non-ASCII bytes in UTF-8 are whole characters
+_NON_ASCII_BYTES = re.compile(rb"[\x80-\xff]+")
+
+
+def _escape_non_ascii_bytes(m: "re.Match[bytes]") -> bytes:
+    return _NON_ASCII.sub(_escape_non_ascii, m.group().decode()).encode()
+
+
+def dumps_payload_bytes(payload: Any) -> bytes:
+    """
+    dumps_payload(payload) as ASCII bytes.
+
+    orjson's output is used as the bytes it already is: only runs of
+    non-ASCII bytes are decoded and escaped, and ASCII output (the usual
+    case) is returned untouched.
+    """
+    if _orjson is not None:
+        try:
+            data = _orjson.dumps(
+                payload, option=_orjson.OPT_INDENT_2 | _orjson.OPT_SORT_KEYS
+            )
+        except TypeError:
+            pass
+        else:
+            if data.isascii():
+                return data
+            return _NON_ASCII_BYTES.sub(_escape_non_ascii_bytes, data)
+    return json.dumps(payload, indent=2, sort_keys=True).encode()
+
+
+def dumps_payload(payload: Any) -> str:
+    """
+    Serialize a CLI payload exactly as json.dumps(payload, indent=2, sort_keys=True).
+
+    Uses orjson's C encoder when it is installed; non-ASCII characters are
+    then escaped the way ensure_ascii does (e.g. μ -> \\u03bc). Payloads
+    orjson rejects (non-str keys, integers wider than 64 bits) go through
+    json. CLI payloads hold no floats, whose spelling differs between the two.
+    """
+    if _orjson is not None:
+        return dumps_payload_bytes(payload).decode()
+    return json.dumps(payload, indent=2, sort_keys=True)
+
+
+def write_motif_json(x: Motif, write: Callable[[str], Any], *, level: int = 0) -> None:
+    """
+    Write x's JSON encoding straight from the motif, without building it.
+
+    The text is json.dumps(motif_to_json_obj(x), indent=2) (ASCII, so μ is
+    spelled \\u03bc), laid out for a value nested `level` containers deep.
+    Iterative: a work stack of pending text pieces and (motif, level) pairs.
+    """
+    stack: List[Any] = [(x, level)]
+    while stack:
+        item = stack.pop()
+        if type(item) is str:
+            write(item)
+            continue
+        m, lv = item
+        pad = "\n" + "  " * lv
+        kids = _children(m)
+        # The atoms have at most one child: wider nodes skip identity checks
+        if len(kids) < 2 and (m is VOID or m is UNIT):
+            atom = "VOID" if m is VOID else "UNIT"
+            write('{' + pad + '  "atom": "' + atom + '"' + pad + '}')
+            continue
+        if not kids:
+            write('{' + pad + '  "\\u03bc": []' + pad + '}')
+            continue
+        write('{' + pad + '  "\\u03bc": [' + pad + "    ")
+        stack.append(pad + "  ]" + pad + "}")
+        # Reversed, so the first child is popped (and written) first
+        sep = "," + pad + "    "
+        n = len(kids)
+        for j in range(n - 1, -1, -1):
+            stack.append((kids[j], lv + 2))
+            if j:
+                stack.append(sep)
+
+
+def emit_payload(
+    payload: Any,
+    *,
+    kind: str,
+    stream: Optional[TextIO] = None,
+    motifs: Optional[Mapping[str, Motif]] = None,
+) -> None:
+    """
+    Write a CLI payload as print(dumps_payload(maybe_add_schema_fields(...)))
+    would, but as a single write to stream (default: sys.stdout).
+
+    motifs adds top-level fields whose values are motifs, written by
+    write_motif_json as their motif_to_json_obj encoding would be, without
+    building those (possibly large or deep) JSON trees. payload must then
+    be a dict with str keys.
+
+    The output is assembled as ASCII bytes. A stream with a binary .buffer
+    (sys.stdout) gets them directly, after its text layer is flushed, so
+    they are not decoded and re-encoded on the way out.
+    """
+    out = sys.stdout if stream is None else stream
+    data = _payload_bytes(maybe_add_schema_fields(payload, kind=kind), motifs)
+    raw = getattr(out, "buffer", None)
+    if raw is None:
+        out.write(data.decode())
+        return
+    out.flush()
+    raw.write(data)
+
+
+def _payload_bytes(payload: Any, motifs: Optional[Mapping[str, Motif]]) -> bytes:
+    if not motifs:
+        return dumps_payload_bytes(payload) + b"\n"
+    parts = [b"{"]
+    for n, key in enumerate(sorted(set(payload).union(motifs))):
+        parts.append(b",\n  " if n else b"\n  ")
+        parts.append(json.dumps(key).encode() + b": ")
+        if key in motifs:
+            text: List[str] = []
+            write_motif_json(motifs[key], text.append, level=1)
+            parts.append("".join(text).encode())
+        else:
+            # JSON strings hold no raw newlines: this only re-indents lines
+            parts.append(dumps_payload_bytes(payload[key]).replace(b"\n", b"\n  "))
+    parts.append(b"\n}\n")
+    return b"".join(parts)
@@ -3,7 +3,7 @@ RCX-Ω analyze CLI (staging)
 
 Consumes JSON from stdin (pipe-friendly) and prints a tiny analysis summary.
 Accepts:
-- trace-shaped payloads (has steps[])
+- trace-shaped payloads (has steps[], or steps as columns from trace_cli --columns)
 - omega summary payloads (kind="omega", has classification/orbit)
 
 Examples:
@@ -18,7 +18,12 @@ import argparse
 import json
 import sys
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple
+
+try:
+    import ijson as _ijson
+except ImportError:
+    _ijson = None
 
 
 def _read_text_from_file(p: Path) -> str:
@@ -39,11 +44,107 @@ def _load_json(text: str) -> Dict[str, Any]:
     return obj
 
 
+# All an omega summary reads: kind, classification line, stats line
+_OMEGA_SUMMARY_FIELDS = ("kind", "classification", "stats")
+
+
+def _load_json_stream(fp: BinaryIO) -> Dict[str, Any]:
+    """
+    Stream-parse a payload with ijson without materializing steps[].
+
+    Every other field is built as json.loads would build it. steps[] comes
+    back as a list of the right length holding only the last step (the
+    rest are None), which is all analyze_cli reads from it.
+
+    Once "kind": "omega" has been read, fields an omega summary never reads
+    (motifs, orbit, steps) are skipped without being built. Producers sort
+    keys, so "kind" precedes orbit/result/seed/steps.
+    """
+    payload: Dict[str, Any] = {}
+    depth = 0
+    key: Optional[str] = None
+    builder = None  # collects the value currently being read
+    skipping = False  # the value currently being read is discarded
+    base = 0  # depth that value started at
+    in_steps = False
+    n_steps = 0
+    last_step: Any = None
+    try:
+        for _prefix, event, value in _ijson.parse(fp, use_float=True):
+            if event in ("end_map", "end_array"):
+                depth -= 1
+            if builder is not None:
+                builder.event(event, value)
+            elif skipping:
+                pass
+            elif depth == 0:
+                if event not in ("start_map", "end_map"):
+                    raise SystemExit("analyze_cli: JSON payload must be an object")
+            elif depth == 1 and event == "map_key":
+                key = value
+            elif (
+                depth == 1
+                and not in_steps
+                and payload.get("kind") == "omega"
+                and key not in _OMEGA_SUMMARY_FIELDS
+            ):
+                skipping = True
+                base = depth
+            elif depth == 1 and key == "steps" and event == "start_array":
+                in_steps, n_steps, last_step = True, 0, None
+            elif depth == 1 and in_steps:
+                # end of steps[]
+                in_steps = False
+                payload["steps"] = [None] * (n_steps - 1) + [last_step] if n_steps else []
+            else:
+                # A value starts: a top-level field or one item of steps[]
+                builder = _ijson.ObjectBuilder()
+                builder.event(event, value)
+                base = depth
+                if in_steps:
+                    n_steps += 1
+            if event in ("start_map", "start_array"):
+                depth += 1
+            if skipping and depth == base:
+                skipping = False
+            if builder is not None and depth == base:
+                if in_steps:
+                    last_step = builder.value
+                else:
+                    payload[key] = builder.value
+                builder = None
+    except _ijson.JSONError as e:
+        raise SystemExit(f"analyze_cli: invalid JSON: {e}") from e
+    return payload
+
+
+def _steps_count_and_last(steps: Any) -> Tuple[int, Optional[Dict[str, Any]]]:
+    """
+    (number of steps, last step as a row) for either steps layout:
+    a list of rows, or columns {"i": [...], "nodes": [...], ...}.
+    Returns (0, None) for anything else.
+    """
+    if isinstance(steps, list):
+        last = steps[-1] if steps and isinstance(steps[-1], dict) else None
+        return len(steps), last
+    if isinstance(steps, dict) and isinstance(steps.get("i"), list):
+        n = len(steps["i"])
+        if n == 0:
+            return 0, None
+        last = {}
+        for name, col in steps.items():
+            if isinstance(col, list) and len(col) == n:
+                last[name] = col[-1]
+        return n, last
+    return 0, None
+
+
 def _detect_kind(payload: Dict[str, Any]) -> str:
     k = payload.get("kind")
     if isinstance(k, str) and k:
         return k
-    if isinstance(payload.get("steps"), list):
+    steps = payload.get("steps")
+    if isinstance(steps, list) or (isinstance(steps, dict) and isinstance(steps.get("i"), list)):
         return "trace"
     if isinstance(payload.get("classification"), dict) or isinstance(
         payload.get("orbit"), list
@@ -63,14 +164,12 @@ def _trace_converged(payload: Dict[str, Any]) -> bool:
     if inp is not None and res is not None and inp == res:
         return True
 
-    steps = payload.get("steps")
-    if isinstance(steps, list) and steps:
-        last = steps[-1]
-        if isinstance(last, dict):
-            dn = last.get("delta_nodes")
-            dd = last.get("delta_depth")
-            if isinstance(dn, int) and isinstance(dd, int):
-                return (dn == 0) and (dd == 0)
+    _, last = _steps_count_and_last(payload.get("steps"))
+    if last is not None:
+        dn = last.get("delta_nodes")
+        dd = last.get("delta_depth")
+        if isinstance(dn, int) and isinstance(dd, int):
+            return (dn == 0) and (dd == 0)
 
     return False
 
@@ -117,40 +216,36 @@ def main(argv: List[str]) -> int:
         print("analyze_cli: --stdin and --file are mutually exclusive", file=sys.stderr)
         return 2
 
-    raw = (
-        _read_text_from_file(Path(args.file))
-        if args.file is not None
-        else _read_text_from_stdin()
-    )
-    payload = _load_json(raw)
+    if _ijson is not None:
+        # Stream: a large trace's steps[] is never built
+        if args.file is not None:
+            with open(args.file, "rb") as fp:
+                payload = _load_json_stream(fp)
+        else:
+            payload = _load_json_stream(sys.stdin.buffer)
+    else:
+        raw = (
+            _read_text_from_file(Path(args.file))
+            if args.file is not None
+            else _read_text_from_stdin()
+        )
+        payload = _load_json(raw)
     kind = _detect_kind(payload)
+    stats = _safe_get_stats(payload)
+    stats_line = f"stats: {stats}\n" if stats is not None else ""
 
+    # The summary is assembled and written once
     if kind == "trace":
-        steps = payload.get("steps")
-        n_steps = len(steps) if isinstance(steps, list) else 0
-        print("analyze: trace")
-        print(f"steps: {n_steps}")
-        stats = _safe_get_stats(payload)
-        if stats is not None:
-            print(f"stats: {stats}")
-        print(f"converged: {'true' if _trace_converged(payload) else 'false'}")
-        print("== Ω analyze ==")
-        return 0
-
-    if kind == "omega":
-        print("analyze: summary")
-        print(_omega_classification_summary(payload))
-        stats = _safe_get_stats(payload)
-        if stats is not None:
-            print(f"stats: {stats}")
-        print("== Ω analyze ==")
-        return 0
-
-    print("analyze: unknown")
-    stats = _safe_get_stats(payload)
-    if stats is not None:
-        print(f"stats: {stats}")
-    print("== Ω analyze ==")
+        n_steps, _ = _steps_count_and_last(payload.get("steps"))
+        converged = "true" if _trace_converged(payload) else "false"
+        text = (
+            f"analyze: trace\nsteps: {n_steps}\n{stats_line}converged: {converged}\n"
+        )
+    elif kind == "omega":
+        text = f"analyze: summary\n{_omega_classification_summary(payload)}\n{stats_line}"
+    else:
+        text = f"analyze: unknown\n{stats_line}"
+    sys.stdout.write(text + "== Ω analyze ==\n")
     return 0
 
 
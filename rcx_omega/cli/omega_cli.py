@@ -18,14 +18,13 @@ Notes:
 from __future__ import annotations
 
 import argparse
-import json
 import sys
 from pathlib import Path
 from typing import List, Optional
 
 from rcx_omega.core.motif_parser import parse_motif
-from rcx_omega.core.omega_runner import omega_run_to_json, run_omega
-from rcx_omega.json_versioning import maybe_add_schema_fields
+from rcx_omega.core.omega_runner import omega_run_motifs, omega_run_to_json, run_omega
+from rcx_omega.cli._emit import emit_payload
 
 
 def _read_text_from_file(p: Path) -> str:
@@ -74,14 +73,15 @@ def main(argv: List[str]) -> int:
     run = run_omega(seed, max_steps=args.max_steps)
 
     if args.json:
+        # Motif fields are written straight from the motifs by emit_payload
         payload = omega_run_to_json(
-            run, include_meta=False, include_steps=bool(args.trace)
-        )
-        print(
-            json.dumps(
-                maybe_add_schema_fields(payload, kind="omega"), indent=2, sort_keys=True
-            )
+            run,
+            include_meta=False,
+            include_steps=bool(args.trace),
+            include_motifs=False,
         )
+        motifs = omega_run_motifs(run, include_steps=bool(args.trace))
+        emit_payload(payload, kind="omega", motifs=motifs)
         return 0
 
     # tiny human mode
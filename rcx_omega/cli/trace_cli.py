@@ -14,17 +14,19 @@ Examples:
 from __future__ import annotations
 
 import argparse
-import json
+import re
 import sys
+from functools import lru_cache
+from itertools import islice
+from operator import sub
 from pathlib import Path
-from typing import Any, Iterable, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 from rcx_pi import new_evaluator, μ, VOID, UNIT
-from rcx_pi.core.motif import Motif
+from rcx_pi.core.motif import Motif, intern_motif
 
 from rcx_omega.engine.trace import trace_reduce
-from rcx_omega.core.motif_codec import motif_to_json_obj
-from rcx_omega.json_versioning import maybe_add_schema_fields
+from rcx_omega.cli._emit import emit_payload
 
 
 def _motif_children(x: Motif) -> Tuple[Motif, ...]:
@@ -38,11 +40,45 @@ def _motif_children(x: Motif) -> Tuple[Motif, ...]:
     return ()
 
 
-def _motif_depth(x: Motif) -> int:
-    kids = _motif_children(x)
-    if not kids:
-        return 1
-    return 1 + max(_motif_depth(k) for k in kids)
+def _motif_stats(
+    x: Motif, memo: Optional[Dict[int, Tuple[int, int]]] = None
+) -> Tuple[int, int]:
+    # (nodes, depth) in one walk: nodes as Motif.count_nodes(), depth with
+    # every child a level. memo (id -> stats) measures each distinct node
+    # object once; trace steps share subterms, so one memo serves the whole
+    # trace. The caller must keep the motifs alive while the memo is in use.
+    # Post-order over an explicit stack, so depth is not a recursion limit.
+    if memo is None:
+        memo = {}
+    hit = memo.get(id(x))
+    if hit is not None:
+        return hit
+    stack = [x]
+    while stack:
+        node = stack[-1]
+        if id(node) in memo:
+            stack.pop()
+            continue
+        kids = _motif_children(node)
+        pending = False
+        for k in kids:
+            if isinstance(k, Motif) and id(k) not in memo:
+                stack.append(k)
+                pending = True
+        if pending:
+            continue
+        stack.pop()
+        nodes, depth = 1, 0
+        for k in kids:
+            if isinstance(k, Motif):
+                kn, kd = memo[id(k)]
+            else:
+                kn, kd = 0, 1
+            nodes += kn
+            if kd > depth:
+                depth = kd
+        memo[id(node)] = (nodes, depth + 1)
+    return memo[id(x)]
 
 
 def _read_text_file(p: str) -> str:
@@ -53,30 +89,47 @@ def _read_stdin() -> str:
     return sys.stdin.read().strip()
 
 
+# Every μ() the parsers produce is this one motif: motifs are immutable, so
+# sharing it is safe, and it is built once instead of per occurrence.
+_MU = μ()
+
+# Atom literals, matched after strip().lower(): one dict lookup per atom.
+_ATOM_LITERALS = {
+    "void": VOID,
+    "0": VOID,
+    "unit": UNIT,
+    "1": UNIT,
+    "mu": _MU,
+    "μ": _MU,
+    "mu()": _MU,
+    "μ()": _MU,
+}
+
+
 def _parse_simple_atom(tok: str) -> Motif:
-    t = tok.strip()
-    tl = t.lower()
+    atom = _ATOM_LITERALS.get(tok.strip().lower())
+    if atom is None:
+        raise ValueError(f"Unsupported atom literal: {tok!r}")
+    return atom
 
-    if tl in ("void", "0"):
-        return VOID
-    if tl in ("unit", "1"):
-        return UNIT
-    if tl in ("mu", "μ", "mu()", "μ()"):
-        return μ()
 
-    raise ValueError(f"Unsupported atom literal: {tok!r}")
+# Only parens and commas affect splitting; the regex scan skips every other
+# character (atoms, spaces, μ) in C instead of one Python iteration each.
+_SPLIT_TOKENS = re.compile(r"[(),]")
 
 
 def _split_top_level_commas(s: str) -> List[str]:
     parts: List[str] = []
     depth = 0
     start = 0
-    for i, ch in enumerate(s):
+    for tok in _SPLIT_TOKENS.finditer(s):
+        ch = tok.group()
         if ch == "(":
             depth += 1
         elif ch == ")":
             depth -= 1
-        elif ch == "," and depth == 0:
+        elif depth == 0:
+            i = tok.start()
             parts.append(s[start:i].strip())
             start = i + 1
     tail = s[start:].strip()
@@ -85,12 +138,82 @@ def _split_top_level_commas(s: str) -> List[str]:
     return parts
 
 
+# One token of the common grammar, after optional whitespace: an opening
+# "μ(" / "mu(", ")", ",", or an atom word. A bare "(" matches nothing.
+_EXPR_TOKEN = re.compile(r"\s*(?:(μ\(|mu\()|(\))|(,)|([^\s(),]+))")
+
+
+def _parse_motif_fast(s: str) -> Optional[Motif]:
+    """
+    Single-pass parser for the common grammar: atoms and μ(a, b, ...)
+    with optional whitespace between tokens. No recursion, no rescans.
+
+    Returns None for anything outside that grammar (errors included); the
+    caller then defers to _parse_motif_expr_slow, which decides.
+    """
+    stack: List[List[Motif]] = []  # children of each open μ(
+    top: Optional[Motif] = None
+    want_value = True
+    just_opened = False
+    pos = 0
+    while True:
+        tok = _EXPR_TOKEN.match(s, pos)
+        if tok is None:
+            break
+        pos = tok.end()
+        opener, close, comma, word = tok.groups()
+        if want_value:
+            if opener:
+                stack.append([])
+                just_opened = True
+                continue
+            if close and just_opened:
+                value = _MU
+                stack.pop()
+            elif word:
+                # A word never contains parens: only the bare atoms match
+                atom = _ATOM_LITERALS.get(word.lower())
+                if atom is None:
+                    return None
+                value = atom
+            else:
+                return None
+            just_opened = False
+            want_value = False
+        elif comma and stack:
+            want_value = True
+            continue
+        elif close and stack:
+            value = μ(*stack.pop())
+        else:
+            return None
+        if stack:
+            stack[-1].append(value)
+        else:
+            top = value
+    if stack or want_value or s[pos:].strip():
+        return None
+    return top
+
+
+@lru_cache(maxsize=1024)
 def parse_motif_expr(expr: str) -> Motif:
     """
     Minimal parser for:
       - atoms: void, unit, mu, μ(), 0, 1
       - μ(...) / mu(...)
+
+    Results are cached per expression (motifs are immutable).
     """
+    fast = _parse_motif_fast(expr)
+    if fast is not None:
+        return fast
+    return _parse_motif_expr_slow(expr)
+
+
+def _parse_motif_expr_slow(expr: str) -> Motif:
+    # Reference recursive parser: rescans each argument list, but settles
+    # every edge case (trailing commas, "Mu()", errors) for parse_motif_expr
     s = expr.strip()
     if not s:
         raise ValueError("Empty motif expression")
@@ -99,44 +222,71 @@ def parse_motif_expr(expr: str) -> Motif:
         s = "μ" + s[2:]
 
     if s == "μ()":
-        return μ()
+        return _MU
 
     if s.startswith("μ(") and s.endswith(")"):
         inner = s[2:-1].strip()
         if inner == "":
-            return μ()
+            return _MU
         args = _split_top_level_commas(inner)
-        kids = [parse_motif_expr(a) for a in args]
+        kids = [_parse_motif_expr_slow(a) for a in args]
         return μ(*kids)
 
     return _parse_simple_atom(s)
 
 
+_STEP_MOTIF_ATTRS = (
+    "motif",
+    "state",
+    "value",
+    "node",
+    "expr",
+    "x",
+    "current",
+    "result",
+    "out",
+)
+
+
 def _step_motif(step: Any) -> Optional[Motif]:
     """
     Trace engine may change TraceStep shape over time.
     We try a few common attribute names and only accept Motif instances.
     """
-    for name in (
-        "motif",
-        "state",
-        "value",
-        "node",
-        "expr",
-        "x",
-        "current",
-        "result",
-        "out",
-    ):
-        try:
-            v = getattr(step, name)
-        except Exception:
-            continue
+    for name in _STEP_MOTIF_ATTRS:
+        v = getattr(step, name, None)
         if isinstance(v, Motif):
             return v
     return None
 
 
+def _step_motif_reader() -> Callable[[Any], Optional[Motif]]:
+    """
+    _step_motif for the steps of one trace.
+
+    Every step of a trace has the same shape, so the attribute that held the
+    first motif is tried first on later steps; a step it misses on gets the
+    full _step_motif probe. The remembered attribute lives in the returned
+    closure, so each trace starts from the documented priority order.
+    """
+    attr: Optional[str] = None
+
+    def read(step: Any) -> Optional[Motif]:
+        nonlocal attr
+        if attr is not None:
+            v = getattr(step, attr, None)
+            if isinstance(v, Motif):
+                return v
+        for name in _STEP_MOTIF_ATTRS:
+            v = getattr(step, name, None)
+            if isinstance(v, Motif):
+                attr = name
+                return v
+        return None
+
+    return read
+
+
 def _iter_steps(tr: Any) -> List[Any]:
     steps = getattr(tr, "steps", None)
     if isinstance(steps, list):
@@ -157,6 +307,11 @@ def main(argv: List[str]) -> int:
     parser.add_argument("--max-steps", type=int, default=64, help="Trace cap")
     parser.add_argument("--stdin", action="store_true", help="Read motif from stdin")
     parser.add_argument("--file", type=str, default=None, help="Read motif from file")
+    parser.add_argument(
+        "--columns",
+        action="store_true",
+        help="With --json, emit steps as columns {i: [...], nodes: [...], ...} instead of rows",
+    )
     args = parser.parse_args(argv[1:])
 
     if args.stdin and args.file:
@@ -178,88 +333,87 @@ def main(argv: List[str]) -> int:
 
     steps = _iter_steps(tr)
 
-    # Derive per-step metrics from motifs (do NOT assume TraceStep has nodes/depth)
-    derived_steps = []
-    prev_nodes = None
-    prev_depth = None
+    # Derive per-step metrics from motifs (do NOT assume TraceStep has nodes/depth).
+    # Metrics are kept as columns; rows are only built for the row layout.
+    col_i: List[int] = []
+    col_nodes: List[int] = []
+    col_depth: List[int] = []
+    # Motifs are measured in interned form: a subterm that recurs across
+    # steps (fixpoints, cycles, rebuilt spines) is then one object, so the
+    # id-keyed memo measures it once. measured keeps every interned motif
+    # alive until main returns, so memo ids are never recycled.
+    stats_memo: Dict[int, Tuple[int, int]] = {}
+    measured: List[Motif] = []
+    last_motif: Optional[Motif] = None
+    step_motif = _step_motif_reader()
 
     for idx, s in enumerate(steps):
-        m = _step_motif(s) or x  # fallback: at least something motif-shaped
-        nodes = m.count_nodes()
-        depth = _motif_depth(m)
-        delta_nodes = 0 if prev_nodes is None else nodes - prev_nodes
-        delta_depth = 0 if prev_depth is None else depth - prev_depth
-        i = getattr(s, "i", idx)
-
-        derived_steps.append(
-            {
-                "i": int(i),
-                "nodes": int(nodes),
-                "depth": int(depth),
-                "delta_nodes": int(delta_nodes),
-                "delta_depth": int(delta_depth),
-            }
-        )
-        prev_nodes, prev_depth = nodes, depth
+        last_motif = step_motif(s) or x  # fallback: at least something motif-shaped
+        m = intern_motif(last_motif)
+        measured.append(m)
+        nodes, depth = _motif_stats(m, stats_memo)
+        col_i.append(int(getattr(s, "i", idx)))
+        col_nodes.append(int(nodes))
+        col_depth.append(int(depth))
+
+    # Deltas against the previous step (0 for the first), one whole-column
+    # pass each: map(sub, ...) runs in C, with no per-step branch, and
+    # islice offsets the column without copying it (map stops at the shorter)
+    col_dn: List[int] = [0]
+    col_dn.extend(map(sub, islice(col_nodes, 1, None), col_nodes))
+    col_dd: List[int] = [0]
+    col_dd.extend(map(sub, islice(col_depth, 1, None), col_depth))
 
     # Stats for input/result
-    in_nodes = x.count_nodes()
-    in_depth = _motif_depth(x)
+    measured.append(intern_motif(x))
+    in_nodes, in_depth = _motif_stats(measured[-1], stats_memo)
     result_motif = getattr(tr, "result", x)
     if not isinstance(result_motif, Motif):
         result_motif = x
-    out_nodes = result_motif.count_nodes()
-    out_depth = _motif_depth(result_motif)
+    if col_i and result_motif is last_motif:
+        # The result is usually the last step's motif: reuse its stats
+        # rather than interning it again
+        out_nodes, out_depth = col_nodes[-1], col_depth[-1]
+    else:
+        measured.append(intern_motif(result_motif))
+        out_nodes, out_depth = _motif_stats(measured[-1], stats_memo)
+
+    if not col_i:
+        col_i, col_nodes, col_depth, col_dn, col_dd = [0], [in_nodes], [in_depth], [0], [0]
 
     if args.json:
+        steps_out: Any
+        if args.columns:
+            steps_out = {
+                "i": col_i,
+                "nodes": col_nodes,
+                "depth": col_depth,
+                "delta_nodes": col_dn,
+                "delta_depth": col_dd,
+            }
+        else:
+            steps_out = [
+                {"i": i, "nodes": n, "depth": d, "delta_nodes": dn, "delta_depth": dd}
+                for i, n, d, dn, dd in zip(col_i, col_nodes, col_depth, col_dn, col_dd)
+            ]
+        # input/result are written straight from the motifs by emit_payload
+        # (as motif_to_json_obj would encode them), not built as JSON trees
         payload = {
-            "input": motif_to_json_obj(x, include_meta=False),
-            "result": motif_to_json_obj(result_motif, include_meta=False),
             "stats": {
                 "input": {"nodes": in_nodes, "depth": in_depth},
                 "result": {"nodes": out_nodes, "depth": out_depth},
             },
-            "steps": derived_steps
-            if derived_steps
-            else [
-                {
-                    "i": 0,
-                    "nodes": in_nodes,
-                    "depth": in_depth,
-                    "delta_nodes": 0,
-                    "delta_depth": 0,
-                }
-            ],
+            "steps": steps_out,
         }
-        print(
-            json.dumps(
-                maybe_add_schema_fields(payload, kind="trace"), indent=2, sort_keys=True
-            )
-        )
+        emit_payload(payload, kind="trace", motifs={"input": x, "result": result_motif})
         return 0
 
     # Human output (tests expect "result:" and "steps:")
-    for s in (
-        derived_steps
-        if derived_steps
-        else [
-            {
-                "i": 0,
-                "nodes": in_nodes,
-                "depth": in_depth,
-                "delta_nodes": 0,
-                "delta_depth": 0,
-            }
-        ]
-    ):
-        print(
-            f"{s['i']:03d}: nodes={s['nodes']:+d} depth={s['depth']:+d} "
-            f"(Δn={s['delta_nodes']:+d}, Δd={s['delta_depth']:+d})"
-        )
+    for i, n, d, dn, dd in zip(col_i, col_nodes, col_depth, col_dn, col_dd):
+        print(f"{i:03d}: nodes={n:+d} depth={d:+d} (Δn={dn:+d}, Δd={dd:+d})")
     print(f"result: {result_motif}")
-    print(f"steps:  {len(derived_steps) if derived_steps else 1}")
+    print(f"steps:  {len(col_i)}")
     return 0
 
-
 if __name__ == "__main__":
     raise SystemExit(main(sys.argv))
@@ -16,7 +16,7 @@ Encoding contract (minimal):
 
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Sequence
 
 from rcx_pi import μ, VOID, UNIT
 from rcx_pi.core.motif import Motif
@@ -24,51 +24,107 @@ from rcx_pi.core.motif import Motif
 JsonObj = Any
 
 
-def _children(x: Motif) -> List[Motif]:
-    st = getattr(x, "structure", None)
+def _children(x: Motif) -> Sequence[Motif]:
+    # Fast path: Motif.structure is a tuple; hand it back as is
+    try:
+        st = x.structure
+    except AttributeError:
+        return ()
+    if type(st) is tuple:
+        return st
     if st is None:
-        return []
+        return ()
     if isinstance(st, tuple):
-        return list(st)
+        return st
     if isinstance(st, list):
         return st
-    return []
+    return ()
 
 
-def motif_to_json_obj(x: Motif, *, include_meta: bool = False) -> Dict[str, Any]:
+def motif_to_json_obj(
+    x: Motif,
+    *,
+    include_meta: bool = False,
+    memo: Optional[Dict[int, Dict[str, Any]]] = None,
+) -> Dict[str, Any]:
     """
     Encode a π Motif as a JSON object.
 
     include_meta is accepted for forward-compatibility with Ω tooling/CLI.
     (Currently ignored; Ω may later include lightweight annotations.)
-    """
-    # Identity checks only: avoid collapsing arbitrary motifs that are structurally
-    # equal to UNIT/VOID.
-    if x is VOID:
-        return {"atom": "VOID"}
-    if x is UNIT:
-        return {"atom": "UNIT"}
 
-    kids = _children(x)
-    return {"μ": [motif_to_json_obj(k, include_meta=include_meta) for k in kids]}
+    Iterative: each μ node's child list is created empty, placed in its
+    parent, and filled as the children are popped from the work stack, so
+    deep motifs do not recurse.
+
+    Motifs are immutable, so a subtree object that occurs more than once is
+    encoded once and its JSON object shared (treat the result as read-only).
+    memo (id -> JSON object) extends that sharing across calls, e.g. over
+    the states of one orbit; the caller must keep those motifs alive while
+    the memo is in use.
+    """
+    if memo is None:
+        memo = {}
+    # The atoms are entered by id up front: the singletons (and only they,
+    # not motifs merely structurally equal to UNIT/VOID) are then found by
+    # the memo lookup every node does anyway, with no per-node atom checks.
+    if id(VOID) not in memo:
+        memo[id(VOID)] = {"atom": "VOID"}
+        memo[id(UNIT)] = {"atom": "UNIT"}
+    root: List[Dict[str, Any]] = []
+    stack = [(x, root)]
+    while stack:
+        m, out = stack.pop()
+        hit = memo.get(id(m))
+        if hit is not None:
+            out.append(hit)
+            continue
+        kids_out: List[Dict[str, Any]] = []
+        # Motif trees are acyclic: the object is complete once the walk ends
+        memo[id(m)] = {"μ": kids_out}
+        out.append(memo[id(m)])
+        # Reversed, so the first child is popped (and appended) first
+        for k in reversed(_children(m)):
+            stack.append((k, kids_out))
+    return root[0]
 
 
 def json_obj_to_motif(obj: JsonObj) -> Motif:
-    if not isinstance(obj, dict):
-        raise ValueError(f"Invalid motif JSON object (expected dict): {obj!r}")
-
-    if "atom" in obj:
-        a = obj["atom"]
-        if a == "VOID":
-            return VOID
-        if a == "UNIT":
-            return UNIT
-        raise ValueError(f"Unknown atom: {a!r}")
-
-    if "μ" in obj:
-        v = obj["μ"]
-        if not isinstance(v, list):
-            raise ValueError(f"Invalid μ payload (expected list): {v!r}")
-        return μ(*[json_obj_to_motif(child) for child in v])
-
-    raise ValueError(f"Invalid motif JSON object (expected 'μ' or 'atom'): {obj!r}")
+    # Iterative post-order: objects are validated in document order as they
+    # are popped; a μ node is revisited once its children are built, and
+    # collects them from the top of the built stack.
+    built: List[Motif] = []
+    stack = [(obj, False)]
+    while stack:
+        o, ready = stack.pop()
+        if ready:
+            n = len(o["μ"])
+            kids = built[len(built) - n :]
+            del built[len(built) - n :]
+            built.append(μ(*kids))
+            continue
+
+        if not isinstance(o, dict):
+            raise ValueError(f"Invalid motif JSON object (expected dict): {o!r}")
+
+        if "atom" in o:
+            a = o["atom"]
+            if a == "VOID":
+                built.append(VOID)
+            elif a == "UNIT":
+                built.append(UNIT)
+            else:
+                raise ValueError(f"Unknown atom: {a!r}")
+            continue
+
+        if "μ" in o:
+            v = o["μ"]
+            if not isinstance(v, list):
+                raise ValueError(f"Invalid μ payload (expected list): {v!r}")
+            stack.append((o, True))
+            for child in reversed(v):
+                stack.append((child, False))
+            continue
+
+        raise ValueError(f"Invalid motif JSON object (expected 'μ' or 'atom'): {o!r}")
+    return built[0]
@@ -15,81 +15,70 @@ This is intentionally small:
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import re
+from functools import lru_cache
+from typing import List
 
 from rcx_pi import μ
 
-
-@dataclass(frozen=True)
-class _Cursor:
-    s: str
-    i: int = 0
-
-    def eof(self) -> bool:
-        return self.i >= len(self.s)
-
-    def peek(self) -> str:
-        return "" if self.eof() else self.s[self.i]
-
-    def consume(self, n: int = 1) -> "_Cursor":
-        return _Cursor(self.s, self.i + n)
-
-    def skip_ws(self) -> "_Cursor":
-        i = self.i
-        while i < len(self.s) and self.s[i].isspace():
-            i += 1
-        return _Cursor(self.s, i)
-
-    def expect(self, ch: str) -> "_Cursor":
-        c = self.skip_ws()
-        if c.eof() or c.s[c.i] != ch:
-            got = "EOF" if c.eof() else repr(c.s[c.i])
-            raise ValueError(f"Expected {ch!r} at pos {c.i}, got {got}")
-        return _Cursor(c.s, c.i + 1)
+# One token per match: "μ"/"mu", a delimiter, a whitespace run (skipped), or
+# any other single character (always a syntax error).
+_TOKEN = re.compile(r"μ|mu|[(),]|\s+|.", re.S)
 
 
+@lru_cache(maxsize=1024)
 def parse_motif(text: str):
     """
     Parse a μ-only motif literal into an rcx_pi Motif.
     Raises ValueError on invalid syntax.
-    """
-    c = _Cursor(text).skip_ws()
-    node, c2 = _parse_mu_expr(c)
-    c2 = c2.skip_ws()
-    if not c2.eof():
-        raise ValueError(f"Trailing junk at pos {c2.i}: {c2.s[c2.i :]!r}")
-    return node
-
-
-def _parse_mu_expr(c: _Cursor):
-    c = c.skip_ws()
-
-    # accept "μ" or "mu"
-    if c.s.startswith("μ", c.i):
-        c = c.consume(1)
-    elif c.s.startswith("mu", c.i):
-        c = c.consume(2)
-    else:
-        raise ValueError(f"Expected 'μ' or 'mu' at pos {c.i}")
 
-    c = c.expect("(")
-    c = c.skip_ws()
+    Motifs are immutable, so results are cached per literal: re-parsing the
+    same text returns the same object (errors are not cached).
 
-    # empty args: μ()
-    if c.peek() == ")":
-        c = c.expect(")")
-        return μ(), c
+    Single pass over the tokens, with an explicit stack of the child lists
+    of the μ nodes still open, so nesting depth is not limited by recursion.
+    """
+    tokens = [(m.group(), m.start()) for m in _TOKEN.finditer(text) if not m.group().isspace()]
+    end = len(text)
+    n = len(tokens)
+    stack: List[list] = []  # child lists of the open μ nodes
+    i = 0
 
-    # otherwise: μ(arg (, arg)*)
-    kids = []
     while True:
-        child, c = _parse_mu_expr(c)
-        kids.append(child)
-        c = c.skip_ws()
-        if c.peek() == ",":
-            c = c.consume(1)
+        # Expect an expression: μ or mu, then "(".
+        tok, pos = tokens[i] if i < n else ("", end)
+        if tok not in ("μ", "mu"):
+            raise ValueError(f"Expected 'μ' or 'mu' at pos {pos}")
+        i += 1
+        tok, pos = tokens[i] if i < n else ("", end)
+        if tok != "(":
+            got = "EOF" if i >= n else repr(text[pos])
+            raise ValueError(f"Expected '(' at pos {pos}, got {got}")
+        i += 1
+
+        if i < n and tokens[i][0] == ")":
+            # empty args: μ()
+            i += 1
+            node = μ()
+        else:
+            # otherwise: μ(arg (, arg)*) - parse the first arg
+            stack.append([])
             continue
-        break
 
-    c = c.expect(")")
-    return μ(*kids), c
+        # A node is complete: attach it, closing every node it completes.
+        while stack:
+            stack[-1].append(node)
+            tok, pos = tokens[i] if i < n else ("", end)
+            if tok == ",":
+                i += 1
+                break
+            if tok != ")":
+                got = "EOF" if i >= n else repr(text[pos])
+                raise ValueError(f"Expected ')' at pos {pos}, got {got}")
+            i += 1
+            node = μ(*stack.pop())
+        else:
+            if i < n:
+                pos = tokens[i][1]
+                raise ValueError(f"Trailing junk at pos {pos}: {text[pos:]!r}")
+            return node
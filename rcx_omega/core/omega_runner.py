@@ -11,15 +11,16 @@ Intentionally tiny + dependency-light.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+import weakref
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
 
-from rcx_pi import new_evaluator
-from rcx_omega.core.motif_codec import motif_to_json_obj
+from rcx_pi import new_evaluator, VOID, UNIT
+from rcx_pi.core.motif import Motif
 
 
-@dataclass(frozen=True)
-class OmegaOrbitStep:
+class OmegaOrbitStep(NamedTuple):
+    # One per orbit step: a tuple is cheaper to build than a frozen dataclass
     i: int
     value: Any
 
@@ -32,41 +33,222 @@ class OmegaRun:
     classification: str  # "fixed_point" | "limit_cycle" | "cutoff"
     period: Optional[int] = None
     mu: Optional[int] = None  # start index of cycle if limit_cycle
+    # id -> (nodes, depth) for the motifs this run holds, filled by
+    # omega_run_to_json and reused by later calls on the same run (the run
+    # keeps those motifs alive, so their ids stay valid)
+    sizes: Dict[int, Tuple[int, int]] = field(
+        default_factory=dict, compare=False, repr=False
+    )
 
 
-def _children(x: Any) -> List[Any]:
+def _children(x: Any) -> Sequence[Any]:
     """
-    RCX-π Motif exposes children via .structure (tuple of motifs).
-    If something else sneaks in, treat it as a leaf.
+    RCX-π Motif exposes children via .structure (tuple of motifs), returned
+    as is (no copy). If something else sneaks in, treat it as a leaf.
     """
     try:
-        s = getattr(x, "structure", None)
-        if isinstance(s, tuple):
-            return list(s)
+        s = x.structure
     except Exception:
-        pass
-    return []
+        return ()
+    if isinstance(s, tuple):
+        return s
+    return ()
+
+
+# One walk yields everything omega_run_to_json needs from a motif:
+# (JSON object, nodes, depth). Keyed by subtree id in a memo, so each
+# distinct subtree object is visited once per memo.
+_Measure = Tuple[Dict[str, Any], int, int]
+
 
+def _measure(x: Any, memo: Dict[int, _Measure]) -> _Measure:
+    """
+    Encode and measure x in a single iterative post-order walk.
+
+    - JSON object: as motif_to_json_obj (shared for repeated subtrees)
+    - nodes: number of Motif nodes in the tree (leaf motif counts as 1)
+    - depth: max depth (leaf motif depth = 1)
 
-def _count_nodes_depth(x: Any) -> Dict[str, int]:
+    The caller must keep the measured motifs alive while memo is in use.
+    """
+    # Atoms by identity, as in motif_to_json_obj: entered up front, so the
+    # memo check every node does finds them (UNIT = μ(VOID) is 2 deep)
+    if id(VOID) not in memo:
+        memo[id(VOID)] = ({"atom": "VOID"}, 1, 1)
+        memo[id(UNIT)] = ({"atom": "UNIT"}, 2, 2)
+    stack = [(x, False)]
+    while stack:
+        m, ready = stack.pop()
+        if id(m) in memo:
+            continue
+        kids = _children(m)
+        if kids and not ready:
+            stack.append((m, True))
+            for k in reversed(kids):
+                if id(k) not in memo:
+                    stack.append((k, False))
+            continue
+
+        kid_measures = [memo[id(k)] for k in kids]
+        if kid_measures:
+            nodes = 1 + sum(km[1] for km in kid_measures)
+            depth = 1 + max(km[2] for km in kid_measures)
+        else:
+            nodes, depth = 1, 1
+        memo[id(m)] = ({"μ": [km[0] for km in kid_measures]}, nodes, depth)
+    return memo[id(x)]
+
+
+# (nodes, depth) per motif, shared across runs. Keys are weak, so entries
+# go away with their motifs. Motif equality and hashing are structural, and
+# so are these metrics: structurally equal motifs share an entry.
+_STATS_CACHE: "weakref.WeakKeyDictionary[Motif, Tuple[int, int]]" = weakref.WeakKeyDictionary()
+
+
+def _count_nodes_depth(
+    x: Any, local: Optional[Dict[int, Tuple[int, int]]] = None
+) -> Tuple[int, int]:
     """
-    Local motif metrics to avoid depending on a moving module name.
+    Local motif metrics to avoid depending on a moving module name,
+    as a (nodes, depth) tuple:
 
     nodes: number of Motif nodes in the tree (leaf motif counts as 1)
     depth: max depth (leaf motif depth = 1)
+
+    Bottom-up with an explicit stack: a subtree found in _STATS_CACHE is
+    not walked, and every subtree measured is added to it.
+
+    local (id -> stats) is this call's memo; pass one dict to several
+    calls (e.g. over an orbit) to find shared subtree objects by id before
+    any structural-hash lookup. The caller must keep those motifs alive.
     """
-    kids = _children(x)
-    if not kids:
-        return {"nodes": 1, "depth": 1}
-    child_stats = [_count_nodes_depth(k) for k in kids]
-    nodes = 1 + sum(cs["nodes"] for cs in child_stats)
-    depth = 1 + max(cs["depth"] for cs in child_stats)
-    return {"nodes": nodes, "depth": depth}
+    if local is None:
+        local = {}
+    stack = [(x, False)]
+    # Hot names bound to locals, as in run_omega
+    _pop = stack.pop
+    _push = stack.append
+    _cache_get = _STATS_CACHE.get
+    _kids = _children
+    while stack:
+        m, ready = _pop()
+        if id(m) in local:
+            continue
+        cacheable = isinstance(m, Motif)
+        if cacheable and not ready:
+            try:
+                hit = _cache_get(m)
+            except TypeError:  # unhashable non-Motif leaf in the structure
+                cacheable = False
+                hit = None
+            if hit is not None:
+                local[id(m)] = hit
+                continue
+        kids = _kids(m)
+        if kids and not ready:
+            _push((m, True))
+            for k in kids:
+                if id(k) not in local:
+                    _push((k, False))
+            continue
+
+        if kids:
+            stats = (
+                1 + sum(local[id(k)][0] for k in kids),
+                1 + max(local[id(k)][1] for k in kids),
+            )
+        else:
+            stats = (1, 1)
+        local[id(m)] = stats
+        if cacheable:
+            try:
+                _STATS_CACHE[m] = stats
+            except TypeError:
+                pass
+    return local[id(x)]
+
+
+# Cycle detection keys states by their JSON encoding (VOID/UNIT atoms by
+# identity, μ nodes by children), without building it: a structural hash
+# is computed bottom-up per subtree, and only states whose hashes match
+# are compared node by node.
+_HASH_VOID = hash(("atom", "VOID"))
+_HASH_UNIT = hash(("atom", "UNIT"))
+_HASH_LEAF = hash(())  # any other childless node: {"μ": []}
+
+
+def _struct_hash(x: Any, memo: Dict[int, int]) -> int:
+    """
+    Structural hash of x's JSON encoding, iterative post-order.
 
+    memo (id -> hash) hashes each distinct subtree object once; the caller
+    must keep the hashed motifs alive while it is in use.
+    """
+    # Atoms entered up front: found by the per-node memo check
+    if id(VOID) not in memo:
+        memo[id(VOID)] = _HASH_VOID
+        memo[id(UNIT)] = _HASH_UNIT
+    # Fast paths before any stack: a state already hashed (revisits, atoms)
+    # is one lookup, and a leaf μ() has the one empty-children hash
+    h = memo.get(id(x))
+    if h is not None:
+        return h
+    if not _children(x):
+        memo[id(x)] = _HASH_LEAF
+        return _HASH_LEAF
+    stack = [(x, False)]
+    while stack:
+        m, ready = stack.pop()
+        if id(m) in memo:
+            continue
+        kids = _children(m)
+        if not kids:
+            memo[id(m)] = _HASH_LEAF
+            continue
+        if not ready:
+            stack.append((m, True))
+            for k in kids:
+                if id(k) not in memo:
+                    stack.append((k, False))
+            continue
+        memo[id(m)] = hash(tuple([memo[id(k)] for k in kids]))
+    return memo[id(x)]
+
+
+def _same_encoding(a: Any, b: Any) -> bool:
+    """True if a and b have the same JSON encoding (iterative)."""
+    stack = [(a, b)]
+    while stack:
+        p, q = stack.pop()
+        if p is q:
+            continue
+        # Distinct objects: an atom only matches itself
+        if p is VOID or p is UNIT or q is VOID or q is UNIT:
+            return False
+        kp = _children(p)
+        kq = _children(q)
+        if len(kp) != len(kq):
+            return False
+        stack.extend(zip(kp, kq))
+    return True
+
+
+def _earlier_same(
+    orbit: List[OmegaOrbitStep], first: int, more: Optional[List[int]], y: Any
+) -> Optional[int]:
+    """
+    Index of the earlier state with the same encoding as y, if any.
 
-def _key(x: Any) -> str:
-    # Canonical key for cycle detection: stable JSON-ish identity.
-    return str(motif_to_json_obj(x, include_meta=False))
+    first is the first index seen with y's hash; more lists later indices
+    whose states share that hash but not first's encoding (collisions).
+    """
+    if _same_encoding(orbit[first].value, y):
+        return first
+    if more is not None:
+        for j in more:
+            if _same_encoding(orbit[j].value, y):
+                return j
+    return None
 
 
 def run_omega(seed: Any, *, max_steps: int = 64) -> OmegaRun:
@@ -78,17 +260,46 @@ def run_omega(seed: Any, *, max_steps: int = 64) -> OmegaRun:
     ev = new_evaluator()
 
     orbit: List[OmegaOrbitStep] = [OmegaOrbitStep(0, seed)]
-    seen: Dict[str, int] = {_key(seed): 0}
+    # orbit keeps every hashed state alive, so hashes can be memoized by id
+    hashes: Dict[int, int] = {}
+    # Plain int keys: first orbit index per structural hash, confirmed by
+    # _same_encoding on a hit. Indices of states that only collide with an
+    # earlier hash go in clashes (rare), so no repeat is ever missed.
+    # Filled lazily: the seed is hashed on the first step that moves.
+    seen: Dict[int, int] = {}
+    clashes: Dict[int, List[int]] = {}
+
+    # Hot names bound to locals: one fast local load per use in the loop
+    # instead of a module-global or attribute lookup
+    _reduce = ev.reduce
+    _record = orbit.append
+    _Step = OmegaOrbitStep
+    _hash = _struct_hash
+    _seen_get = seen.get
 
     x = seed
     for i in range(1, max_steps + 1):
-        y = ev.reduce(x)
-
-        orbit.append(OmegaOrbitStep(i, y))
-        ky = _key(y)
+        y = _reduce(x)
+
+        _record(_Step(i, y))
+        mu = None
+        if y is x:
+            # reduce hands data motifs back as is: the previous state (new,
+            # or the loop would have stopped) repeats, no hashing needed
+            mu = i - 1
+        else:
+            if not seen:
+                seen[_hash(seed, hashes)] = 0
+            h = _hash(y, hashes)
+            first = _seen_get(h)
+            if first is None:
+                seen[h] = i
+            else:
+                mu = _earlier_same(orbit, first, clashes.get(h), y)
+                if mu is None:
+                    clashes.setdefault(h, []).append(i)
 
-        if ky in seen:
-            mu = seen[ky]
+        if mu is not None:
             period = i - mu
             classification = (
                 "fixed_point" if (period == 1 and mu == i - 1) else "limit_cycle"
@@ -102,7 +313,6 @@ def run_omega(seed: Any, *, max_steps: int = 64) -> OmegaRun:
                 mu=mu,
             )
 
-        seen[ky] = i
         x = y
 
     return OmegaRun(
@@ -116,7 +326,11 @@ def run_omega(seed: Any, *, max_steps: int = 64) -> OmegaRun:
 
 
 def omega_run_to_json(
-    run: OmegaRun, *, include_meta: bool = False, include_steps: bool = False
+    run: OmegaRun,
+    *,
+    include_meta: bool = False,
+    include_steps: bool = False,
+    include_motifs: bool = True,
 ) -> Dict[str, Any]:
     """
     JSON object suitable for piping into analyze_cli.
@@ -124,25 +338,54 @@ def omega_run_to_json(
     - Always emits omega payload with classification + orbit metrics.
     - If include_steps=True, also emits trace-shaped "steps" with deltas, and
       includes "input"/"result" aliases for easier interop with trace/analyze tools.
+    - If include_motifs=False, the motif fields ("seed", "result", "input")
+      are left out; omega_run_motifs(run) gives them, for emit_payload.
     """
-    seed_obj = motif_to_json_obj(run.seed, include_meta=include_meta)
-    result_obj = motif_to_json_obj(run.result, include_meta=include_meta)
-
-    seed_stats = _count_nodes_depth(run.seed)
-    result_stats = _count_nodes_depth(run.result)
-
+    # run holds every motif below, so an id-keyed memo is safe for this call;
+    # orbit states share subtrees, which are then encoded and measured once
+    # (include_meta is currently ignored, as in motif_to_json_obj)
+    memo: Dict[int, _Measure] = {}
+    # Likewise for metrics alone: one id memo across seed, result and orbit,
+    # kept on the run so a second call does not walk the states again
+    sizes = run.sizes
+
+    if include_motifs:
+        seed_obj, seed_nodes, seed_depth = _measure(run.seed, memo)
+        result_obj, result_nodes, result_depth = _measure(run.result, memo)
+    else:
+        seed_nodes, seed_depth = _count_nodes_depth(run.seed, sizes)
+        result_nodes, result_depth = _count_nodes_depth(run.result, sizes)
+
+    # One pass over the orbit (states only need metrics, not their JSON):
+    # each state's metrics go straight into its orbit row and, for
+    # include_steps, its trace-shaped step row expected by analyze_cli, with
+    # deltas against the previous state (0 for the first, whose metrics
+    # seed prev). No intermediate columns.
     orbit_rows: List[Dict[str, int]] = []
-    for s in run.orbit:
-        m = _count_nodes_depth(s.value)
-        orbit_rows.append({"i": s.i, "nodes": m["nodes"], "depth": m["depth"]})
+    steps: List[Dict[str, int]] = []
+    prev_nodes, prev_depth = (
+        _count_nodes_depth(run.orbit[0].value, sizes) if run.orbit else (0, 0)
+    )
+    for i, value in run.orbit:
+        nodes, depth = _count_nodes_depth(value, sizes)
+        orbit_rows.append({"i": i, "nodes": nodes, "depth": depth})
+        if include_steps:
+            steps.append(
+                {
+                    "i": i,
+                    "nodes": nodes,
+                    "depth": depth,
+                    "delta_nodes": nodes - prev_nodes,
+                    "delta_depth": depth - prev_depth,
+                }
+            )
+        prev_nodes, prev_depth = nodes, depth
 
     payload: Dict[str, Any] = {
         "kind": "omega",
-        "seed": seed_obj,
-        "result": result_obj,
         "stats": {
-            "seed": {"nodes": seed_stats["nodes"], "depth": seed_stats["depth"]},
-            "result": {"nodes": result_stats["nodes"], "depth": result_stats["depth"]},
+            "seed": {"nodes": seed_nodes, "depth": seed_depth},
+            "result": {"nodes": result_nodes, "depth": result_depth},
         },
         "classification": {
             "type": run.classification,
@@ -152,35 +395,22 @@ def omega_run_to_json(
         },
         "orbit": orbit_rows,
     }
+    if include_motifs:
+        payload["seed"] = seed_obj
+        payload["result"] = result_obj
 
     if include_steps:
-        # Trace-shaped steps[] expected by analyze_cli: include deltas.
-        steps: List[Dict[str, int]] = []
-        prev_nodes: Optional[int] = None
-        prev_depth: Optional[int] = None
-        for row in orbit_rows:
-            nodes = int(row["nodes"])
-            depth = int(row["depth"])
-            if prev_nodes is None:
-                delta_nodes = 0
-                delta_depth = 0
-            else:
-                delta_nodes = nodes - prev_nodes
-                delta_depth = depth - prev_depth  # type: ignore[operator]
-            steps.append(
-                {
-                    "i": int(row["i"]),
-                    "nodes": nodes,
-                    "depth": depth,
-                    "delta_nodes": int(delta_nodes),
-                    "delta_depth": int(delta_depth),
-                }
-            )
-            prev_nodes = nodes
-            prev_depth = depth
-
         # Compatibility aliases: trace_cli uses input/result; keep omega seed/result too.
-        payload["input"] = seed_obj
+        if include_motifs:
+            payload["input"] = seed_obj
         payload["steps"] = steps
 
     return payload
+
+
+def omega_run_motifs(run: OmegaRun, *, include_steps: bool = False) -> Dict[str, Any]:
+    """The motif fields omega_run_to_json(run, include_motifs=False) leaves out."""
+    motifs = {"seed": run.seed, "result": run.result}
+    if include_steps:
+        motifs["input"] = run.seed
+    return motifs
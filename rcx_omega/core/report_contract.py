@@ -4,7 +4,7 @@ Report contract utilities.
 We have two JSON "shapes" emitted by CLI tools:
 
 1) trace_cli payload ("trace"):
-   - has "steps": list[...]
+   - has "steps": list[...] (or, with --columns, {"i": [...], "nodes": [...], ...})
    - usually also includes input/result motif-shaped JSON and stats
 
 2) omega_cli payload ("omega"):
@@ -25,10 +25,27 @@ class ReportKind:
     kind: str  # "trace" | "omega" | "unknown"
 
 
-def detect_kind(payload: Dict[str, Any]) -> ReportKind:
-    # Trace payloads are stepful and must include steps as a list
-    steps = payload.get("steps", None)
+def _step_count(steps: Any) -> Optional[int]:
+    # Rows: list of step dicts. Columns: dict of equal-length lists keyed by field.
     if isinstance(steps, list):
+        return len(steps)
+    if isinstance(steps, dict) and isinstance(steps.get("i", None), list):
+        return len(steps["i"])
+    return None
+
+
+_TAGGED_KINDS = ("trace", "omega")
+
+
+def detect_kind(payload: Dict[str, Any]) -> ReportKind:
+    # Producers tag their payloads; one lookup settles the common case
+    k = payload.get("kind", None)
+    if k in _TAGGED_KINDS:
+        return ReportKind(k)
+
+    # Legacy untagged payloads: infer from shape
+    # Trace payloads are stepful and must include steps as a list (or columns)
+    if _step_count(payload.get("steps", None)) is not None:
         return ReportKind("trace")
 
     # Omega payloads are summary-shaped; typically include "classification"
@@ -57,8 +74,9 @@ def extract_summary(payload: Dict[str, Any]) -> Dict[str, Any]:
         out["classification"] = payload["classification"]
 
     # Trace: include step count
-    if isinstance(payload.get("steps", None), list):
-        out["steps"] = len(payload["steps"])
+    n_steps = _step_count(payload.get("steps", None))
+    if n_steps is not None:
+        out["steps"] = n_steps
 
     # Echo input/result if they exist (motif-shaped or strings)
     if "input" in payload:
@@ -7,34 +7,56 @@ No mutation, no evaluation, no semantics.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Tuple
+from typing import Dict, List, NamedTuple, Optional, Tuple
 
 from rcx_pi.core.motif import Motif
 
 
-@dataclass(frozen=True)
-class MotifStats:
+class MotifStats(NamedTuple):
+    # Built per motif analyzed (per trace step in the lens): a plain tuple
     nodes: int
     depth: int
 
 
-def analyze_motif(x: Motif) -> MotifStats:
+def analyze_motif(
+    x: Motif, cache: Optional[Dict[int, Tuple[int, int]]] = None
+) -> MotifStats:
     """
     Compute basic structural metrics for a Motif:
     - total node count
     - maximum depth
-    """
-
-    def walk(m: Motif) -> Tuple[int, int]:
-        # children live in m.structure (tuple)
-        if not m.structure:
-            return 1, 1
 
-        child_stats = [walk(c) for c in m.structure]
-        nodes = 1 + sum(n for n, _ in child_stats)
-        depth = 1 + max(d for _, d in child_stats)
-        return nodes, depth
+    Iterative post-order in one frame: each stack entry is
+    (motif, next child index, nodes so far, max child depth so far). A
+    finished motif folds (1 + nodes, 1 + depth) into the entry below it,
+    so deep motifs do not recurse.
 
-    n, d = walk(x)
-    return MotifStats(nodes=n, depth=d)
+    cache (id -> (nodes, depth)) may be shared across calls, e.g. over the
+    steps of one trace: subtrees already in it are not walked again. The
+    caller must keep the analyzed motifs alive while it is in use.
+    """
+    if cache is None:
+        cache = {}
+    hit = cache.get(id(x))
+    if hit is not None:
+        return MotifStats(nodes=hit[0], depth=hit[1])
+    # children live in m.structure (tuple)
+    stack: List[Tuple[Motif, int, int, int]] = [(x, 0, 0, 0)]
+    while True:
+        m, idx, n, d = stack[-1]
+        kids = m.structure
+        if idx < len(kids):
+            stack[-1] = (m, idx + 1, n, d)
+            hit = cache.get(id(kids[idx]))
+            if hit is None:
+                stack.append((kids[idx], 0, 0, 0))
+            else:
+                stack[-1] = (m, idx + 1, n + hit[0], hit[1] if hit[1] > d else d)
+            continue
+        stack.pop()
+        n, d = 1 + n, 1 + d
+        cache[id(m)] = (n, d)
+        if not stack:
+            return MotifStats(nodes=n, depth=d)
+        pm, pidx, pn, pd = stack[-1]
+        stack[-1] = (pm, pidx, pn + n, d if d > pd else pd)
@@ -12,7 +12,7 @@ A "lens" is a deterministic read-only wrapper that combines:
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Dict, List, NamedTuple, Tuple
 
 from rcx_pi.engine.evaluator_pure import PureEvaluator
 from rcx_pi.core.motif import Motif
@@ -21,8 +21,8 @@ from rcx_omega.engine.trace import TraceResult, trace_reduce
 from rcx_omega.engine.analyze import MotifStats, analyze_motif
 
 
-@dataclass(frozen=True)
-class StepDelta:
+class StepDelta(NamedTuple):
+    # One per trace step: a tuple is cheaper to build than a frozen dataclass
     i: int
     nodes: int
     depth: int
@@ -51,40 +51,28 @@ def trace_reduce_with_stats(
 ) -> LensResult:
     tr = trace_reduce(ev, x, max_steps=max_steps)
 
-    # analyze all steps
-    step_stats: List[MotifStats] = [analyze_motif(s.value) for s in tr.steps]
+    # tr and x keep every step alive, so one id-keyed cache serves the whole
+    # trace: subtrees shared between steps (and with the input/result) are
+    # walked once.
+    sizes: Dict[int, Tuple[int, int]] = {}
 
+    # One pass: analyze each step and record its delta against the previous
+    # step. prev starts as the first step's stats (a cache hit in the loop),
+    # so the first delta is 0 with no per-step branch.
     deltas: List[StepDelta] = []
-    prev: Optional[MotifStats] = None
-
-    for i, st in enumerate(step_stats):
-        if prev is None:
-            deltas.append(
-                StepDelta(
-                    i=i,
-                    nodes=st.nodes,
-                    depth=st.depth,
-                    delta_nodes=0,
-                    delta_depth=0,
-                )
-            )
-        else:
-            deltas.append(
-                StepDelta(
-                    i=i,
-                    nodes=st.nodes,
-                    depth=st.depth,
-                    delta_nodes=st.nodes - prev.nodes,
-                    delta_depth=st.depth - prev.depth,
-                )
-            )
+    prev = analyze_motif(tr.steps[0].value, sizes) if tr.steps else MotifStats(0, 0)
+    for i, s in enumerate(tr.steps):
+        st = analyze_motif(s.value, sizes)
+        deltas.append(
+            StepDelta(i, st.nodes, st.depth, st.nodes - prev.nodes, st.depth - prev.depth)
+        )
         prev = st
 
     return LensResult(
         trace=tr,
         stats=TraceStats(
-            input_stats=analyze_motif(x),
-            result_stats=analyze_motif(tr.result),
+            input_stats=analyze_motif(x, sizes),
+            result_stats=analyze_motif(tr.result, sizes),
             deltas=deltas,
         ),
     )
@@ -14,21 +14,39 @@ Fields are OPTIONAL by policy. Consumers must not require them.
 from __future__ import annotations
 
 import os
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 ENV_ENABLE = "RCX_OMEGA_ADD_SCHEMA_FIELDS"
 ENV_VERSION = "RCX_OMEGA_SCHEMA_VERSION"
 DEFAULT_SCHEMA_VERSION = "1.0.0"
 
 
+# Resolved on first use, then reused for every payload of the process;
+# _reset_cache() makes the next call read the environment again (tests).
+_ENABLED: Optional[bool] = None
+_VERSION: Optional[str] = None
+
+
+def _reset_cache() -> None:
+    global _ENABLED, _VERSION
+    _ENABLED = None
+    _VERSION = None
+
+
 def _enabled() -> bool:
-    v = os.getenv(ENV_ENABLE, "").strip().lower()
-    return v in {"1", "true", "yes", "on"}
+    global _ENABLED
+    if _ENABLED is None:
+        v = os.getenv(ENV_ENABLE, "").strip().lower()
+        _ENABLED = v in {"1", "true", "yes", "on"}
+    return _ENABLED
 
 
 def _schema_version() -> str:
-    v = os.getenv(ENV_VERSION, "").strip()
-    return v or DEFAULT_SCHEMA_VERSION
+    global _VERSION
+    if _VERSION is None:
+        v = os.getenv(ENV_VERSION, "").strip()
+        _VERSION = v or DEFAULT_SCHEMA_VERSION
+    return _VERSION
 
 
 def maybe_add_schema_fields(payload: Any, *, kind: str) -> Any:
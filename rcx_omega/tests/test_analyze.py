@@ -1,5 +1,6 @@
 from rcx_pi import new_evaluator, VOID
-from rcx_omega.engine.trace import trace_reduce
+from rcx_pi.core.motif import Motif, μ
+from rcx_omega.engine.trace import TraceResult, TraceStep, trace_reduce
 from rcx_omega.analyze import analyze_trace
 
 
@@ -9,3 +10,56 @@ def test_analyze_fixedpoint_void():
     an = analyze_trace(tr)
     assert an.kind == "fixedpoint"
     assert an.period is None
+
+
+class _CountingMotif(Motif):
+    renders = 0
+
+    def __repr__(self):
+        type(self).renders += 1
+        return super().__repr__()
+
+
+def test_analyze_cycle_keys_steps_without_rendering():
+    a = _CountingMotif(VOID)
+    b = _CountingMotif(VOID, VOID)
+    steps = [TraceStep(i=i, value=v) for i, v in enumerate([a, b, a, b, a])]
+    tr = TraceResult(result=a, steps=steps, converged=False, maxed=True)
+
+    an = analyze_trace(tr)
+
+    assert an.kind == "cycle"
+    assert an.period == 2
+    assert an.cycle_start == 0
+    assert _CountingMotif.renders == 0
+
+
+def test_analyze_cycle_on_deep_steps():
+    deep = VOID
+    for _ in range(5000):
+        deep = μ(deep)
+    a, b = μ(deep), μ(deep, deep)
+    steps = [TraceStep(i=i, value=v) for i, v in enumerate([a, b, μ(deep)])]
+    tr = TraceResult(result=a, steps=steps, converged=False, maxed=True)
+
+    an = analyze_trace(tr)
+
+    assert (an.kind, an.period, an.cycle_start) == ("cycle", 2, 0)
+
+
+def test_analyze_cycle_reports_first_repeat():
+    a, b, c = μ(VOID), μ(VOID, VOID), μ(μ(VOID))
+    values = [VOID, a, b, c, b, c, b]
+    steps = [TraceStep(i=i, value=v) for i, v in enumerate(values)]
+    tr = TraceResult(result=b, steps=steps, converged=False, maxed=True)
+
+    an = analyze_trace(tr)
+
+    assert (an.kind, an.period, an.cycle_start) == ("cycle", 2, 2)
+
+
+def test_analyze_maxed_without_repeat():
+    steps = [TraceStep(i=0, value=VOID), TraceStep(i=1, value=μ(VOID))]
+    tr = TraceResult(result=μ(VOID), steps=steps, converged=False, maxed=True)
+
+    assert analyze_trace(tr).kind == "maxed"
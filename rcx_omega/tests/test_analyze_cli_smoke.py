@@ -20,3 +20,93 @@ def test_analyze_cli_pipe_smoke():
     )
     assert "== Ω analyze ==" in p.stdout
     assert "converged:" in p.stdout
+
+
+def test_analyze_cli_stream_matches_json_loads():
+    import io
+
+    import pytest
+
+    pytest.importorskip("ijson")
+    from rcx_omega.cli.analyze_cli import _load_json_stream
+
+    payload = {
+        "kind": "trace",
+        "input": {"k": [1, 2.5, None, True]},
+        "result": {"k": []},
+        "stats": {"input": {"nodes": 4, "depth": 3}},
+        "steps": [{"i": 0, "delta_nodes": 1}, 7, [], {"i": 3, "delta_nodes": 0, "delta_depth": 0}],
+    }
+    got = _load_json_stream(io.BytesIO(json.dumps(payload).encode("utf-8")))
+
+    assert len(got["steps"]) == len(payload["steps"])
+    assert got["steps"][-1] == payload["steps"][-1]
+    got["steps"] = payload["steps"]
+    assert got == payload
+
+    with pytest.raises(SystemExit):
+        _load_json_stream(io.BytesIO(b"[1, 2]"))
+    with pytest.raises(SystemExit):
+        _load_json_stream(io.BytesIO(b'{"steps": ['))
+
+
+def test_analyze_cli_accepts_column_steps():
+    rows = [
+        {"i": 0, "nodes": 3, "depth": 2, "delta_nodes": 0, "delta_depth": 0},
+        {"i": 1, "nodes": 2, "depth": 2, "delta_nodes": -1, "delta_depth": 0},
+    ]
+    columns = {name: [r[name] for r in rows] for name in rows[0]}
+    outputs = []
+    for steps in (rows, columns):
+        payload = {"input": {"μ": [{"μ": []}]}, "result": {"μ": []}, "steps": steps}
+        p = subprocess.run(
+            [sys.executable, "-m", "rcx_omega.cli.analyze_cli"],
+            input=json.dumps(payload),
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        outputs.append(p.stdout)
+
+    assert outputs[0] == outputs[1]
+    assert "analyze: trace" in outputs[1]
+    assert "steps: 2" in outputs[1]
+    assert "converged: false" in outputs[1]
+
+
+def test_trace_cli_columns_match_rows():
+    def run(*extra):
+        p = subprocess.run(
+            [sys.executable, "-m", "rcx_omega.cli.trace_cli", "--json", *extra, "μ(μ(), μ(μ()))"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return json.loads(p.stdout)
+
+    rows = run()["steps"]
+    columns = run("--columns")["steps"]
+    assert set(columns) == set(rows[0])
+    for name, col in columns.items():
+        assert col == [r[name] for r in rows]
+
+
+def test_analyze_cli_stream_skips_omega_bulk():
+    import io
+
+    import pytest
+
+    pytest.importorskip("ijson")
+    from rcx_omega.cli.analyze_cli import _load_json_stream
+
+    payload = {
+        "classification": {"type": "fixed_point", "period": 1, "max_steps": 1},
+        "kind": "omega",
+        "orbit": [{"i": i, "nodes": 1, "depth": 1} for i in range(1000)],
+        "result": {"μ": []},
+        "stats": {"seed": {"nodes": 1, "depth": 1}},
+    }
+    raw = json.dumps(payload, sort_keys=True).encode("utf-8")
+    got = _load_json_stream(io.BytesIO(raw))
+
+    assert got == {k: payload[k] for k in ("classification", "kind", "stats")}
@@ -13,3 +13,24 @@ def test_analyze_nested_mu():
     stats = analyze_motif(x)
     assert stats.nodes == 2
     assert stats.depth == 2
+
+
+def test_analyze_motif_deep_and_wide():
+    from rcx_pi import UNIT
+
+    x = μ(UNIT, μ(), VOID)
+    for _ in range(3000):
+        x = μ(x, VOID)
+    stats = analyze_motif(x)
+    assert (stats.nodes, stats.depth) == (5 + 3000 * 2, 3 + 3000)
+
+
+def test_analyze_motif_cache_is_shared_by_id():
+    shared = μ(μ(VOID), VOID)
+    cache = {}
+    analyze_motif(μ(shared), cache)
+    assert cache[id(shared)] == (4, 3)
+    # a cached subtree is folded in without being walked again
+    cache[id(shared)] = (40, 30)
+    stats = analyze_motif(μ(shared, VOID), cache)
+    assert (stats.nodes, stats.depth) == (42, 31)
@@ -43,3 +43,120 @@ def test_contract_omega_to_analyze_has_header_and_summary():
     assert "analyze: summary" in analyzed.stdout
     # stable summary line (either classification or at minimum "classification:" line)
     assert "classification:" in analyzed.stdout
+
+
+def test_contract_dumps_payload_matches_json_dumps():
+    from rcx_omega.cli._emit import dumps_payload
+
+    payloads = [
+        {"μ": [{"μ": []}], "stats": {"nodes": 2, "depth": 2}, "steps": []},
+        {"text": "ascii \"quoted\"\n\t", "astral": "\U0001d707", "empty": {}},
+        {"wide": 2**70, "flags": [True, False, None]},
+        [1, {"b": 1, "a": 2}],
+    ]
+    for payload in payloads:
+        assert dumps_payload(payload) == json.dumps(payload, indent=2, sort_keys=True)
+
+
+def test_contract_write_motif_json_matches_dumps_of_codec_object():
+    from rcx_pi import μ, VOID, UNIT
+    from rcx_omega.core.motif_codec import motif_to_json_obj
+    from rcx_omega.cli._emit import write_motif_json
+
+    shared = μ(μ(), UNIT)
+    chain = VOID
+    spine = μ(UNIT, μ(), VOID)
+    # deep, but shallow enough for json.dumps' recursive encoder
+    for _ in range(150):
+        chain = μ(chain)
+        spine = μ(spine, VOID)
+    motifs = [
+        VOID, UNIT, μ(), μ(μ()), μ(VOID), μ(VOID, UNIT), μ(μ(), VOID, UNIT, μ(μ())),
+        μ(shared, μ(shared, VOID), μ()), chain, spine,
+    ]
+    for x in motifs:
+        for level in (0, 1, 3):
+            parts = []
+            write_motif_json(x, parts.append, level=level)
+            expected = json.dumps(motif_to_json_obj(x), indent=2)
+            assert "".join(parts) == expected.replace("\n", "\n" + "  " * level)
+
+
+def _set_schema_fields_env(monkeypatch, value):
+    from rcx_omega import json_versioning
+
+    monkeypatch.setenv("RCX_OMEGA_ADD_SCHEMA_FIELDS", value)
+    # The env is read once per process; re-read it now and drop the value
+    # read here when the test ends
+    monkeypatch.setattr(json_versioning, "_ENABLED", None)
+    monkeypatch.setattr(json_versioning, "_VERSION", None)
+
+
+def test_contract_emit_payload_matches_print(monkeypatch):
+    import io
+
+    from rcx_omega.cli._emit import emit_payload
+
+    payload = {"μ": [], "steps": [{"i": 0}]}
+    for enabled in ("", "1"):
+        _set_schema_fields_env(monkeypatch, enabled)
+        buf = io.StringIO()
+        emit_payload(payload, kind="trace", stream=buf)
+        expected = dict(payload, kind="trace", schema_version="1.0.0") if enabled else payload
+        assert buf.getvalue() == json.dumps(expected, indent=2, sort_keys=True) + "\n"
+
+
+def test_contract_emit_payload_writes_motif_fields(monkeypatch):
+    import io
+
+    from rcx_pi import μ, VOID
+    from rcx_omega.core.motif_codec import motif_to_json_obj
+    from rcx_omega.cli._emit import emit_payload
+
+    x = μ(μ(), VOID)
+    deep = VOID
+    for _ in range(3000):
+        deep = μ(deep)
+    payload = {"stats": {"nodes": 3}, "steps": [{"i": 0}]}
+    for enabled in ("", "1"):
+        _set_schema_fields_env(monkeypatch, enabled)
+        buf = io.StringIO()
+        emit_payload(payload, kind="trace", stream=buf, motifs={"input": x, "result": x})
+        expected = dict(payload, input=motif_to_json_obj(x), result=motif_to_json_obj(x))
+        if enabled:
+            expected.update(kind="trace", schema_version="1.0.0")
+        assert buf.getvalue() == json.dumps(expected, indent=2, sort_keys=True) + "\n"
+
+    # deep motifs are written without recursion
+    buf = io.StringIO()
+    emit_payload(payload, kind="trace", stream=buf, motifs={"input": deep})
+    assert buf.getvalue().count('"\\u03bc"') == 3000
+
+
+def test_contract_emit_payload_writes_bytes_to_binary_buffer():
+    import io
+
+    from rcx_omega.cli._emit import dumps_payload, dumps_payload_bytes, emit_payload
+
+    payload = {"μ": [], "astral": "\U0001d707", "steps": [{"i": 0}]}
+    assert dumps_payload_bytes(payload) == dumps_payload(payload).encode("ascii")
+
+    raw = io.BytesIO()
+    stream = io.TextIOWrapper(raw, encoding="utf-8")
+    stream.write("before\n")
+    emit_payload(payload, kind="omega", stream=stream)
+    stream.write("after\n")
+    stream.flush()
+    expected = "before\n" + json.dumps(payload, indent=2, sort_keys=True) + "\nafter\n"
+    assert raw.getvalue() == expected.encode("ascii")
+
+
+def test_contract_schema_env_is_read_once_until_reset(monkeypatch):
+    from rcx_omega import json_versioning
+
+    _set_schema_fields_env(monkeypatch, "1")
+    assert "kind" in json_versioning.maybe_add_schema_fields({}, kind="omega")
+    monkeypatch.setenv("RCX_OMEGA_ADD_SCHEMA_FIELDS", "")
+    assert "kind" in json_versioning.maybe_add_schema_fields({}, kind="omega")
+    json_versioning._reset_cache()
+    assert json_versioning.maybe_add_schema_fields({}, kind="omega") == {}
@@ -17,3 +17,17 @@ def test_lens_deltas_nested_mu():
     ds = lr.stats.deltas
     assert ds[0].nodes == 2
     assert ds[0].depth == 2
+
+
+class _GrowingEvaluator:
+    def reduce(self, x):
+        return μ(x, VOID)
+
+
+def test_lens_deltas_follow_previous_step():
+    lr = trace_reduce_with_stats(_GrowingEvaluator(), VOID, max_steps=4)
+    ds = lr.stats.deltas
+    assert [d.i for d in ds] == list(range(len(lr.trace.steps)))
+    assert [(d.nodes, d.depth) for d in ds[:4]] == [(1, 1), (3, 2), (5, 3), (7, 4)]
+    assert {(d.delta_nodes, d.delta_depth) for d in ds[1:]} == {(2, 1)}
+    assert (ds[0].delta_nodes, ds[0].delta_depth) == (0, 0)
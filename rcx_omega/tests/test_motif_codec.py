@@ -16,3 +16,54 @@ def test_codec_nested_mu_shape():
     assert isinstance(obj["μ"], list)
     assert len(obj["μ"]) == 1
     assert isinstance(obj["μ"][0], dict)
+
+
+def test_codec_round_trip_deep_and_wide():
+    from rcx_omega.utils.motif_codec import json_obj_to_motif
+
+    x = μ(UNIT, μ(), VOID)
+    for _ in range(3000):
+        x = μ(x, VOID)
+    obj = motif_to_json_obj(x)
+    inner = obj
+    for _ in range(3000):
+        assert inner["μ"][1] == {"atom": "VOID"}
+        inner = inner["μ"][0]
+    assert inner == {"μ": [{"atom": "UNIT"}, {"μ": []}, {"atom": "VOID"}]}
+    assert json_obj_to_motif(obj) == x
+
+
+def test_codec_shares_repeated_subtrees():
+    shared = μ(μ(), UNIT)
+    x = μ(shared, μ(shared))
+    memo = {}
+    obj = motif_to_json_obj(x, memo=memo)
+    assert obj["μ"][0] is obj["μ"][1]["μ"][0]
+    assert obj["μ"][0] == {"μ": [{"μ": []}, {"atom": "UNIT"}]}
+    assert motif_to_json_obj(shared, memo=memo) is obj["μ"][0]
+
+
+def test_codec_atoms_only_for_the_singletons():
+    memo = {}
+    obj = motif_to_json_obj(μ(VOID, μ(), UNIT, μ(μ())), memo=memo)
+    assert obj["μ"] == [
+        {"atom": "VOID"},
+        {"μ": []},
+        {"atom": "UNIT"},
+        {"μ": [{"μ": []}]},
+    ]
+    assert motif_to_json_obj(UNIT, memo=memo) is obj["μ"][2]
+
+
+def test_codec_encoding_survives_interning():
+    from rcx_pi import num
+    from rcx_pi.core import intern_motif
+    from rcx_omega.utils.motif_codec import json_obj_to_motif
+
+    shared = μ(μ(), UNIT)
+    for x in (VOID, UNIT, μ(), μ(μ()), μ(VOID), num(3), μ(μ(), UNIT),
+              μ(shared, μ(shared, VOID), μ(μ(VOID)))):
+        obj = motif_to_json_obj(x)
+        assert motif_to_json_obj(intern_motif(x)) == obj
+        back = json_obj_to_motif(obj)
+        assert motif_to_json_obj(intern_motif(back)) == obj
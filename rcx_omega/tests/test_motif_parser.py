@@ -14,3 +14,31 @@ def test_parse_motif_nested():
 
 def test_parse_motif_multi_kids():
     assert parse_motif("μ(μ(), μ(μ()))") == μ(μ(), μ(μ()))
+
+
+def test_parse_motif_deep_nesting():
+    depth = 5000
+    x = parse_motif("μ(" * depth + ")" * depth)
+    for _ in range(depth - 1):
+        assert len(x.structure) == 1
+        x = x.structure[0]
+    assert x.structure == ()
+
+
+def test_parse_motif_reports_position():
+    import pytest
+
+    with pytest.raises(ValueError, match="Expected '\\)' at pos 6"):
+        parse_motif("μ(μ() μ())")
+    with pytest.raises(ValueError, match="Trailing junk at pos 3"):
+        parse_motif("μ()x")
+
+
+def test_parse_motif_caches_per_literal():
+    import pytest
+
+    text = "μ(μ(), μ(μ(), μ()))"
+    assert parse_motif(text) is parse_motif(text)
+    for _ in range(2):
+        with pytest.raises(ValueError, match="Trailing junk at pos 3"):
+            parse_motif("μ()x")
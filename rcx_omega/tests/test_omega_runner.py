@@ -0,0 +1,131 @@
+from rcx_pi import μ, VOID, UNIT
+from rcx_omega.core.motif_codec import motif_to_json_obj
+from rcx_omega.core.omega_runner import (
+    _STATS_CACHE,
+    _count_nodes_depth,
+    _measure,
+    _same_encoding,
+    _struct_hash,
+    omega_run_to_json,
+    run_omega,
+)
+
+
+def test_measure_matches_codec_and_structure():
+    shared = μ(VOID, μ(μ()))
+    x = μ(shared, UNIT, μ(shared, μ()))
+    obj, nodes, depth = _measure(x, {})
+    assert obj == motif_to_json_obj(x)
+    # UNIT is an atom in JSON but still two nodes deep
+    assert (nodes, depth) == (13, 5)
+
+
+def test_count_nodes_depth_caches_subtrees():
+    x = VOID
+    for _ in range(3000):
+        x = μ(x, UNIT)
+    assert _count_nodes_depth(x) == (9001, 3002)
+    assert _STATS_CACHE[x] == (9001, 3002)
+    # Structurally equal motifs share the cached metrics
+    assert _STATS_CACHE[μ(VOID, UNIT)] == (4, 3)
+    assert _count_nodes_depth(μ(x, x)) == (18003, 3003)
+
+
+def test_state_identity_follows_encoding_not_structure():
+    assert not _same_encoding(μ(), VOID)
+    assert not _same_encoding(μ(μ()), UNIT)
+    assert _same_encoding(μ(VOID, μ()), μ(VOID, μ()))
+    assert not _same_encoding(μ(VOID, μ()), μ(μ(), VOID))
+    assert _struct_hash(μ(VOID), {}) == _struct_hash(μ(VOID), {})
+    assert _struct_hash(μ(), {}) != _struct_hash(VOID, {})
+
+
+class _CyclingEvaluator:
+    # a -> b -> c -> d -> b: limit cycle with mu=1, period=3
+    def __init__(self):
+        a, b, c, d = μ(), μ(VOID), μ(VOID, VOID), μ(μ(VOID))
+        self.next = {a: b, b: c, c: d, d: μ(VOID)}
+
+    def reduce(self, x):
+        return self.next[x]
+
+
+def test_run_omega_confirms_repeats_on_hash_collision(monkeypatch):
+    import rcx_omega.core.omega_runner as omega_runner
+
+    monkeypatch.setattr(omega_runner, "new_evaluator", _CyclingEvaluator)
+    expected = run_omega(μ(), max_steps=8)
+    assert (expected.classification, expected.mu, expected.period) == ("limit_cycle", 1, 3)
+
+    # every state hashes alike: repeats are settled by encoding alone
+    monkeypatch.setattr(omega_runner, "_struct_hash", lambda x, memo: 7)
+    run = run_omega(μ(), max_steps=8)
+    assert (run.classification, run.mu, run.period) == ("limit_cycle", 1, 3)
+    assert len(run.orbit) == len(expected.orbit) == 5
+
+
+def test_run_omega_fixed_point_payload():
+    run = run_omega(μ(μ(), μ(μ())), max_steps=8)
+    payload = omega_run_to_json(run, include_steps=True)
+    assert payload["classification"]["type"] == "fixed_point"
+    assert len(payload["orbit"]) == len(run.orbit)
+    assert payload["seed"] == motif_to_json_obj(run.seed)
+    assert payload["steps"][0]["delta_nodes"] == 0
+
+
+def test_run_omega_fixed_point_by_identity_skips_hashing(monkeypatch):
+    import rcx_omega.core.omega_runner as omega_runner
+
+    def no_hash(x, memo):
+        raise AssertionError("hashed a state")
+
+    monkeypatch.setattr(omega_runner, "_struct_hash", no_hash)
+    seed = μ(μ(), μ(μ()))
+    run = run_omega(seed, max_steps=8)
+    assert (run.classification, run.mu, run.period) == ("fixed_point", 0, 1)
+    assert run.result is seed
+
+
+def test_orbit_steps_are_index_value_pairs():
+    seed = μ(μ(), μ(μ()))
+    run = run_omega(seed, max_steps=8)
+    (i0, v0), (i1, v1) = run.orbit
+    assert (i0, i1) == (0, 1)
+    assert v0 is seed and run.orbit[1].value is v1
+
+
+def test_omega_run_to_json_step_deltas_follow_orbit(monkeypatch):
+    import rcx_omega.core.omega_runner as omega_runner
+
+    monkeypatch.setattr(omega_runner, "new_evaluator", _CyclingEvaluator)
+    run = run_omega(μ(), max_steps=8)
+    payload = omega_run_to_json(run, include_steps=True)
+    assert [(r["i"], r["nodes"], r["depth"]) for r in payload["orbit"]] == [
+        (0, 1, 1),
+        (1, 2, 2),
+        (2, 3, 2),
+        (3, 3, 3),
+        (4, 2, 2),
+    ]
+    assert [(s["delta_nodes"], s["delta_depth"]) for s in payload["steps"]] == [
+        (0, 0),
+        (1, 1),
+        (1, 0),
+        (0, 1),
+        (-1, -1),
+    ]
+
+
+def test_omega_run_to_json_reuses_run_sizes(monkeypatch):
+    import rcx_omega.core.omega_runner as omega_runner
+
+    monkeypatch.setattr(omega_runner, "new_evaluator", _CyclingEvaluator)
+    run = run_omega(μ(), max_steps=8)
+    first = omega_run_to_json(run, include_steps=True, include_motifs=False)
+    assert {id(v) for _, v in run.orbit} <= set(run.sizes)
+
+    def no_walk(x):
+        raise AssertionError("walked a state again")
+
+    monkeypatch.setattr(omega_runner, "_children", no_walk)
+    assert omega_run_to_json(run, include_steps=True, include_motifs=False) == first
@@ -0,0 +1,18 @@
+from rcx_omega.core.report_contract import ReportKind, detect_kind, extract_summary
+
+
+def test_detect_kind_prefers_kind_tag():
+    # An omega run with --include-steps carries a steps list; the tag wins.
+    payload = {"kind": "omega", "steps": [{"i": 0}], "classification": {}}
+    assert detect_kind(payload) == ReportKind("omega")
+    assert extract_summary(payload)["kind"] == "omega"
+    assert extract_summary(payload)["steps"] == 1
+
+
+def test_detect_kind_infers_untagged_payloads():
+    assert detect_kind({"steps": {"i": [0, 1]}}) == ReportKind("trace")
+    assert detect_kind({"classification": {"type": "fixed_point"}}) == ReportKind("omega")
+    assert detect_kind({"kind": "other"}) == ReportKind("unknown")
+    assert extract_summary({"steps": []}) == {"kind": "trace", "steps": 0}
+    assert extract_summary({"classification": {}}) == {"kind": "omega", "classification": {}}
+    assert extract_summary({"stats": {}}) == {"kind": "unknown", "stats": {}}
@@ -16,3 +16,27 @@ def test_trace_cli_json_includes_stats():
     assert "result" in obj["stats"]
     assert obj["stats"]["input"]["nodes"] == 1
     assert obj["stats"]["result"]["nodes"] == 1
+
+
+def test_trace_cli_json_stats_nested_depth():
+    p = subprocess.run(
+        [sys.executable, "-m", "rcx_omega.cli.trace_cli", "--json", "μ(μ(), μ(μ()))"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    obj = json.loads(p.stdout)
+    assert obj["stats"]["input"] == {"nodes": 4, "depth": 3}
+    assert obj["steps"][0]["depth"] == 3
+
+
+def test_trace_cli_json_result_stats_match_last_step():
+    p = subprocess.run(
+        [sys.executable, "-m", "rcx_omega.cli.trace_cli", "--json", "--max-steps", "3", "μ(μ(), μ(μ()))"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    obj = json.loads(p.stdout)
+    last = obj["steps"][-1]
+    assert obj["stats"]["result"] == {"nodes": last["nodes"], "depth": last["depth"]}
@@ -29,3 +29,84 @@ def test_trace_cli_json_smoke_structure():
     # result should be motif-shaped JSON object
     assert isinstance(obj["result"], dict)
     assert ("μ" in obj["result"]) or ("atom" in obj["result"])
+
+
+def test_trace_cli_split_top_level_commas():
+    from rcx_omega.cli.trace_cli import _split_top_level_commas
+
+    assert _split_top_level_commas("μ(), μ(μ(), void) ,unit") == [
+        "μ()",
+        "μ(μ(), void)",
+        "unit",
+    ]
+    assert _split_top_level_commas("void") == ["void"]
+    assert _split_top_level_commas("") == []
+
+
+def test_trace_cli_step_motif_follows_step_shape():
+    from types import SimpleNamespace
+
+    from rcx_pi import VOID, μ
+    from rcx_omega.cli.trace_cli import _step_motif, _step_motif_reader
+
+    a = μ(VOID)
+    read = _step_motif_reader()
+    assert read(SimpleNamespace(i=0, value=a)) is a
+    # "value" is tried first now, but a different shape still resolves
+    assert read(SimpleNamespace(i=1, state=VOID, value=3)) is VOID
+    assert read(SimpleNamespace(value=a)) is a
+    assert read(SimpleNamespace(i=2)) is None
+
+    # A fresh reader, like _step_motif, follows the documented priority
+    both = SimpleNamespace(state=VOID, value=a)
+    assert read(both) is a
+    assert _step_motif_reader()(both) is VOID
+    assert _step_motif(both) is VOID
+
+
+def test_trace_cli_parse_fast_path_matches_reference():
+    import pytest
+
+    from rcx_omega.cli.trace_cli import (
+        _parse_motif_expr_slow,
+        _parse_motif_fast,
+        parse_motif_expr,
+    )
+
+    accepted = ["void", " UNIT ", "1", "mu", "mu()", "μ( )", "μ(μ(), μ(μ()))", "mu(mu(void),unit)"]
+    for src in accepted:
+        fast = _parse_motif_fast(src)
+        assert fast is not None
+        assert fast == _parse_motif_expr_slow(src)
+
+    # Outside the common grammar: the reference parser decides
+    assert _parse_motif_fast("μ(void,)") is None
+    assert parse_motif_expr("μ(void,)") == _parse_motif_expr_slow("μ(void,)")
+    for bad in ["", "μ (void)", "μ(,void)", "μ(void) x", "MU(void)"]:
+        assert _parse_motif_fast(bad) is None
+        with pytest.raises(ValueError):
+            parse_motif_expr(bad)
+
+
+def test_trace_cli_parse_deep_expression():
+    from rcx_omega.cli.trace_cli import parse_motif_expr
+
+    depth = 3000
+    m = parse_motif_expr("μ(" * depth + ")" * depth)
+    for _ in range(depth - 1):
+        (m,) = m.structure
+    assert m.structure == ()
+
+
+def test_trace_cli_motif_stats_deep_and_shared():
+    from rcx_pi import VOID, μ
+    from rcx_omega.cli.trace_cli import _motif_stats
+
+    m = VOID
+    for _ in range(5000):
+        m = μ(m)
+    assert _motif_stats(m) == (5001, 5001)
+
+    leaf = μ(VOID)
+    shared = μ(leaf, leaf, μ(leaf))
+    assert _motif_stats(shared) == (shared.count_nodes(), 4)
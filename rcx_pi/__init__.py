@@ -8,7 +8,7 @@ This module exposes a small, coherent core:
     - Evaluator: PureEvaluator, new_evaluator()
     - Numbers: num, succ, pred, motif_to_int, add, zero
     - Lists: list_from_py, py_from_list, NIL, CONS, is_list_motif, head, tail
-    - Pretty / meta: pretty_motif, classify_motif
+    - Pretty / meta: pretty_motif, classify_motif, classify_many
     - Programs: swap_xy_closure, dup_x_closure, rotate_xyz_closure,
                 swap_ends_xyz_closure, reverse_list_closure,
                 append_lists_closure, activate, bytecode helpers
@@ -37,7 +37,7 @@ from .programs import (
     bytecode_closure,
 )
 from .pretty import pretty_motif
-from .meta import classify_motif
+from .meta import classify_motif, classify_many
 
 # ---------------------------------------------------------------------------
 # Core motif + numbers
@@ -128,6 +128,7 @@ __all__ = [
     "pretty_motif",
     # meta
     "classify_motif",
+    "classify_many",
     # programs
     "swap_xy_closure",
     "dup_x_closure",
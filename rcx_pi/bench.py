@@ -23,20 +23,55 @@ from __future__ import annotations
 import time
 from typing import Callable, Dict, Any
 
-from .core.motif import Motif
+from .core.motif import Motif, VOID
 from .engine.evaluator_pure import PureEvaluator
 
 
+def _time_reduce(ev: PureEvaluator, builder: Callable[[], Motif]) -> float:
+    expr = builder()
+    t0 = time.perf_counter()
+    _ = ev.reduce(expr)
+    t1 = time.perf_counter()
+    return t1 - t0
+
+
+def succ_chain_builder(depth: int) -> Callable[[], Motif]:
+    """
+    Return a builder producing a fresh (unshared) succ^depth(VOID).
+
+    The chain is data, which PureEvaluator.reduce() returns unchanged, so
+    timing the builder itself measures the cost of building deep structure;
+    it is not a reduction benchmark.
+    """
+    if depth < 0:
+        raise ValueError("depth must be >= 0")
+
+    def build() -> Motif:
+        m = VOID
+        for _ in range(depth):
+            m = Motif(m)
+        return m
+
+    return build
+
+
 def benchmark_reduce(
     builder: Callable[[], Motif],
     repeats: int = 10,
+    warmup: int = 3,
 ) -> Dict[str, Any]:
     """
     Run `repeats` reductions of `builder()` using PureEvaluator.
 
-    Returns a small stats dict:
+    The first reduction is timed on its own as the cold run; `warmup`
+    untimed reductions follow so interpreter specialization and the
+    numeral / memo caches are warm before the steady-state loop.
+
+    Returns a small stats dict (min/max/avg/total are steady-state):
         {
             "repeats": N,
+            "warmup": W,
+            "cold_s": ...,
             "min_s": ...,
             "max_s": ...,
             "avg_s": ...,
@@ -45,20 +80,24 @@ def benchmark_reduce(
     """
     if repeats <= 0:
         raise ValueError("repeats must be > 0")
+    if warmup < 0:
+        raise ValueError("warmup must be >= 0")
 
     ev = PureEvaluator()
-    times = []
+    cold = _time_reduce(ev, builder)
+
+    for _ in range(warmup):
+        _ = ev.reduce(builder())
 
+    times = []
     for _ in range(repeats):
-        expr = builder()
-        t0 = time.perf_counter()
-        _ = ev.reduce(expr)
-        t1 = time.perf_counter()
-        times.append(t1 - t0)
+        times.append(_time_reduce(ev, builder))
 
     total = sum(times)
     return {
         "repeats": repeats,
+        "warmup": warmup,
+        "cold_s": cold,
         "min_s": min(times),
         "max_s": max(times),
         "avg_s": total / repeats,
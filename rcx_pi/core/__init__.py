@@ -1,2 +1,2 @@
 # rcx_pi/core/__init__.py
-from .motif import Motif, μ, VOID, UNIT
+from .motif import Motif, μ, VOID, UNIT, intern_motif
@@ -10,6 +10,8 @@ This is the primitive substrate upon which projection,
 closure, paradox, recursion, arithmetic and OS-shell emerge.
 """
 
+import weakref
+
 
 class Motif:
     """A motif is pure structure — no strings, only structural recursion."""
@@ -18,24 +20,48 @@ class Motif:
         self.structure = tuple(structure)
 
     # ---------- structural identity ----------
+    #
+    # Motifs are never mutated structurally, so each node caches a digest:
+    #   _hash   structural hash (ignores .meta, like equality)
+    #   _depth  n when the node is the numeral succ^n(VOID), else unset
+    # A numeral's digest is just (tag, n), so hashing or comparing two
+    # Peano chains is O(1) once digested instead of an n-step walk.
 
     def structurally_equal(self, other):
         if not isinstance(other, Motif):
             return False
-        if len(self.structure) != len(other.structure):
-            return False
-        for a, b in zip(self.structure, other.structure):
-            if isinstance(a, Motif) and isinstance(b, Motif):
-                if not a.structurally_equal(b):
+        stack = [(self, other)]
+        while stack:
+            a, b = stack.pop()
+            if a is b:
+                continue
+            sa, sb = a.structure, b.structure
+            if len(sa) != len(sb):
+                return False
+            da = getattr(a, "_depth", None)
+            db = getattr(b, "_depth", None)
+            if da is not None and db is not None:
+                if da != db:
                     return False
-            elif a != b:
+                continue
+            ha = getattr(a, "_hash", None)
+            hb = getattr(b, "_hash", None)
+            if ha is not None and hb is not None and ha != hb:
                 return False
+            for x, y in zip(sa, sb):
+                if isinstance(x, Motif) and isinstance(y, Motif):
+                    stack.append((x, y))
+                elif x != y:
+                    return False
         return True
 
     __eq__ = structurally_equal
 
     def __hash__(self):
-        return hash(self.structure)
+        h = getattr(self, "_hash", None)
+        if h is None:
+            h = _digest(self)
+        return h
 
     def __repr__(self):
         if not self.structure:
@@ -54,9 +80,10 @@ class Motif:
         return len(self.structure) == 1 and isinstance(self.structure[0], Motif)
 
     def is_number_pure(self):
-        if self.is_zero_pure():
-            return True
-        return self.is_successor_pure() and self.structure[0].is_number_pure()
+        s = self.structure
+        while len(s) == 1 and isinstance(s[0], Motif):
+            s = s[0].structure
+        return not s
 
     # ---------- structural operations ----------
 
@@ -75,6 +102,28 @@ class Motif:
 
     # ---------- Peano arithmetic (structural) ----------
 
+    @classmethod
+    def succ_chain(cls, n):
+        """
+        Shared Peano chain succ^n(VOID).
+
+        Chains live in a process-wide table indexed by depth and are extended
+        on demand, one node per missing depth, so each numeral is allocated
+        once. Motifs are never mutated structurally: entries never expire.
+        """
+        if n < 0:
+            raise ValueError("succ_chain only supports n>=0")
+        chain = _SUCC_CHAIN
+        if n >= len(chain):
+            top = chain[-1]
+            for _ in range(len(chain), n + 1):
+                top = cls(top)  # top is a known numeral: skip succ()'s check
+                top._depth = len(chain)
+                top._hash = hash((_NUMERAL_TAG, top._depth))
+                top._interned = True
+                chain.append(top)
+        return chain[n]
+
     def succ(self):
         if self.is_number_pure():
             return Motif(self)  # succ(n)
@@ -87,19 +136,39 @@ class Motif:
             return self.head()
         return Motif(Motif(Motif(Motif())), self)  # pred-pattern
 
+    # add/mult are linear in the successor spine: peel succ^k off in a loop,
+    # solve the base case, then rebuild k layers. Same result as the
+    # recursive rules, without one Python frame per successor.
+
+    def _peel_succ(self):
+        k = 0
+        cur = self
+        s = cur.structure
+        while len(s) == 1 and isinstance(s[0], Motif):
+            k += 1
+            cur = s[0]
+            s = cur.structure
+        return k, cur
+
     def add(self, b):
-        if self.is_zero_pure():
-            return b
-        if self.is_successor_pure():
-            return Motif(self.head().add(b))  # succ(n)+m → succ(n+m)
-        return Motif(Motif(), Motif(), self, b)  # add marker
+        k, base = self._peel_succ()
+        if base.is_zero_pure():
+            out = b
+        else:
+            out = Motif(Motif(), Motif(), base, b)  # add marker
+        for _ in range(k):
+            out = Motif(out)  # succ(n)+m → succ(n+m)
+        return out
 
     def mult(self, b):
-        if self.is_zero_pure():
-            return Motif()
-        if self.is_successor_pure():
-            return b.add(self.head().mult(b))  # succ(n)*m -> m + n*m
-        return Motif(Motif(), Motif(), Motif(), self, b)  # mult marker
+        k, base = self._peel_succ()
+        if base.is_zero_pure():
+            out = Motif()
+        else:
+            out = Motif(Motif(), Motif(), Motif(), base, b)  # mult marker
+        for _ in range(k):
+            out = b.add(out)  # succ(n)*m -> m + n*m
+        return out
 
     # ---------- structural analysis tools ----------
 
@@ -131,6 +200,49 @@ class Motif:
         return shared
 
 
+# ---------- structural digest ----------
+
+_NUMERAL_TAG = "succ^n"
+
+
+def _digest(m):
+    """
+    Compute and cache _hash (and _depth for numerals) on m and every
+    undigested descendant, bottom-up with an explicit stack.
+    """
+    stack = [m]
+    while stack:
+        node = stack[-1]
+        if getattr(node, "_hash", None) is not None:
+            stack.pop()
+            continue
+        s = node.structure
+        pending = False
+        for c in s:
+            if isinstance(c, Motif) and getattr(c, "_hash", None) is None:
+                stack.append(c)
+                pending = True
+        if pending:
+            continue
+        stack.pop()
+
+        depth = None
+        if not s:
+            depth = 0
+        elif len(s) == 1 and isinstance(s[0], Motif):
+            child_depth = getattr(s[0], "_depth", None)
+            if child_depth is not None:
+                depth = child_depth + 1
+        if depth is not None:
+            node._depth = depth
+            node._hash = hash((_NUMERAL_TAG, depth))
+        else:
+            node._hash = hash(
+                tuple(c._hash if isinstance(c, Motif) else hash(c) for c in s)
+            )
+    return m._hash
+
+
 # ---------- constructor and primitives ----------
 
 
@@ -143,3 +255,106 @@ def μ(*xs):
 
 VOID = μ()  # 0
 UNIT = μ(μ())  # 1
+
+# Depth-indexed table backing Motif.succ_chain: _SUCC_CHAIN[n] is succ^n(VOID).
+_SUCC_CHAIN = [VOID]
+VOID._interned = True
+
+
+# ---------- hash-consing ----------
+
+# Canonical data motifs, keyed by the ids of their (canonical) children.
+# Values are weak: an entry disappears with its motif, and a live entry
+# keeps its children alive, so the id keys cannot be recycled under it.
+# Canonical motifs (these entries, the succ_chain numerals, VOID, UNIT and
+# _EMPTY) are flagged _interned, so re-interning a term built around them
+# skips their subtrees.
+_INTERN = weakref.WeakValueDictionary()
+
+# VOID and UNIT are identity atoms (the Ω codec encodes only these objects as
+# atoms), so interning keeps them as they are and never produces them from
+# other nodes. A fresh μ() interns to _EMPTY instead, and only chains based
+# on the VOID object become succ_chain numerals.
+_EMPTY = Motif()
+_EMPTY._interned = True
+UNIT._interned = True
+
+
+def _is_numeral(m):
+    """True if m is the shared succ_chain numeral of its depth."""
+    n = getattr(m, "_depth", None)
+    return n is not None and n < len(_SUCC_CHAIN) and _SUCC_CHAIN[n] is m
+
+
+def intern_motif(m):
+    """
+    Return the canonical shared instance of a plain data motif.
+
+    Structurally equal data motifs intern to the same object, so identity
+    implies structural equality and id()-keyed caches hit across rebuilds.
+    Chains built on the VOID object map onto Motif.succ_chain. VOID and
+    UNIT are returned as themselves and a fresh μ() becomes one shared
+    empty node, so interning never changes which nodes are the identity
+    atoms. Motifs carrying .meta (closures, boxed Python values) or
+    non-Motif children are returned unchanged: they compare equal to plain
+    structure but must keep their own identity.
+    Iterative post-order, so deep chains do not recurse. Subtrees that are
+    already canonical are not walked, so interning a new term built around
+    interned parts (e.g. the next step of a trace) only visits the new
+    nodes.
+    """
+    if not isinstance(m, Motif) or getattr(m, "_interned", False):
+        return m
+
+    # id(node) -> canonical motif, or None if not internable
+    canon = {id(VOID): VOID, id(UNIT): UNIT}
+    # id(node) -> n for nodes that are the numeral succ^n(VOID)
+    depth = {id(VOID): 0}
+    stack = [(m, False)]
+    while stack:
+        node, ready = stack.pop()
+        if id(node) in canon:
+            continue
+        if not ready:
+            stack.append((node, True))
+            for c in node.structure:
+                if not isinstance(c, Motif) or id(c) in canon:
+                    continue
+                if getattr(c, "_interned", False):
+                    canon[id(c)] = c
+                    if _is_numeral(c):
+                        depth[id(c)] = c._depth
+                else:
+                    stack.append((c, False))
+            continue
+        canon[id(node)] = _intern_node(node, canon, depth)
+
+    out = canon[id(m)]
+    return m if out is None else out
+
+
+def _intern_node(node, canon, depth):
+    if getattr(node, "meta", None) is not None:
+        return None
+    s = node.structure
+    kids = []
+    for c in s:
+        if not isinstance(c, Motif) or canon[id(c)] is None:
+            return None
+        kids.append(canon[id(c)])
+
+    if not kids:
+        return _EMPTY
+    if len(kids) == 1 and id(s[0]) in depth:
+        n = depth[id(s[0])] + 1
+        depth[id(node)] = n
+        return Motif.succ_chain(n)
+
+    key = tuple(map(id, kids))
+    hit = _INTERN.get(key)
+    if hit is None:
+        same = all(k is c for k, c in zip(kids, s))
+        hit = node if same else Motif(*kids)
+        hit._interned = True
+        _INTERN[key] = hit
+    return hit
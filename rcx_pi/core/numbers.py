@@ -12,13 +12,10 @@ from .motif import Motif, VOID
 
 
 def num(n: int) -> Motif:
-    """Build Peano number n as a pure successor chain."""
+    """Build Peano number n as a pure successor chain (shared per n)."""
     if n < 0:
         raise ValueError("num only supports n>=0")
-    m = VOID
-    for _ in range(n):
-        m = m.succ()
-    return m
+    return Motif.succ_chain(n)
 
 
 def succ(m: Motif) -> Motif:
@@ -41,14 +38,14 @@ def motif_to_int(m: Motif) -> int | None:
     """
     if not isinstance(m, Motif):
         return None
-    if m.is_zero_pure():
-        return 0
+    # Walk .structure directly: is_successor_pure()/head() reduce to a
+    # length check plus a tuple index, so skip the per-step method calls.
     n = 0
-    cur = m
-    while cur.is_successor_pure():
+    s = m.structure
+    while len(s) == 1 and isinstance(s[0], Motif):
         n += 1
-        cur = cur.head()
-    return n if cur.is_zero_pure() else None
+        s = s[0].structure
+    return n if not s else None
 
 
 def add(a: Motif, b: Motif) -> Motif:
@@ -0,0 +1,72 @@
+# rcx_pi/decode.py
+"""
+Decode small Motif shapes back to Python ints.
+
+decode(m) reads len(m.structure) once and dispatches on that arity instead
+of running a chain of isinstance / is_zero_pure / is_successor_pure tests:
+
+    arity 0  -> 0                       (VOID, Peano zero)
+    arity 1  -> int | None              (Peano successor chain)
+    arity 2  -> (int | None, int | None)        (pair of numbers)
+    arity 3  -> (int | None, int | None, int | None)  (triple of numbers)
+    other    -> None
+
+decode_pair / decode_triple are the arity-checked entry points used by the
+demos and the REPL; motif_to_int is the numeric decoder they share.
+"""
+
+from __future__ import annotations
+
+from typing import Optional, Tuple, Union
+
+from .core.motif import Motif
+from .core.numbers import motif_to_int
+
+Decoded = Union[int, Tuple[Optional[int], ...], None]
+
+
+def _decode_zero(m: Motif) -> int:
+    return 0
+
+
+def _decode_pair(m: Motif) -> Tuple[Optional[int], Optional[int]]:
+    s = m.structure
+    return motif_to_int(s[0]), motif_to_int(s[1])
+
+
+def _decode_triple(m: Motif) -> Tuple[Optional[int], Optional[int], Optional[int]]:
+    s = m.structure
+    return motif_to_int(s[0]), motif_to_int(s[1]), motif_to_int(s[2])
+
+
+# Indexed by arity. A successor chain is decoded by motif_to_int itself.
+_DECODERS = (_decode_zero, motif_to_int, _decode_pair, _decode_triple)
+
+
+def decode(m: Motif) -> Decoded:
+    """Decode m by arity (see module docstring); None if it has no decoding."""
+    if not isinstance(m, Motif):
+        return None
+    arity = len(m.structure)
+    if arity < len(_DECODERS):
+        return _DECODERS[arity](m)
+    return None
+
+
+def decode_pair(m: Motif) -> Optional[Tuple[Optional[int], Optional[int]]]:
+    """Assume μ(a, b) where a, b are Peano; decode to (int, int)."""
+    if not isinstance(m, Motif) or len(m.structure) != 2:
+        return None
+    return _decode_pair(m)
+
+
+def decode_triple(
+    m: Motif,
+) -> Optional[Tuple[Optional[int], Optional[int], Optional[int]]]:
+    """Assume μ(a, b, c) where a, b, c are Peano; decode to (int, int, int)."""
+    if not isinstance(m, Motif) or len(m.structure) != 3:
+        return None
+    return _decode_triple(m)
+
+
+__all__ = ["decode", "decode_pair", "decode_triple", "motif_to_int"]
@@ -21,10 +21,24 @@ The projections themselves are pure structural - no host debt.
 
 from __future__ import annotations
 
-from typing import Any
-
-from rcx_pi.eval_seed import step, NO_MATCH, host_builtin, host_mutation
-from rcx_pi.mu_type import Mu, assert_mu, mu_equal
+import json
+import sys
+from collections import deque
+from functools import partial
+from typing import Any, Callable
+
+from rcx_pi.eval_seed import (
+    step, NO_MATCH, host_builtin, host_mutation, is_var, get_var_name,
+    apply_projection, assert_not_lambda_calculus,
+)
+from rcx_pi.mu_type import Mu, MuInterner, assert_mu, mu_equal, mu_key
+from rcx_pi.selfhost.eval_seed import _NoMatch
+from rcx_pi.projection_coverage import coverage
+
+try:  # optional: faster debug formatting; the runner never requires it
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
 
 
 # =============================================================================
@@ -33,11 +47,25 @@ from rcx_pi.mu_type import Mu, assert_mu, mu_equal
 
 MAX_HISTORY = 500        # Cap history to prevent memory exhaustion (Attack 17)
 MAX_CONTEXT_DEPTH = 100  # Cap context depth to prevent stack-like overflow (Attack 7)
+DEBUG_STEP_LIMIT = 50    # debug=True prints this many steps, then only the stall
 
 # Internal marker for done wrapper - prevents spoofing by domain projections
 # This value is checked by the runner to verify authentic completion
 DONE_MARKER = "__deep_eval_internal_done__"
 
+# Schema strings, explicitly interned so that equality checks against states
+# whose strings were also interned short-circuit on identity
+_DEEP_EVAL = sys.intern("deep_eval")
+_DEEP_EVAL_DONE = sys.intern("deep_eval_done")
+_ASCENDING = sys.intern("ascending")
+_ROOT_CHECK = sys.intern("root_check")
+_DICT_TAIL = sys.intern("dict_tail")
+
+# Schema sets for validate_deep_eval_state (built once, not per step)
+_REQUIRED_FIELDS = frozenset({"mode", "phase", "focus", "context", "changed"})
+_VALID_PHASES = frozenset({"traverse", "ascending", "root_check"})
+_VALID_FRAME_TYPES = frozenset({"dict_head", "dict_tail"})
+
 
 # =============================================================================
 # Deep Eval State Machine Projections
@@ -255,6 +283,271 @@ def make_deep_eval_projections(domain_projections: list[Mu]) -> list[Mu]:
     return projections
 
 
+def index_projections_by_phase(projections: list[Mu]) -> dict[str, list[Mu]]:
+    """
+    Group projections by the literal phase their pattern pins.
+
+    A pattern whose "phase" is a literal string can only match states in
+    that phase, so for each phase the candidate list is every projection
+    pinned to it plus every unpinned one (wrap, sibling, ascend, ...), in
+    the original order. step() over a phase's candidates therefore picks
+    the same projection as step() over the full list, while skipping the
+    projections that cannot apply (e.g. reduce/descend while ascending).
+
+    Args:
+        projections: Projection list, e.g. from make_deep_eval_projections().
+
+    Returns:
+        Dict mapping each pinned phase (and each valid deep_eval phase) to
+        its candidate projections. States in any other phase need the full
+        list.
+    """
+    phases: dict[str, list[Mu]] = {}
+    for phase in sorted(_VALID_PHASES):
+        phases[phase] = []
+    for proj in projections:
+        pattern = proj.get("pattern") if isinstance(proj, dict) else None
+        pinned = pattern.get("phase") if isinstance(pattern, dict) else None
+        if isinstance(pinned, str) and pinned not in phases:
+            phases[pinned] = []
+
+    for proj in projections:
+        pattern = proj.get("pattern") if isinstance(proj, dict) else None
+        pinned = pattern.get("phase") if isinstance(pattern, dict) else None
+        for phase, candidates in phases.items():
+            if not isinstance(pinned, str) or pinned == phase:
+                candidates.append(proj)
+    return phases
+
+
+# =============================================================================
+# Compiled Projections
+# =============================================================================
+# run_deep_eval applies one fixed projection list to every state, so each
+# pattern is compiled once into a matcher closure that hard-codes its
+# literals, key sets and variable sites, and each body into a builder
+# closure that only fills in the bindings. match() instead re-dispatches on
+# the pattern and re-validates both sides at every node, for every
+# projection tried. Compiled matchers check the literal fields of a dict
+# pattern (mode, phase, an empty context, a literal changed flag) before its
+# structured ones, so most projections are rejected after a few comparisons.
+# The rules are exactly those of match() and substitute().
+# =============================================================================
+
+# A matcher records the bindings of a successful match in env; a builder
+# reads them back. Both may be partially applied to the same env.
+Matcher = Callable[[Mu, dict], bool]
+Builder = Callable[[dict], Mu]
+Applier = Callable[[Mu], "Mu | _NoMatch"]
+
+
+def _compile_pattern(pattern: Mu) -> Matcher:
+    """Compile a pattern to a matcher with match()'s rules."""
+    if is_var(pattern):
+        name = get_var_name(pattern)
+
+        def match_var(value: Mu, env: dict) -> bool:
+            if name in env:
+                # Same variable bound twice - must be the same value
+                bound = env[name]
+                return bound is value or mu_key(bound) == mu_key(value)
+            env[name] = value
+            return True
+        return match_var
+
+    if pattern is None or isinstance(pattern, bool):
+        # None, True and False are singletons
+        def match_singleton(value: Mu, env: dict) -> bool:
+            return value is pattern
+        return match_singleton
+
+    if isinstance(pattern, int):
+        def match_int(value: Mu, env: dict) -> bool:
+            return isinstance(value, int) and not isinstance(value, bool) and value == pattern
+        return match_int
+
+    if isinstance(pattern, (float, str)):
+        scalar_type = float if isinstance(pattern, float) else str
+
+        def match_scalar(value: Mu, env: dict) -> bool:
+            return isinstance(value, scalar_type) and value == pattern
+        return match_scalar
+
+    if isinstance(pattern, list):
+        size = len(pattern)
+        elements = []
+        for elem in pattern:
+            elements.append(_compile_pattern(elem))
+
+        def match_list(value: Mu, env: dict) -> bool:
+            if not isinstance(value, list) or len(value) != size:
+                return False
+            for matches, elem in zip(elements, value):
+                if not matches(elem, env):
+                    return False
+            return True
+        return match_list
+
+    if isinstance(pattern, dict):
+        keys = frozenset(pattern)
+        # Scalar literals first: they reject most states outright
+        literal_fields = []
+        other_fields = []
+        for key, sub in pattern.items():
+            fields = literal_fields if sub is None or isinstance(sub, (bool, int, float, str)) else other_fields
+            fields.append((key, _compile_pattern(sub)))
+        fields = literal_fields + other_fields
+
+        def match_dict(value: Mu, env: dict) -> bool:
+            if not isinstance(value, dict) or value.keys() != keys:
+                return False
+            for key, matches in fields:
+                if not matches(value[key], env):
+                    return False
+            return True
+        return match_dict
+
+    raise TypeError(f"Invalid pattern type: {type(pattern)}")
+
+
+def _compile_body(body: Mu) -> Builder:
+    """Compile a body to a builder with substitute()'s rules."""
+    if is_var(body):
+        name = get_var_name(body)
+
+        def build_var(env: dict) -> Mu:
+            if name not in env:
+                raise KeyError(f"Unbound variable: {name}")
+            return env[name]
+        return build_var
+
+    if body is None or isinstance(body, (bool, int, float, str)):
+        def build_scalar(env: dict) -> Mu:
+            return body
+        return build_scalar
+
+    if isinstance(body, list):
+        elements = []
+        for elem in body:
+            elements.append(_compile_body(elem))
+
+        def build_list(env: dict) -> Mu:
+            out = []
+            for build in elements:
+                out.append(build(env))
+            return out
+        return build_list
+
+    if isinstance(body, dict):
+        fields = []
+        for key, sub in body.items():
+            fields.append((key, _compile_body(sub)))
+
+        def build_dict(env: dict) -> Mu:
+            out = {}
+            for key, build in fields:
+                out[key] = build(env)
+            return out
+        return build_dict
+
+    raise TypeError(f"Invalid body type: {type(body)}")
+
+
+def compile_projection(projection: Mu) -> Applier:
+    """
+    Compile a projection to a function equivalent to apply_projection.
+
+    The projection is validated once here instead of on every application;
+    the returned function expects an input that is already a valid Mu.
+    Projections that apply_projection would reject (malformed, lambda-like,
+    empty variable names) are not compiled: they are returned as a plain
+    apply_projection call, so they raise exactly when a state reaches them.
+
+    Args:
+        projection: Dict with "pattern" and "body" keys.
+
+    Returns:
+        Function mapping an input to its transformed value, or NO_MATCH.
+    """
+    try:
+        assert_mu(projection, "apply.projection")
+        assert_not_lambda_calculus(projection)
+        matches = _compile_pattern(projection["pattern"])
+        build = _compile_body(projection["body"])
+    except (TypeError, ValueError, KeyError):
+        return partial(apply_projection, projection)
+
+    def apply_compiled(value: Mu) -> Mu | _NoMatch:
+        env: dict[str, Mu] = {}
+        if not matches(value, env):
+            return NO_MATCH
+        return build(env)
+    return apply_compiled
+
+
+def step_compiled(compiled: list[tuple[Mu, Applier]], value: Mu) -> Mu:
+    """
+    step() over compiled projections: first match wins, else value (stall).
+
+    Args:
+        compiled: (projection, compile_projection(projection)) pairs.
+        value: The value to transform.
+
+    Returns:
+        Transformed value if any projection matched, value unchanged otherwise.
+    """
+    assert_mu(value, "step.input")
+    for _proj, apply in compiled:
+        result = apply(value)
+        if result is not NO_MATCH:
+            return result
+    return value
+
+
+# =============================================================================
+# Ascend Fast Path
+# =============================================================================
+
+# Ascending-phase candidates of the standard projection set; _ascend is only
+# used when a run's ascending candidates are exactly these.
+_STANDARD_ASCENDING = index_projections_by_phase(make_deep_eval_projections([]))["ascending"]
+
+
+def _ascend(state: Mu) -> Mu | None:
+    """
+    Apply ascend.to_context / ascend.to_root directly, without matching.
+
+    With the standard ascending projections (sibling, ascend.to_context,
+    ascend.to_root, wrap), a state in phase "ascending" whose top frame is
+    dict_tail can only be matched by one of the two ascends, so the rebuilt
+    state is known without trying any pattern. Returns None for any other
+    shape (wrong keys, other frame, malformed outer context), leaving the
+    state to projection matching.
+    """
+    if not isinstance(state, dict) or state.keys() != _REQUIRED_FIELDS:
+        return None
+    if state["mode"] != _DEEP_EVAL or state["phase"] != _ASCENDING:
+        return None
+    context = state["context"]
+    if not isinstance(context, list) or len(context) != 2:
+        return None
+    frame, outer = context
+    # dict_tail frame: exactly {"type": "dict_tail", "head_result": ...}
+    if (not isinstance(frame, dict) or len(frame) != 2
+            or frame.get("type") != _DICT_TAIL or "head_result" not in frame):
+        return None
+    if not isinstance(outer, list) or len(outer) not in (0, 2):
+        return None
+
+    return {
+        "mode": _DEEP_EVAL,
+        "phase": _ASCENDING if outer else _ROOT_CHECK,
+        "focus": {"head": frame["head_result"], "tail": state["focus"]},
+        "context": outer,
+        "changed": state["changed"],
+    }
+
+
 # =============================================================================
 # State Validation (defense against adversary attacks)
 # =============================================================================
@@ -279,48 +572,53 @@ def validate_deep_eval_state(state: Mu) -> tuple[bool, str | None]:
     if not isinstance(state, dict):
         return True, None  # Not a deep_eval state, pass through
 
-    if state.get("mode") != "deep_eval":
+    if state.get("mode") != _DEEP_EVAL:
         return True, None  # Not a deep_eval state
 
-    # Validate required fields
-    required = {"mode", "phase", "focus", "context", "changed"}
-    if not required.issubset(state.keys()):
-        return False, f"Missing required fields: {required - set(state.keys())}"
+    # Validate required fields: five early-exit membership checks on the
+    # common (valid) path; the missing-field set is built only on error
+    if not ("mode" in state and "phase" in state and "focus" in state
+            and "context" in state and "changed" in state):
+        return False, f"Missing required fields: {_REQUIRED_FIELDS - state.keys()}"
+
+    # Read each field once
+    phase = state["phase"]
+    changed = state["changed"]
+    context = state["context"]
 
     # Validate phase values
-    valid_phases = {"traverse", "ascending", "root_check"}
-    if state["phase"] not in valid_phases:
-        return False, f"Invalid phase: {state['phase']}"
+    if phase not in _VALID_PHASES:
+        return False, f"Invalid phase: {phase}"
 
     # Validate changed is boolean
-    if not isinstance(state["changed"], bool):
-        return False, f"changed must be boolean, got: {type(state['changed'])}"
+    if not isinstance(changed, bool):
+        return False, f"changed must be boolean, got: {type(changed)}"
 
     # Validate context is a list
-    if not isinstance(state["context"], list):
-        return False, f"context must be list, got: {type(state['context'])}"
+    if not isinstance(context, list):
+        return False, f"context must be list, got: {type(context)}"
 
     # Validate context structure - must be properly nested [frame, outer_context]
     # Empty context is valid; non-empty must be [frame_dict, list]
-    ctx = state["context"]
+    ctx = context
     depth = 0
     while ctx:
+        # Kept before the unpack: a two-key dict would unpack too
         if not isinstance(ctx, list):
             return False, f"Context at depth {depth} is not a list"
-        if len(ctx) == 0:
-            break  # Empty context, done
-        if len(ctx) != 2:
+        # Non-empty here (loop condition); unpacking checks the length
+        try:
+            frame, outer = ctx
+        except ValueError:
             return False, f"Context at depth {depth} must be [frame, outer], got length {len(ctx)}"
-
-        frame, outer = ctx
         if not isinstance(frame, dict):
             return False, f"Context frame at depth {depth} is not a dict"
         if "type" not in frame:
             return False, f"Context frame at depth {depth} missing 'type' field"
 
-        valid_frame_types = {"dict_head", "dict_tail"}
-        if frame["type"] not in valid_frame_types:
-            return False, f"Invalid frame type at depth {depth}: {frame['type']}"
+        frame_type = frame["type"]
+        if frame_type not in _VALID_FRAME_TYPES:
+            return False, f"Invalid frame type at depth {depth}: {frame_type}"
 
         ctx = outer
         depth += 1
@@ -330,7 +628,7 @@ def validate_deep_eval_state(state: Mu) -> tuple[bool, str | None]:
 
     # Validate phase/context consistency
     # root_check phase should only have empty context
-    if state["phase"] == "root_check" and state["context"]:
+    if phase == _ROOT_CHECK and context:
         return False, f"root_check phase requires empty context, got depth {depth}"
 
     return True, None
@@ -340,6 +638,24 @@ def validate_deep_eval_state(state: Mu) -> tuple[bool, str | None]:
 # Deep Eval Runner
 # =============================================================================
 
+def _format_state(value: Mu) -> str:
+    """
+    Indent a state as JSON for debug output.
+
+    Uses orjson when it is installed: same layout as json.dumps(indent=2),
+    but non-ASCII is written as UTF-8 rather than as \\uXXXX escapes, and
+    exponent floats in their shortest form (1e20 and 1e-7, not 1e+20 and
+    1e-07). Both parse back to the same value. Falls back to json for
+    values orjson rejects, such as integers wider than 64 bits.
+    """
+    if _orjson is not None:
+        try:
+            return _orjson.dumps(value, option=_orjson.OPT_INDENT_2).decode()
+        except TypeError:
+            pass
+    return json.dumps(value, indent=2)
+
+
 @host_builtin("range() for iteration loop")
 @host_mutation("history.append() to record steps")
 def run_deep_eval(
@@ -359,68 +675,157 @@ def run_deep_eval(
         projections: Complete projection list from make_deep_eval_projections().
         value: The initial value to evaluate.
         max_steps: Maximum steps before forced termination.
-        debug: If True, print each step.
+        debug: If True, print each step (the first DEBUG_STEP_LIMIT steps,
+            then only the stalling one).
         validate: If True, validate state at each step.
 
     Returns:
         (result, history) tuple where:
         - result is the final evaluated value
-        - history is list of {step, before, after} dicts
+        - history is list of {step, before, after} dicts for the last
+          MAX_HISTORY steps
+
+    Each step only tries the projections that can match the current phase
+    (see index_projections_by_phase); the first match is unchanged.
+    Projections are compiled once per run (see compile_projection) and
+    applied by step_compiled, which follows step() except for coverage
+    recording; while coverage is enabled every step goes through step().
+    When the ascending projections are the standard ones, pure ascend steps
+    (dict_tail frame on top) rebuild the parent directly instead of being
+    matched; each still counts as a step and is recorded in history.
+
+    Every state is hash-consed through a per-run MuInterner, so equal
+    subterms are shared (treat results as immutable) and the stall check
+    is an identity comparison instead of a full mu_equal.
+
+    Stepping is deterministic, so a container state that recurs means the
+    run is in a cycle it can never leave: the run stops there, as a stall,
+    instead of spinning through the remaining max_steps. The last
+    MAX_HISTORY distinct states are remembered for this check.
 
     Raises:
         ValueError: If state validation fails (when validate=True).
     """
-    import json
-
     # Validate input is Mu
     assert_mu(value)
 
-    current = value
-    history: list[dict[str, Any]] = []
+    # Caller-supplied deep_eval states carry non-interned strings (e.g. from
+    # json.loads); intern their schema fields on a copy, never in place
+    if isinstance(value, dict) and value.get("mode") == _DEEP_EVAL:
+        value = dict(value, mode=_DEEP_EVAL)
+        if isinstance(value.get("phase"), str):
+            value["phase"] = sys.intern(value["phase"])
+
+    interner = MuInterner()
+    current = interner.intern(value)
+    # Ring buffer of (step, before, after): O(1) append, and maxlen enforces
+    # the Attack 17 bound. Expanded to history dicts once, on exit.
+    history: deque[tuple[int, Mu, Mu]] = deque(maxlen=MAX_HISTORY)
+
+    # Ids of interned states already stepped, for cycle detection. Interned
+    # nodes stay alive for the whole run, so their ids are stable keys. The
+    # deque keeps insertion order so the oldest id is evicted once
+    # MAX_HISTORY are held (Attack 17 bound).
+    seen: set[int] = set()
+    seen_order: deque[int] = deque()
+
+    # Per-phase candidate lists of compiled projections. Coverage records
+    # each projection through step()'s hooks, so it gets the interpretive
+    # path (compiled is None) and the full list via the empty index.
+    by_phase = {} if coverage.is_enabled() else index_projections_by_phase(projections)
+    compiled: list[tuple[Mu, Applier]] | None = None
+    compiled_by_phase: dict[str, list[tuple[Mu, Applier]]] = {}
+    if not coverage.is_enabled():
+        compiled_of: dict[int, tuple[Mu, Applier]] = {}
+        compiled = []
+        for proj in projections:
+            compiled_of[id(proj)] = (proj, compile_projection(proj))
+            compiled.append(compiled_of[id(proj)])
+        for phase, candidates in by_phase.items():
+            compiled_by_phase[phase] = []
+            for proj in candidates:
+                compiled_by_phase[phase].append(compiled_of[id(proj)])
+    fuse_ascend = "ascending" in by_phase and mu_equal(
+        by_phase["ascending"], _STANDARD_ASCENDING
+    )
+
+    # Hot names bound to locals: one fast local load per use in the loop
+    # instead of a module-global or attribute lookup
+    _step = step
+    _step_compiled = step_compiled
+    _validate = validate_deep_eval_state if validate else None
+    _intern = interner.intern
+    _record = history.append
+    _fast_ascend = _ascend if fuse_ascend else None
 
     for i in range(max_steps):
         # Validate state if it's a deep_eval state
-        if validate:
-            is_valid, error = validate_deep_eval_state(current)
+        if _validate is not None:
+            is_valid, error = _validate(current)
             if not is_valid:
                 raise ValueError(f"Invalid deep_eval state at step {i+1}: {error}")
 
-        if debug:
+        key = id(current) if isinstance(current, (dict, list)) else None
+        if key is not None:
+            if key in seen:
+                # Revisited: the steps from here repeat the cycle verbatim
+                if debug:
+                    print(f"\n=== Step {i+1} ===")
+                    print("CYCLE")
+                break
+            if len(seen_order) == MAX_HISTORY:
+                seen.discard(seen_order.popleft())
+            seen_order.append(key)
+            seen.add(key)
+
+        next_val = _fast_ascend(current) if _fast_ascend is not None else None
+        if next_val is None and compiled is None:
+            next_val = _step(projections, current)
+        elif next_val is None:
+            phase = current.get("phase") if isinstance(current, dict) else None
+            candidates = compiled_by_phase.get(phase, compiled) if isinstance(phase, str) else compiled
+            next_val = _step_compiled(candidates, current)
+        next_val = _intern(next_val)
+
+        _record((i + 1, current, next_val))
+        stalled = next_val is current
+
+        # Debug output is formatted only after the stall decision, and only
+        # for the steps that are printed
+        if debug and (i < DEBUG_STEP_LIMIT or stalled):
             print(f"\n=== Step {i+1} ===")
-            print(f"Current: {json.dumps(current, indent=2)}")
-
-        next_val = step(projections, current)
-
-        # Cap history to prevent memory exhaustion (Attack 17)
-        if len(history) < MAX_HISTORY:
-            history.append({"step": i + 1, "before": current, "after": next_val})
-
-        if debug:
-            if mu_equal(current, next_val):
+            print(f"Current: {_format_state(current)}")
+            if stalled:
                 print("STALL")
             else:
-                print(f"Result: {json.dumps(next_val, indent=2)}")
-
-        # Check for done wrapper with internal marker (prevents spoofing)
-        if (isinstance(next_val, dict) and
-            next_val.get("mode") == "deep_eval_done" and
-            next_val.get("_marker") == DONE_MARKER):
+                print(f"Result: {_format_state(next_val)}")
+        elif debug and i == DEBUG_STEP_LIMIT:
+            print(f"\n... (steps after {DEBUG_STEP_LIMIT} not shown)")
+
+        # Check for done wrapper with internal marker (prevents spoofing).
+        # mode is read once; only a done-mode dict pays for the marker lookup
+        nv_mode = next_val.get("mode") if isinstance(next_val, dict) else None
+        if nv_mode == _DEEP_EVAL_DONE and next_val.get("_marker") == DONE_MARKER:
             if debug:
                 print("DONE!")
-            return next_val["result"], history
+            current = next_val
+            break
 
-        if mu_equal(current, next_val):
+        if stalled:
             break
         current = next_val
 
-    # If we stalled without done wrapper, extract result if possible
+    # Unwrap the done wrapper (reached above, or stalled on without it)
     # Check for internal marker to prevent spoofing
     if (isinstance(current, dict) and
-        current.get("mode") == "deep_eval_done" and
+        current.get("mode") == _DEEP_EVAL_DONE and
         current.get("_marker") == DONE_MARKER):
-        return current["result"], history
+        current = current["result"]
 
-    return current, history
+    entries: list[dict[str, Any]] = []
+    for step_no, before, after in history:
+        entries.append({"step": step_no, "before": before, "after": after})
+    return current, entries
 
 
 # =============================================================================
@@ -1,4 +1,4 @@
 # rcx_pi/engine/__init__.py
-from .evaluator_pure import PureEvaluator
+from .evaluator_pure import PureEvaluator, MemoEvaluator
 
-__all__ = ["PureEvaluator"]
+__all__ = ["PureEvaluator", "MemoEvaluator"]
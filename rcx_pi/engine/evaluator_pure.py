@@ -21,7 +21,9 @@ and rebuild them using CONS/NIL.
 """
 
 from __future__ import annotations
-from typing import Callable
+from collections import OrderedDict
+from functools import partial
+from typing import Callable, TextIO
 
 from rcx_pi.core.motif import Motif
 from rcx_pi.listutils import (
@@ -36,6 +38,20 @@ from rcx_pi.listutils import (
 class PureEvaluator:
     """Tiny evaluator executing closures as Python callables."""
 
+    # Tracing is off by default. With trace=True every run()/reduce() writes
+    # its input and result to trace_file (stdout if None). Motifs are only
+    # formatted inside _trace, so a non-tracing evaluator pays one attribute
+    # check per call and never builds a repr.
+    trace: bool = False
+    trace_file: TextIO | None = None
+
+    def __init__(self, trace: bool = False, trace_file: TextIO | None = None) -> None:
+        self.trace = trace
+        self.trace_file = trace_file
+
+    def _trace(self, label: str, m: Motif) -> None:
+        print(f"{label}: {m!r}", file=self.trace_file)
+
     # ----------------------------------------------------------------------
     # Core API used by tests
     # ----------------------------------------------------------------------
@@ -51,7 +67,30 @@ class PureEvaluator:
         if not callable(fn):
             raise TypeError(f"Program is not runnable: {program}")
 
-        return fn(self, arg)
+        if not self.trace:
+            return fn(self, arg)
+
+        self._trace("run", arg)
+        out = fn(self, arg)
+        self._trace("  ->", out)
+        return out
+
+    def specialize(self, program: Motif) -> Callable[[Motif], Motif]:
+        """
+        Bind `program` to this evaluator once.
+
+        Returns a one-argument callable equivalent to run(program, arg),
+        with the closure extraction and callable check done here instead
+        of on every call. Use it when one fixed program is applied many
+        times.
+        """
+        fn = self._extract_func(program)
+        if not callable(fn):
+            raise TypeError(f"Program is not runnable: {program}")
+
+        if self.trace:
+            return partial(self.run, program)  # keep the trace lines
+        return partial(fn, self)
 
     # ----------------------------------------------------------------------
     # Closure extraction
@@ -100,12 +139,23 @@ class PureEvaluator:
 
         Later this becomes the real rewrite reducer.
         """
-        try:
-            fn = self._extract_func(expr)
-            # treat as nullary program taking UNIT/NIL
-            return fn(self, None)  # modify if benchmarks need argument passing
-        except Exception:
-            return expr  # not executable → return motif as-is
+        trace = self.trace
+        if trace:
+            self._trace("reduce", expr)
+        meta = getattr(expr, "meta", None)
+        if not isinstance(meta, dict) or "fn" not in meta:
+            # Data motifs (Peano chains, lists, ...) are already normal forms;
+            # return them without raising and catching _extract_func's error.
+            out = expr
+        else:
+            try:
+                # treat as nullary program taking UNIT/NIL
+                out = meta["fn"](self, None)  # modify if benchmarks need argument passing
+            except Exception:
+                out = expr  # not executable → return motif as-is
+        if trace:
+            self._trace("  ->", out)
+        return out
 
     def reduce_full(self, expr, max_steps=10000):
         """
@@ -121,3 +171,39 @@ class PureEvaluator:
             cur = self.reduce(cur)
             steps += 1
         return cur
+
+
+class MemoEvaluator:
+    """
+    Evaluator wrapper that memoizes reduce() by motif identity.
+
+    The memo is keyed on id(expr), not on the structural hash: closures are
+    μ() nodes carrying .meta, so they compare equal to VOID and a structural
+    key would conflate them. Each entry pins its expr so the id cannot be
+    recycled while the entry is live. The memo is an LRU of at most
+    `maxsize` entries, so a long run only keeps its recent motifs alive.
+    Everything else delegates to `inner`.
+    """
+
+    def __init__(self, inner: PureEvaluator | None = None, maxsize: int = 4096) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.inner = inner if inner is not None else PureEvaluator()
+        self.maxsize = maxsize
+        self._memo: OrderedDict[int, tuple[Motif, Motif]] = OrderedDict()
+
+    def reduce(self, expr):
+        memo = self._memo
+        hit = memo.get(id(expr))
+        if hit is not None and hit[0] is expr:
+            memo.move_to_end(id(expr))
+            return hit[1]
+        out = self.inner.reduce(expr)
+        memo[id(expr)] = (expr, out)
+        memo.move_to_end(id(expr))
+        if len(memo) > self.maxsize:
+            memo.popitem(last=False)
+        return out
+
+    def __getattr__(self, name):
+        return getattr(self.inner, name)
@@ -12,6 +12,7 @@ from __future__ import annotations
 from typing import Iterable, Optional
 
 from .core.motif import Motif
+from .core.numbers import motif_to_int
 from .engine.evaluator_pure import PureEvaluator
 from . import μ, VOID  # rcx_pi/__init__.py exposes these
 
@@ -20,32 +21,10 @@ from . import μ, VOID  # rcx_pi/__init__.py exposes these
 
 
 def num(n: int) -> Motif:
-    """Build Peano n as nested successors over VOID."""
+    """Build Peano n as nested successors over VOID (shared chain table)."""
     if n < 0:
         raise ValueError("num(n) only defined for n >= 0")
-    m = VOID
-    for _ in range(n):
-        m = m.succ()
-    return m
-
-
-def motif_to_int(m: Motif) -> Optional[int]:
-    """Convert pure Peano motif to int; return None if not pure."""
-    if not isinstance(m, Motif):
-        return None
-
-    if m.is_zero_pure():
-        return 0
-
-    count = 0
-    cur = m
-    while cur.is_successor_pure():
-        count += 1
-        cur = cur.head()
-
-    if cur.is_zero_pure():
-        return count
-    return None
+    return Motif.succ_chain(n)
 
 
 # ---------- higher-level helpers ----------
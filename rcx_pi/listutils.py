@@ -12,14 +12,16 @@ Design:
   ending in VOID.
 
 We deliberately avoid importing ``rcx_pi`` at module import time
-to prevent circular-import issues. Any bridges to the public API
-(e.g. num / motif_to_int) are done locally or reimplemented here.
+to prevent circular-import issues. The Peano helpers (num /
+motif_to_int) come straight from rcx_pi.core.numbers, which only
+depends on the motif core.
 """
 
 from __future__ import annotations
 from typing import Any
 
 from rcx_pi.core.motif import Motif, μ, VOID, UNIT
+from rcx_pi.core.numbers import motif_to_int, num
 
 
 # ---------------------------------------------------------------------------
@@ -38,27 +40,44 @@ def CONS(h: Motif, t: Motif) -> Motif:
 
 
 # ---------------------------------------------------------------------------
-# Local Peano helper to avoid rcx_pi import at module import time
+# Python list <-> Motif list bridges
 # ---------------------------------------------------------------------------
 
 
-def _motif_to_int_local(m: Motif) -> int | None:
-    """Local Peano decoder: succ^n(VOID) -> n, else None."""
-    if not isinstance(m, Motif):
-        return None
-    if m.is_zero_pure():
-        return 0
-    n = 0
-    cur = m
-    while cur.is_successor_pure():
-        n += 1
-        cur = cur.head()
-    return n if cur.is_zero_pure() else None
+def _encode_item(item: Any) -> Motif:
+    """Encode one Python list element as a motif (see list_from_py)."""
+    # 1) ints → Peano numbers
+    if isinstance(item, int):
+        return num(item)
 
+    # 2) already a Motif → use as-is (lists, numbers, closures, etc)
+    if isinstance(item, Motif):
+        return item
+
+    # 3) anything else (e.g. "x", "y") → box in a Motif with meta["py"]
+    # Use a non-Peano shape so motif_to_int(elem) returns None.
+    box = μ(UNIT, VOID)
+    meta = getattr(box, "meta", None)
+    if not isinstance(meta, dict):
+        box.meta = {}
+    box.meta["py"] = item
+    return box
 
-# ---------------------------------------------------------------------------
-# Python list <-> Motif list bridges
-# ---------------------------------------------------------------------------
+
+def _decode_item(h: Motif) -> Any:
+    """Decode one motif list element back to Python (see py_from_list)."""
+    # Try Peano int
+    n = motif_to_int(h)
+    if n is not None:
+        return n
+
+    # Try boxed Python value
+    meta = getattr(h, "meta", None)
+    if isinstance(meta, dict) and "py" in meta:
+        return meta["py"]
+
+    # Fallback: return motif itself
+    return h
 
 
 def list_from_py(seq: list[Any]) -> Motif:
@@ -70,31 +89,8 @@ def list_from_py(seq: list[Any]) -> Motif:
             CONS(num(1), CONS(num(2), CONS(num(3), NIL())))
     """
     m = NIL()
-
-    # Import num lazily, at call time, to avoid circular imports.
-    from rcx_pi import num  # type: ignore
-
     for item in reversed(seq):
-        # 1) ints → Peano numbers
-        if isinstance(item, int):
-            elem = num(item)
-
-        # 2) already a Motif → use as-is (lists, numbers, closures, etc)
-        elif isinstance(item, Motif):
-            elem = item
-
-        # 3) anything else (e.g. "x", "y") → box in a Motif with meta["py"]
-        else:
-            # Use a non-Peano shape so motif_to_int(elem) returns None.
-            box = μ(UNIT, VOID)
-            meta = getattr(box, "meta", None)
-            if not isinstance(meta, dict):
-                box.meta = {}
-            box.meta["py"] = item
-            elem = box
-
-        m = CONS(elem, m)
-
+        m = CONS(_encode_item(item), m)
     return m
 
 
@@ -106,32 +102,40 @@ def py_from_list(m: Motif) -> list[Any]:
     to Python ints via motif_to_int. Any element that is a Motif with
     meta["py"] is unboxed to that Python value. Everything else is
     returned as-is.
-    """
-    from rcx_pi import motif_to_int  # type: ignore
 
-    out: list[Any] = []
+    The spine is counted first (no allocation), then elements are decoded
+    into a list preallocated to that length.
+    """
+    n = 0
     cur = m
-
     while cur != VOID:
-        h = head(cur)
         cur = tail(cur)
+        n += 1
+
+    out: list[Any] = [None] * n
+    cur = m
+    for i in range(n):
+        h, cur = cur.structure
+        out[i] = _decode_item(h)
 
-        # Try Peano int
-        n = motif_to_int(h)
-        if n is not None:
-            out.append(n)
-            continue
+    return out
 
-        # Try boxed Python value
-        meta = getattr(h, "meta", None)
-        if isinstance(meta, dict) and "py" in meta:
-            out.append(meta["py"])
-            continue
 
-        # Fallback: return motif itself
-        out.append(h)
+def list_diagnostic(seq: list[Any]) -> tuple[Motif, list[Any], bool]:
+    """
+    Fused list_from_py + py_from_list + is_list_motif.
 
-    return out
+    Returns (motif, back, is_list) from a single pass over `seq`: each
+    element is encoded and immediately decoded, so the motif list is never
+    walked again. `is_list` is True by construction (CONS spine over NIL).
+    """
+    m = NIL()
+    back: list[Any] = [None] * len(seq)
+    for i in range(len(seq) - 1, -1, -1):
+        elem = _encode_item(seq[i])
+        back[i] = _decode_item(elem)
+        m = CONS(elem, m)
+    return m, back, True
 
 
 # ---------------------------------------------------------------------------
@@ -10,6 +10,7 @@ We do NOT rely on engine-side CLASSIFY/VALUE_TAG/etc anymore.
 Instead:
 
   • classify_motif(m)       -> μ(TAG_HEADER, core_motif)
+  • classify_many(ms)       -> [classify_motif(m) for m in ms], shared per motif
   • classification_label(m) -> "value" | "program" | "mixed" | "struct"
 
 All classification is done by *structural inspection*:
@@ -20,6 +21,8 @@ All classification is done by *structural inspection*:
   - "struct"  = none of the above (generic structural / nested numeric junk)
 """
 
+from weakref import WeakKeyDictionary
+
 from .core.motif import Motif, μ
 from .utils.compression import compression
 from .reduction.pattern_matching import (
@@ -187,11 +190,44 @@ def classify_motif(m: Motif) -> Motif:
     return μ(TAG_HEADER, core)
 
 
+def classify_many(motifs) -> list:
+    """
+    Batch form of classify_motif().
+
+    Motifs are immutable, so a motif that appears several times in the batch
+    (by identity) is tagged once and the tagged result is shared. Entries pin
+    their motif so ids stay unique even when `motifs` is a generator.
+    """
+    cache: dict = {}
+    out = []
+    for m in motifs:
+        hit = cache.get(id(m))
+        if hit is None:
+            hit = (m, classify_motif(m))
+            cache[id(m)] = hit
+        out.append(hit[1])
+    return out
+
+
+# classification_label memo: motif -> label, keyed by structural equality
+_LABELS: "WeakKeyDictionary[Motif, str]" = WeakKeyDictionary()
+
+
 def classification_label(tagged: Motif) -> str:
     """
     Inspect a (possibly tagged) motif and return a human-readable label:
 
         "value", "program", "mixed", "struct"
+
+    Labels are a pure function of structure (the program-marker predicates
+    never look at .meta), so Motif inputs are memoized by structural
+    equality. The memo holds its motifs weakly: an entry lives only as long
+    as the motif it was computed for.
     """
-    core = strip_meta_tag(tagged)
-    return _classify_core(core)
+    if not isinstance(tagged, Motif):
+        return _classify_core(strip_meta_tag(tagged))
+    label = _LABELS.get(tagged)
+    if label is None:
+        label = _classify_core(strip_meta_tag(tagged))
+        _LABELS[tagged] = label
+    return label
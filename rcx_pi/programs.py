@@ -520,6 +520,13 @@ def activate(ev, program: Motif, arg: Motif) -> Motif:
     Backwards-compat: if prog is a tagged program block / seq block,
     unwrap and execute structurally.
     """
+    # Native closure motifs: closures are nullary μ() nodes carrying
+    # meta["fn"], never list-shaped blocks, so skip the block probes (each
+    # one decodes `program` with py_from_list).
+    meta = getattr(program, "meta", None)
+    if isinstance(meta, dict) and "fn" in meta:
+        return ev.run(program, arg)
+
     # Tagged program blocks / seq blocks (legacy)
     try:
         if is_program_block(program) or _is_seq_block(program):
@@ -236,7 +236,7 @@ def get_var_name(mu: Mu) -> str:
     "This function remains as the reference implementation for parity testing."
 )
 @host_builtin(
-    "len() for size, zip() for pairing, set() for key comparison, "
+    "len() for size, zip() for pairing, dict key views for key comparison, "
     "any() for aggregation, 'in' for membership, .items()/.keys() for iteration"
 )
 @host_mutation("bindings[k] = v to accumulate variable bindings")
@@ -319,7 +319,8 @@ def match(pattern: Mu, input_value: Mu) -> dict[str, Mu] | _NoMatch:
     if isinstance(pattern, dict):
         if not isinstance(input_value, dict):
             return NO_MATCH
-        if set(pattern.keys()) != set(input_value.keys()):
+        # Key views compare as sets without building two temporary sets
+        if pattern.keys() != input_value.keys():
             return NO_MATCH
         bindings = {}
         for key in pattern:
@@ -383,6 +383,8 @@ def mu_equal(a: Any, b: Any) -> bool:
 
     Uses canonical JSON serialization to avoid Python's type coercion.
     This ensures True != 1 and other edge cases are handled correctly.
+    The same object compared with itself is validated once and never
+    serialized, which makes mu_equal O(validation) on interned values.
 
     Args:
         a: First Mu value.
@@ -394,12 +396,29 @@ def mu_equal(a: Any, b: Any) -> bool:
     Raises:
         TypeError: If either value is not a valid Mu.
     """
+    if a is b:
+        assert_mu(a, "mu_equal.a")
+        return True
     assert_mu(a, "mu_equal.a")
     assert_mu(b, "mu_equal.b")
-    return (
-        json.dumps(a, sort_keys=True, ensure_ascii=False) ==
-        json.dumps(b, sort_keys=True, ensure_ascii=False)
-    )
+    return mu_key(a) == mu_key(b)
+
+
+def mu_key(value: Mu) -> str:
+    """
+    Canonical JSON of a Mu value: two values have equal keys iff mu_equal.
+
+    Unlike mu_equal and mu_hash this does NOT validate. It is for loops
+    whose states are already asserted (e.g. by step()), which can then
+    serialize each state once and compare keys instead of calling mu_equal.
+
+    Args:
+        value: A Mu value, already validated by the caller.
+
+    Returns:
+        Canonical JSON string (sorted keys, no ASCII escaping).
+    """
+    return json.dumps(value, sort_keys=True, ensure_ascii=False)
 
 
 def mu_hash(value: Any) -> str:
@@ -419,8 +438,103 @@ def mu_hash(value: Any) -> str:
     """
     import hashlib
     assert_mu(value, "mu_hash")
-    canonical = json.dumps(value, sort_keys=True, ensure_ascii=False)
-    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+    return hashlib.sha256(mu_key(value).encode('utf-8')).hexdigest()
+
+
+# =============================================================================
+# Hash-Consing
+# =============================================================================
+# Interning equal Mu subterms to one shared instance turns mu_equal between
+# interned values into an identity check, and makes id() a valid memo key.
+# =============================================================================
+
+
+def _intern_part(value: Any) -> Any:
+    """Key component for one child of an interned node."""
+    value_type = type(value)
+    if value_type is dict or value_type is list:
+        return id(value)  # child is already canonical
+    if value_type is float:
+        return (float, repr(value))  # keep 0.0 / -0.0 apart, as JSON does
+    return (value_type, value)  # type tag keeps True apart from 1
+
+
+class MuInterner:
+    """
+    Hash-consing table for Mu values.
+
+    intern(value) returns the canonical instance of value: two interned
+    values are mu_equal exactly when they are the same object. Children are
+    interned bottom-up with an explicit stack (no host recursion), and
+    subtrees that are already canonical are not revisited, so interning a
+    value built around interned parts only touches the new nodes.
+
+    Interned values are shared and must be treated as immutable. The table
+    keeps every canonical node alive, so scope it to one evaluation run.
+    value must already be a valid Mu (acyclic, JSON-compatible).
+    """
+
+    __slots__ = ("_nodes", "_ids")
+
+    def __init__(self) -> None:
+        self._nodes: dict[tuple, Mu] = {}
+        self._ids: set[int] = set()
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def intern(self, value: Mu) -> Mu:
+        """Return the canonical instance of value (scalars are returned as-is)."""
+        if type(value) is not dict and type(value) is not list:
+            return value
+        ids = self._ids
+        if id(value) in ids:
+            return value
+
+        canon: dict[int, Mu] = {}  # id(original node) -> canonical node
+        stack = [value]
+        while stack:
+            node = stack[-1]
+            if id(node) in canon:
+                stack.pop()  # shared child pushed twice
+                continue
+            pushed = False
+            for c in (node.values() if type(node) is dict else node):
+                if (type(c) is dict or type(c) is list) and id(c) not in ids and id(c) not in canon:
+                    stack.append(c)
+                    pushed = True
+            if pushed:
+                continue
+            stack.pop()
+            canon[id(node)] = self._intern_node(node, canon)
+        return canon[id(value)]
+
+    def _intern_node(self, node: Mu, canon: dict[int, Mu]) -> Mu:
+        """Intern one node whose container children are all interned."""
+        rebuilt = False
+        if type(node) is dict:
+            items = []
+            for k, v in node.items():
+                c = canon.get(id(v), v)
+                rebuilt = rebuilt or c is not v
+                items.append((k, c))
+            key = ("d",) + tuple(sorted((k, _intern_part(v)) for k, v in items))
+        else:
+            elems = []
+            for v in node:
+                c = canon.get(id(v), v)
+                rebuilt = rebuilt or c is not v
+                elems.append(c)
+            key = ("l",) + tuple(_intern_part(c) for c in elems)
+
+        found = self._nodes.get(key)
+        if found is not None:
+            return found
+        if rebuilt:
+            node = dict(items) if type(node) is dict else elems
+        self._nodes[key] = node
+        self._ids.add(id(node))
+        return node
 
 
 # =============================================================================
@@ -12,7 +12,7 @@ from __future__ import annotations
 
 from typing import Callable
 
-from .mu_type import Mu, mu_equal
+from .mu_type import Mu, mu_key
 from .eval_seed import step
 from .kernel import get_step_budget
 
@@ -75,6 +75,11 @@ def make_projection_runner(mode_name: str) -> tuple[
 
         Reports steps to the global step budget for cross-call resource accounting.
 
+        A step where no projection matched returns the state itself, so
+        that stall is an identity check. Other steps compare canonical
+        keys (mu_key), carrying the new key forward: each state is
+        serialized once instead of twice per mu_equal.
+
         Returns:
             (final_state, steps_taken, is_stall)
 
@@ -83,6 +88,7 @@ def make_projection_runner(mode_name: str) -> tuple[
         """
         budget = get_step_budget()
         state = initial_state
+        state_key: str | None = None
         for i in range(max_steps):
             # Check if done
             if is_done(state):
@@ -93,13 +99,22 @@ def make_projection_runner(mode_name: str) -> tuple[
             # Take a step
             next_state = step(projections, state)
 
-            # Check for stall (no change) - use mu_equal to avoid Python type coercion
-            if mu_equal(next_state, state):
+            # Check for stall (no change) - compare canonical JSON keys, not
+            # Python ==, to avoid type coercion (True != 1)
+            if next_state is state:
+                stalled = True
+            else:
+                if state_key is None:
+                    state_key = mu_key(state)
+                next_key = mu_key(next_state)
+                stalled = next_key == state_key
+            if stalled:
                 # Report steps consumed to global budget
                 budget.consume(i)
                 return state, i, True
 
             state = next_state
+            state_key = next_key
 
         # Max steps exceeded - treat as stall
         # Report steps consumed to global budget
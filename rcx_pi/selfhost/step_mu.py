@@ -32,7 +32,7 @@ from __future__ import annotations
 from .eval_seed import NO_MATCH, host_iteration, step as eval_step
 from .match_mu import match_mu, normalize_for_match, denormalize_from_match
 from .subst_mu import subst_mu
-from .mu_type import Mu, assert_mu, mu_equal
+from .mu_type import Mu, assert_mu, mu_key
 from .seed_integrity import get_seeds_dir, load_verified_seed
 
 
@@ -109,6 +109,13 @@ def validate_kernel_projections_first(projections: list[Mu]) -> None:
 # Module-level cache for combined kernel projections
 _combined_kernel_cache: list[Mu] | None = None
 
+# Normalized domain projections as a Mu linked list, keyed by the canonical
+# JSON of the projection list. Cons cells are never mutated, so every
+# step_kernel_mu call over the same projections (each step of run_mu)
+# shares one encoding instead of rebuilding it.
+_linked_projs_cache: dict[str, Mu] = {}
+_LINKED_PROJS_CACHE_MAX = 64
+
 
 def list_to_linked(items: list[Mu]) -> Mu:
     """
@@ -185,6 +192,38 @@ def clear_combined_kernel_cache() -> None:
     """Clear cached kernel projections (for testing)."""
     global _combined_kernel_cache
     _combined_kernel_cache = None
+    _linked_projs_cache.clear()
+
+
+def linked_domain_projections(projections: list[Mu]) -> Mu:
+    """
+    Normalize domain projections and link them for the kernel, with caching.
+
+    Cons cells stay {head, tail} dicts (Mu has no tuple form); the saving
+    is in building them once per distinct projection list rather than on
+    every step. A list that is not JSON is never cached, so it fails in
+    normalize_projection exactly as before.
+
+    Args:
+        projections: List of domain projections.
+
+    Returns:
+        Mu linked list of normalized projections (None if empty).
+    """
+    try:
+        key: str | None = mu_key(projections)
+    except (TypeError, ValueError):
+        key = None
+    if key is not None and key in _linked_projs_cache:
+        return _linked_projs_cache[key]
+
+    normalized_projs = [normalize_projection(p) for p in projections]  # AST_OK: infra - kernel bridge scaffolding
+    linked = list_to_linked(normalized_projs)
+    if key is not None:
+        if len(_linked_projs_cache) >= _LINKED_PROJS_CACHE_MAX:
+            _linked_projs_cache.clear()
+        _linked_projs_cache[key] = linked
+    return linked
 
 
 @host_iteration("Kernel execution loop - Phase 8 replaces with recursive kernel projections")
@@ -224,27 +263,33 @@ def step_kernel_mu(projections: list[Mu], input_value: Mu) -> Mu:
     # Load combined kernel projections
     kernel_projs = load_combined_kernel_projections()
 
-    # Normalize domain projections to head/tail format
-    normalized_projs = [normalize_projection(p) for p in projections]  # AST_OK: infra - kernel bridge scaffolding
-
     # Normalize input value
     normalized_input = normalize_for_match(input_value)
 
     # Build kernel entry format: {_step: normalized_input, _projs: linked_list}
+    # (domain projections normalized to head/tail format, cached per list)
     kernel_entry: Mu = {
         "_step": normalized_input,
-        "_projs": list_to_linked(normalized_projs)
+        "_projs": linked_domain_projections(projections)
     }
 
     # Run kernel until done or stall
     current = kernel_entry
+    current_key: str | None = None
     max_steps = 10000  # Safety limit
 
     for _ in range(max_steps):
         result = eval_step(kernel_projs, current)
 
-        # Check for stall (no change)
-        if mu_equal(result, current):
+        # Check for stall (no change). No match hands back current itself;
+        # otherwise compare canonical keys, carrying result's key forward so
+        # each kernel state is serialized once (eval_step validated it)
+        if result is current:
+            return input_value
+        if current_key is None:
+            current_key = mu_key(current)
+        result_key = mu_key(result)
+        if result_key == current_key:
             # Stall before reaching done - return original input
             return input_value
 
@@ -274,6 +319,7 @@ def step_kernel_mu(projections: list[Mu], input_value: Mu) -> Mu:
             return result
 
         current = result
+        current_key = result_key
 
     # Max steps exceeded - return original input (stall)
     return input_value
@@ -362,21 +408,37 @@ def run_mu(projections: list[Mu], initial: Mu, max_steps: int = 1000) -> tuple[M
         - final_value: The result after all steps
         - trace: List of {"step": n, "value": v} entries
         - is_stall: True if stopped due to stall (no change)
+
+    step_mu is deterministic, so its results are memoized by the canonical
+    JSON of the state for the length of the run: a state that recurs is
+    never pushed through the kernel again. The same key doubles as the
+    stall check, so each step serializes one new state instead of the two
+    a mu_equal comparison would.
     """
+    assert_mu(initial, "run_mu.initial")
     trace = []
     current = initial
+    current_key = mu_key(current)
+    memo: dict[str, Mu] = {}
 
     for i in range(max_steps):
         trace.append({"step": i, "value": current})
 
-        result = step_mu(projections, current)
+        if current_key in memo:
+            result = memo[current_key]
+        else:
+            result = step_mu(projections, current)
+            memo[current_key] = result
 
-        # Check for stall (no change)
-        if mu_equal(result, current):
+        # Check for stall (no change). step_mu hands back its input on a
+        # stall, which needs no serialization at all
+        result_key = current_key if result is current else mu_key(result)
+        if result_key == current_key:
             trace.append({"step": i + 1, "value": result, "stall": True})
             return result, trace, True
 
         current = result
+        current_key = result_key
 
     # Hit max steps without stall
     trace.append({"step": max_steps, "value": current, "max_steps": True})
@@ -1,10 +1,10 @@
-from rcx_pi import VOID
+from rcx_pi.core.motif import Motif
 
 
 def motif_to_int(m):
     """Interpret a Motif Peano number as an int, or None if not a pure number."""
     # Zero
-    if not isinstance(m, type(VOID)):
+    if not isinstance(m, Motif):
         return None
     if m.is_zero_pure():
         return 0
@@ -14,7 +14,7 @@ def motif_to_int(m):
     while cur.is_successor_pure():
         count += 1
         cur = cur.head()
-        if not isinstance(cur, type(VOID)):
+        if not isinstance(cur, Motif):
             return None
     if cur.is_zero_pure():
         return count
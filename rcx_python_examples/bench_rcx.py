@@ -8,10 +8,14 @@ This is intentionally **aligned with the new API**:
     - Lists: list_from_py, py_from_list
     - Programs: swap_ends_xyz_closure + PureEvaluator.run
     - Evaluator: new_evaluator()
-
-It does *not* use ev.reduce(), because the pure structural reducer
-has not been implemented yet. Think of this as a smoke-benchmark for
-the “motif + evaluator + list program” pipeline.
+    - Deep succ chains: rcx_pi.bench.succ_chain_builder (--succ-depth)
+
+The pure structural reducer has not been implemented yet: ev.reduce()
+returns data motifs unchanged, so none of these benchmarks time it. The
+succ benchmark measures building a deep Peano chain and is a guard
+against recursion or quadratic costs in deep structure, not a reduction
+benchmark. Think of this as a smoke-benchmark for the “motif + evaluator
++ list program” pipeline.
 """
 
 from __future__ import annotations
@@ -20,6 +24,7 @@ import time
 import statistics as stats
 
 import rcx_pi
+from rcx_pi.bench import succ_chain_builder
 
 
 # ---------------------------------------------------------------------------
@@ -54,6 +59,7 @@ def bench_swap_ends(iterations: int, list_len: int) -> float:
 
     We build a fixed list [0,1,2,...,list_len-1] as a Motif,
     then repeatedly apply swap_ends_xyz_closure and discard the result.
+    The program is bound once with ev.specialize() outside the timed loop.
     """
     list_from_py = rcx_pi.list_from_py
     py_from_list = rcx_pi.py_from_list
@@ -75,10 +81,12 @@ def bench_swap_ends(iterations: int, list_len: int) -> float:
             f"swap_ends sanity check failed: expected ends swapped, got {out_list}"
         )
 
+    run_swap = ev.specialize(prog)
+
     start = time.perf_counter()
     cur = xs
     for _ in range(iterations):
-        cur = ev.run(prog, cur)
+        cur = run_swap(cur)
     end = time.perf_counter()
 
     # Optional: keep cur alive so the loop doesn't get optimized away.
@@ -87,10 +95,38 @@ def bench_swap_ends(iterations: int, list_len: int) -> float:
     return end - start
 
 
-def run_bench(fn, *, repeats: int = 5, **kwargs) -> None:
+def bench_succ(depth: int) -> float:
+    """
+    Benchmark building a fresh succ chain of `depth` successors.
+
+    The chain is data, which ev.reduce() leaves as it is, so there is no
+    reduction step to time (see rcx_pi.bench.succ_chain_builder).
+    Returns elapsed seconds.
+    """
+    build = succ_chain_builder(depth)
+
+    start = time.perf_counter()
+    m = build()
+    end = time.perf_counter()
+
+    if rcx_pi.motif_to_int(m) != depth:
+        raise RuntimeError(f"succ chain sanity check failed for depth {depth}")
+
+    return end - start
+
+
+def run_bench(fn, *, repeats: int = 5, warmup: int = 0, **kwargs) -> None:
     """
     Run a benchmark function several times and print aggregate stats.
+
+    The first call is reported as the cold run. `warmup` further untimed
+    calls run before the `repeats` steady-state runs that the stats cover.
     """
+    cold = fn(**kwargs)
+    print(f"  cold: {cold:.6f}s")
+    for _ in range(warmup):
+        fn(**kwargs)
+
     times = []
     for i in range(repeats):
         t = fn(**kwargs)
@@ -99,6 +135,7 @@ def run_bench(fn, *, repeats: int = 5, **kwargs) -> None:
 
     mean = stats.mean(times)
     stdev = stats.pstdev(times) if len(times) > 1 else 0.0
+    print(f"  steady min: {min(times):.6f}s")
     print(f"  mean: {mean:.6f}s  (σ={stdev:.6f}s)\n")
 
 
@@ -117,6 +154,12 @@ def main() -> None:
         default=5,
         help="Number of times to repeat each benchmark (default: 5)",
     )
+    parser.add_argument(
+        "--warmup",
+        type=int,
+        default=3,
+        help="Untimed runs after the cold run, before timing (default: 3)",
+    )
     parser.add_argument(
         "--iters-add",
         type=int,
@@ -135,22 +178,42 @@ def main() -> None:
         default=8,
         help="Length of list for swap_ends benchmark (default: 8)",
     )
+    parser.add_argument(
+        "--succ-depth",
+        type=int,
+        default=1024,
+        help="Depth of the Peano chain for the succ benchmark (default: 1024)",
+    )
 
     args = parser.parse_args()
 
     print("RCX-π current-core benchmarks\n")
 
     print(f"[add] Peano add(num(2), num(3)) x {args.iters_add}")
-    run_bench(bench_add, repeats=args.repeats, iterations=args.iters_add)
+    run_bench(
+        bench_add,
+        repeats=args.repeats,
+        warmup=args.warmup,
+        iterations=args.iters_add,
+    )
 
     print(f"[swap_ends] list length {args.list_len} x {args.iters_swap}")
     run_bench(
         bench_swap_ends,
         repeats=args.repeats,
+        warmup=args.warmup,
         iterations=args.iters_swap,
         list_len=args.list_len,
     )
 
+    print(f"[succ] depth {args.succ_depth}")
+    run_bench(
+        bench_succ,
+        repeats=args.repeats,
+        warmup=args.warmup,
+        depth=args.succ_depth,
+    )
+
 
 if __name__ == "__main__":
     main()
@@ -15,7 +15,7 @@ Run with:
 
 from rcx_pi import num, add, motif_to_int
 from rcx_pi.core.motif import Motif
-from rcx_pi.listutils import list_from_py, py_from_list, is_list_motif
+from rcx_pi.listutils import list_from_py, py_from_list, is_list_motif, list_diagnostic
 from rcx_pi.programs import swap_ends_xyz_closure, succ_list_program
 from rcx_pi import PureEvaluator
 
@@ -33,31 +33,32 @@ def demo_numbers() -> None:
     print("3 + 5 motif:", s)
     print("back to int:", rcx_pi.motif_to_int(s))
 
-    tagged = rcx_pi.classify_motif(n5)
-    print("classified motif (pretty):", rcx_pi.pretty_motif(tagged))
+    tagged_n3, tagged_n5, tagged_s = rcx_pi.classify_many([n3, n5, s])
+    print("classified n3 (pretty):", rcx_pi.pretty_motif(tagged_n3))
+    print("classified n5 (pretty):", rcx_pi.pretty_motif(tagged_n5))
+    print("classified 3 + 5 (pretty):", rcx_pi.pretty_motif(tagged_s))
     print()
 
 
 def demo_lists() -> None:
     print("=== Lists ===")
     xs = [1, 2, 3, 4]
-    mlist = rcx_pi.list_from_py(xs)
+    mlist, back, is_list = list_diagnostic(xs)
     print("python list:", xs)
     print("motif list:", mlist)
-    print("back to python:", rcx_pi.py_from_list(mlist))
-    print("is_list_motif:", rcx_pi.is_list_motif(mlist))
+    print("back to python:", back)
+    print("is_list_motif:", is_list)
     print()
 
 
-def demo_swap_ends() -> None:
+def demo_swap_ends(ev) -> None:
     print("=== swap_ends_xyz_closure ===")
     xs = [1, 2, 3, 4]
     mlist = rcx_pi.list_from_py(xs)
 
-    ev = rcx_pi.new_evaluator()
-    prog = rcx_pi.swap_ends_xyz_closure()
+    swap_ends = ev.specialize(rcx_pi.swap_ends_xyz_closure())
 
-    out = ev.run(prog, mlist)
+    out = swap_ends(mlist)
     out_py = rcx_pi.py_from_list(out)
 
     print("input list motif: ", mlist)
@@ -65,10 +66,11 @@ def demo_swap_ends() -> None:
     print("output as python: ", out_py)
     print()
 
+
+def demo_succ_list(ev) -> None:
     # === succ_list_program (map +1 over a list of Peano numbers) ===
     print("\n=== succ_list_program (RCX-π named program) ===")
 
-    ev = PureEvaluator()
     prog = succ_list_program()
 
     xs = list_from_py([num(0), num(1), num(2), num(3)])
@@ -85,9 +87,11 @@ def demo_swap_ends() -> None:
 
 def main() -> None:
     print("RCX-π demo (current core)\n")
+    ev = PureEvaluator()
     demo_numbers()
     demo_lists()
-    demo_swap_ends()
+    demo_swap_ends(ev)
+    demo_succ_list(ev)
 
 
 if __name__ == "__main__":
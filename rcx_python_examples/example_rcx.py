@@ -2,10 +2,9 @@ from rcx_pi.engine.evaluator_pure import PureEvaluator
 from rcx_pi.programs import swap_ends_xyz_closure, activate
 from rcx_pi.listutils import list_from_py, py_from_list
 
-if __name__ == "__main__":
-    ev = PureEvaluator()
 
-    # Example: swap ends of a list [2, 5] -> [5, 2]
+def demo_swap_ends(ev) -> None:
+    """Example: swap ends of a list [2, 5] -> [5, 2]"""
     swap_cl = swap_ends_xyz_closure()
     pair = list_from_py([2, 5])
 
@@ -14,3 +13,11 @@ if __name__ == "__main__":
 
     print("Input:  [2, 5]")
     print("Output:", result_py)
+
+
+def main() -> None:
+    demo_swap_ends(PureEvaluator())
+
+
+if __name__ == "__main__":
+    main()
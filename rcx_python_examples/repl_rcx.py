@@ -20,7 +20,6 @@ Type 'help' to see this summary again, 'quit' to exit.
 from __future__ import annotations
 
 import sys
-from typing import Optional, Tuple
 
 from rcx_pi import (
     μ,
@@ -32,6 +31,8 @@ from rcx_pi import (
     classify_motif,
 )
 from rcx_pi.core.motif import Motif
+from rcx_pi.decode import decode_pair as motif_to_pair
+from rcx_pi.decode import decode_triple as motif_to_triple
 
 from rcx_pi.programs import (
     swap_xy_closure,
@@ -48,25 +49,6 @@ from rcx_pi.self_host import (
 )
 
 
-# --- small structural helpers ------------------------------------------------
-
-
-def motif_to_pair(m: Motif) -> Optional[Tuple[int, int]]:
-    """Assume μ(a, b) where a, b are Peano; decode to (int, int)."""
-    if not isinstance(m, Motif) or len(m.structure) != 2:
-        return None
-    a, b = m.structure
-    return motif_to_int(a), motif_to_int(b)
-
-
-def motif_to_triple(m: Motif) -> Optional[Tuple[int, int, int]]:
-    """Assume μ(a, b, c) where a, b, c are Peano; decode to (int, int, int)."""
-    if not isinstance(m, Motif) or len(m.structure) != 3:
-        return None
-    a, b, c = m.structure
-    return motif_to_int(a), motif_to_int(b), motif_to_int(c)
-
-
 # --- command handlers --------------------------------------------------------
 
 
@@ -19,6 +19,7 @@ from rcx_pi import (
     num,
     motif_to_int,
     classify_motif,
+    classify_many,
     pretty_motif,
     zero,
     succ,
@@ -52,6 +53,40 @@ def test_00_overview_example():
     assert "3" in rendered
 
 
+def test_classify_many_matches_classify_motif():
+    n3 = num(3)
+    n5 = num(5)
+    tagged = classify_many([n3, n5, n3])
+
+    assert tagged == [classify_motif(n3), classify_motif(n5), classify_motif(n3)]
+    assert tagged[0] is tagged[2]
+
+
+def test_classification_label_is_stable_across_equal_motifs():
+    from rcx_pi import μ
+    from rcx_pi.meta import classification_label
+
+    assert classification_label(classify_motif(num(3))) == "value"
+    assert classification_label(classify_motif(num(3))) == "value"
+    assert classification_label(μ(μ(num(1), num(2)), num(3))) == "struct"
+    assert classification_label(None) == "struct"
+
+
+def test_classification_label_memo_does_not_pin_motifs():
+    import gc
+    from rcx_pi import μ
+    from rcx_pi.meta import _LABELS, classification_label
+
+    m = μ(μ(num(1), num(2)), num(4))
+    assert classification_label(m) == "struct"
+    assert m in _LABELS
+
+    before = len(_LABELS)
+    del m
+    gc.collect()
+    assert len(_LABELS) == before - 1
+
+
 def test_pred_of_succ_zero():
     """
     Basic numbers sanity: pred(succ(0)) == 0 in the integer view.
@@ -39,3 +39,11 @@ def test_reverse_list_basic():
     xs2 = list_from_py([1, 2, 3, 4])
     out2 = ev.run(program, xs2)
     assert py_from_list(out2) == [4, 3, 2, 1]
+
+
+def test_py_from_list_round_trip():
+    xs = [0, 3, "x", 10, None]
+    assert py_from_list(list_from_py(xs)) == xs
+
+    long_xs = list(range(500))
+    assert py_from_list(list_from_py(long_xs)) == long_xs
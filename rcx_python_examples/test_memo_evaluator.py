@@ -0,0 +1,92 @@
+# test_memo_evaluator.py
+"""
+MemoEvaluator: reduce() results are memoized by motif identity and
+everything else is delegated to the wrapped evaluator.
+"""
+
+from rcx_pi import PureEvaluator, VOID, num, list_from_py, py_from_list
+from rcx_pi.engine import MemoEvaluator
+from rcx_pi.programs import swap_xy_closure
+
+
+class _CountingEvaluator(PureEvaluator):
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def reduce(self, expr):
+        self.calls += 1
+        return super().reduce(expr)
+
+
+def test_reduce_is_memoized_by_identity() -> None:
+    inner = _CountingEvaluator()
+    ev = MemoEvaluator(inner)
+    expr = num(2).add(num(3))
+
+    assert ev.reduce(expr) == num(5)
+    assert ev.reduce(expr) == num(5)
+    assert inner.calls == 1
+
+
+def test_memo_evicts_least_recently_used() -> None:
+    inner = _CountingEvaluator()
+    ev = MemoEvaluator(inner, maxsize=2)
+    a, b, c = num(1), num(2), num(3)
+
+    ev.reduce(a)
+    ev.reduce(b)
+    ev.reduce(a)  # hit: b is now the oldest entry
+    ev.reduce(c)  # evicts b
+    assert len(ev._memo) == 2
+    assert inner.calls == 3
+
+    ev.reduce(a)
+    assert inner.calls == 3
+    ev.reduce(b)
+    assert inner.calls == 4
+
+
+def test_structurally_equal_closure_is_not_conflated_with_void() -> None:
+    ev = MemoEvaluator()
+    closure = swap_xy_closure()
+    assert closure == VOID
+
+    assert ev.reduce(VOID) is VOID
+    assert ev.reduce(closure) is closure
+
+
+def test_run_delegates_to_inner() -> None:
+    ev = MemoEvaluator()
+    out = ev.run(swap_xy_closure(), list_from_py([1, 2]))
+    assert py_from_list(out) == [2, 1]
+
+
+def test_reduce_returns_data_motifs_unchanged() -> None:
+    ev = PureEvaluator()
+    n = num(40)
+    assert ev.reduce(n) is n
+    assert ev.reduce(VOID) is VOID
+
+
+def test_trace_writes_run_input_and_result(capsys) -> None:
+    ev = PureEvaluator(trace=True)
+    ev.run(swap_xy_closure(), list_from_py([1, 2]))
+    out = capsys.readouterr().out.splitlines()
+    assert out[0].startswith("run: μ(")
+    assert out[1].startswith("  ->: μ(")
+
+    PureEvaluator().run(swap_xy_closure(), list_from_py([1, 2]))
+    assert capsys.readouterr().out == ""
+
+
+def test_trace_writes_reduce_input_and_result(capsys) -> None:
+    ev = PureEvaluator(trace=True)
+    n = num(2)
+    assert ev.reduce(n) is n
+    assert capsys.readouterr().out.splitlines() == [
+        f"reduce: {n!r}",
+        f"  ->: {n!r}",
+    ]
+
+    PureEvaluator().reduce(n)
+    assert capsys.readouterr().out == ""
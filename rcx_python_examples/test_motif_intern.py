@@ -0,0 +1,70 @@
+# test_motif_intern.py
+"""
+Hash-consing of data motifs via rcx_pi.core.intern_motif.
+"""
+
+from rcx_pi import μ, VOID, UNIT, num, list_from_py
+from rcx_pi.core import intern_motif
+from rcx_pi.programs import swap_xy_closure
+
+
+def test_equal_data_motifs_share_identity() -> None:
+    a = intern_motif(μ(num(2), μ(num(5), VOID)))
+    b = intern_motif(μ(μ(μ(VOID)), μ(num(5), VOID)))
+    assert a is b
+    assert a == μ(num(2), μ(num(5), VOID))
+
+
+def test_numerals_intern_to_succ_chain() -> None:
+    built = VOID
+    for _ in range(300):
+        built = μ(built)
+    assert intern_motif(built) is num(300)
+    assert intern_motif(μ(VOID)) is num(1)
+
+
+def test_identity_atoms_are_kept_apart() -> None:
+    # VOID and UNIT are atoms by identity: they intern to themselves, and
+    # structurally equal fresh nodes never intern to them.
+    assert intern_motif(VOID) is VOID
+    assert intern_motif(UNIT) is UNIT
+
+    empty = intern_motif(μ())
+    assert empty is not VOID
+    assert intern_motif(μ()) is empty
+
+    one = intern_motif(μ(μ()))
+    assert one is not UNIT and one is not num(1)
+    assert one.structure[0] is empty
+
+    pair = intern_motif(μ(μ(), UNIT))
+    assert pair.structure == (empty, UNIT)
+
+
+def test_motifs_with_meta_keep_their_identity() -> None:
+    closure = swap_xy_closure()
+    assert intern_motif(closure) is closure
+
+    boxed = list_from_py(["x"])
+    assert intern_motif(boxed) is boxed
+    assert intern_motif(boxed).structure[0].meta == {"py": "x"}
+
+
+def test_deep_chains_do_not_recurse() -> None:
+    m = VOID
+    for _ in range(5000):
+        m = μ(m, VOID)
+    # Fresh nodes over canonical children become the canonical entries.
+    assert intern_motif(m) is m
+
+
+def test_interning_around_canonical_parts_reuses_them() -> None:
+    base = VOID
+    for _ in range(2000):
+        base = μ(base, VOID)
+    base = intern_motif(base)
+    top = intern_motif(μ(base, μ(base)))
+    assert top.structure[0] is base
+    assert top.structure[1].structure[0] is base
+    assert intern_motif(top) is top
+    assert intern_motif(μ(base, μ(base))) is top
@@ -49,6 +49,25 @@ def test_pred_of_zero_is_none() -> None:
     assert pred(z) is None
 
 
+def test_num_shares_one_chain_per_depth() -> None:
+    assert num(7) is num(7)
+    assert num(7).head() is num(6)
+    assert Motif.succ_chain(0) is VOID
+
+    built = VOID
+    for _ in range(7):
+        built = built.succ()
+    assert num(7) == built
+
+
+def test_deep_numerals_do_not_recurse() -> None:
+    deep = num(5000)
+    assert deep.is_number_pure()
+    assert motif_to_int(deep.succ()) == 5001
+    assert motif_to_int(deep.add(num(3))) == 5003
+    assert motif_to_int(num(2).mult(deep)) == 10000
+
+
 @pytest.mark.parametrize("a", range(0, 8))
 @pytest.mark.parametrize("b", range(0, 8))
 def test_addition_grid(a: int, b: int) -> None:
@@ -81,9 +100,86 @@ def test_list_roundtrip(py_list) -> None:
     assert back == py_list
 
 
+@pytest.mark.parametrize("py_list", [[], [0, 3], [1, "x", 2], [num(4), 5]])
+def test_list_diagnostic_matches_separate_walks(py_list) -> None:
+    from rcx_pi.listutils import list_diagnostic
+
+    m, back, is_list = list_diagnostic(py_list)
+    assert m == list_from_py(py_list)
+    assert back == py_from_list(list_from_py(py_list))
+    assert is_list is True and is_list_motif(m)
+
+
 def test_list_roundtrip_longer() -> None:
     data = list(range(10))
     m = list_from_py(data)
     assert is_list_motif(m)
     back = py_from_list(m)
     assert back == data
+
+
+# ---------------------------------------------------------------------------
+# Arity-dispatch decoder
+# ---------------------------------------------------------------------------
+
+
+def test_decode_dispatches_on_arity() -> None:
+    from rcx_pi import μ
+    from rcx_pi.decode import decode, decode_pair, decode_triple
+
+    assert decode(VOID) == 0
+    assert decode(num(4)) == 4
+    assert decode(μ(num(2), num(5))) == (2, 5)
+    assert decode(μ(num(2), num(5), num(7))) == (2, 5, 7)
+    assert decode(μ(VOID, VOID, VOID, VOID)) is None
+    assert decode(μ(μ(VOID, VOID))) is None
+
+    assert decode_pair(μ(num(2), num(5))) == (2, 5)
+    assert decode_pair(num(2)) is None
+    assert decode_triple(μ(num(1), num(2), num(3))) == (1, 2, 3)
+
+
+# ---------------------------------------------------------------------------
+# Structural hash / equality digest
+# ---------------------------------------------------------------------------
+
+
+def test_hash_and_eq_agree_with_structure() -> None:
+    from rcx_pi import μ
+
+    built = VOID
+    for _ in range(50):
+        built = μ(built)
+    assert built == num(50) and hash(built) == hash(num(50))
+    assert built != num(49)
+
+    a = μ(num(2), μ(num(5), VOID))
+    b = μ(μ(μ(μ())), μ(num(5), μ()))
+    assert a == b and hash(a) == hash(b)
+    assert a != μ(num(2), μ(num(6), VOID))
+    assert len({a, b, num(2)}) == 2
+
+
+def test_deep_hash_and_eq_do_not_recurse() -> None:
+    from rcx_pi import μ
+
+    def spine(n: int):
+        m = VOID
+        for _ in range(n):
+            m = μ(m, VOID)
+        return m
+
+    a, b = spine(5000), spine(5000)
+    assert hash(a) == hash(b)
+    assert a == b
+    assert a != spine(4999)
+
+
+def test_succ_chain_builder_matches_depth() -> None:
+    from rcx_pi.bench import succ_chain_builder
+
+    build = succ_chain_builder(3000)
+    m = build()
+    assert motif_to_int(m) == 3000
+    assert m == num(3000)
+    assert build() is not m
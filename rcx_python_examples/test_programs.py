@@ -85,18 +85,17 @@ def motif_to_triple(m: Motif):
 if __name__ == "__main__":
     ev = PureEvaluator()
 
-    # numbers we'll use
-    n2 = num(2)
-    n5 = num(5)
-    n7 = num(7)
+    # numbers and argument motifs we'll use, built once for every section
+    n2, n5, n7 = num(2), num(5), num(7)
+    PAIR = μ(n2, n5)
+    TRIPLE = μ(n2, n5, n7)
 
     # 1) swap (x, y) -> (y, x)
     print("=== swap_xy_closure: (2, 5) -> (5, 2) ===")
-    pair = μ(n2, n5)
-    print("Original pair motif: ", pair, " =>  ", motif_to_pair(pair))
+    print("Original pair motif: ", PAIR, " =>  ", motif_to_pair(PAIR))
 
     swap_cl = swap_xy_closure()
-    expr = activate(swap_cl, pair)
+    expr = activate(swap_cl, PAIR)
     print("Activation motif:     ", expr)
 
     res = ev.reduce(expr)
@@ -105,11 +104,10 @@ if __name__ == "__main__":
 
     # 2) dup_x: (x, y) -> (x, x)
     print("=== dup_x_closure: (2, 5) -> (2, 2) ===")
-    pair2 = μ(n2, n5)
-    print("Original pair motif: ", pair2, " =>  ", motif_to_pair(pair2))
+    print("Original pair motif: ", PAIR, " =>  ", motif_to_pair(PAIR))
 
     dup_cl = dup_x_closure()
-    expr2 = activate(dup_cl, pair2)
+    expr2 = activate(dup_cl, PAIR)
     print("Activation motif:     ", expr2)
 
     res2 = ev.reduce(expr2)
@@ -118,11 +116,10 @@ if __name__ == "__main__":
 
     # 3) rotate_xyz: (2, 5, 7) -> (5, 7, 2)
     print("=== rotate_xyz_closure: (2, 5, 7) -> (5, 7, 2) ===")
-    triple = μ(n2, n5, n7)
-    print("Original triple:      ", triple, " =>  ", motif_to_triple(triple))
+    print("Original triple:      ", TRIPLE, " =>  ", motif_to_triple(TRIPLE))
 
     rot_cl = rotate_xyz_closure()
-    expr3 = activate(rot_cl, triple)
+    expr3 = activate(rot_cl, TRIPLE)
     print("Activation motif:     ", expr3)
 
     res3 = ev.reduce(expr3)
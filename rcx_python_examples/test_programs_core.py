@@ -35,6 +35,21 @@ def test_swap_xy_basic():
     assert py_from_list(out) == ["y", "x"]
 
 
+def test_specialized_program_matches_run():
+    ev = new_evaluator()
+    prog = swap_xy_closure()
+    swap = ev.specialize(prog)
+    pair = list_from_py([2, 5])
+    assert swap(pair) == ev.run(prog, pair)
+    assert py_from_list(swap(pair)) == [5, 2]
+
+
+def test_specialize_rejects_data_motif():
+    ev = new_evaluator()
+    with pytest.raises(TypeError):
+        ev.specialize(list_from_py([1]))
+
+
 def test_dup_x_basic():
     xs = list_from_py([1, 2, 3])
     out = _run(dup_x_closure, xs)
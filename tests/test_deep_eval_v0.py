@@ -4,20 +4,26 @@ Tests for deep_eval v0 (work-stack machine).
 Tests the production deep_eval module from rcx_pi/deep_eval.py.
 
 HOST DEBT INVENTORY (test scaffolding):
-  - @host_builtin: linked_list (reversed), to_python_list (while-loop)
-  Total: 2 host dependencies (test helpers only, not production code)
+  - @host_builtin: linked_list_from_iterable (iteration, mutation), linked_list,
+    binary_counter (range)
+  - @host_iteration: to_python_list (while-loop)
+  Total: 4 host dependencies (test helpers only, not production code)
 """
 
 import pytest
 
 from rcx_pi.deep_eval import (
     make_deep_eval_projections,
+    index_projections_by_phase,
     validate_deep_eval_state,
     run_deep_eval,
     deep_eval,
+    compile_projection,
     MAX_HISTORY,
     MAX_CONTEXT_DEPTH,
+    DEBUG_STEP_LIMIT,
 )
+from rcx_pi.eval_seed import NO_MATCH, apply_projection
 from rcx_pi.mu_type import assert_mu, mu_equal
 
 
@@ -38,19 +44,38 @@ def host_iteration(func):
 
 
 @host_builtin
-def linked_list(*elements):
+def linked_list_from_iterable(iterable):
     """
-    Create linked list from elements.
+    Create linked list from any iterable (e.g. range(n)) in one pass.
 
-    @host_builtin: Uses reversed() builtin
+    Each element is validated and appended as it is read, so the input is
+    never copied into an intermediate list or tuple.
+
+    @host_builtin: Iterates the input and links cells by mutation
     """
     result = None
-    for elem in reversed(elements):
+    last = None
+    for elem in iterable:
         assert_mu(elem)
-        result = {"head": elem, "tail": result}
+        cell = {"head": elem, "tail": None}
+        if last is None:
+            result = cell
+        else:
+            last["tail"] = cell
+        last = cell
     return result
 
 
+@host_builtin
+def linked_list(*elements):
+    """
+    Create linked list from elements.
+
+    @host_builtin: Delegates to linked_list_from_iterable
+    """
+    return linked_list_from_iterable(elements)
+
+
 @host_iteration
 def to_python_list(linked):
     """
@@ -59,12 +84,35 @@ def to_python_list(linked):
     @host_iteration: Uses while-loop
     """
     result = []
+    append = result.append
     while linked is not None:
-        result.append(linked["head"])
+        append(linked["head"])
         linked = linked["tail"]
     return result
 
 
+@host_builtin
+def binary_counter(width):
+    """
+    Projections that count a list of width bits up from [0, ..., 0].
+
+    Each state is new until all bits are 1 (a stall after 2**width - 1
+    steps), so the run is long, shallow and never revisits a state.
+
+    @host_builtin: Uses range() builtin
+    """
+    projections = []
+    for ones in range(width):
+        prefix = []
+        for i in range(width - ones - 1):
+            prefix.append({"var": f"b{i}"})
+        projections.append({
+            "pattern": prefix + [0] + [1] * ones,
+            "body": prefix + [1] + [0] * ones,
+        })
+    return projections
+
+
 # =============================================================================
 # Domain Projections (append)
 # =============================================================================
@@ -217,6 +265,161 @@ class TestConvenienceFunction:
         assert mu_equal(result, expected)
 
 
+class TestHashConsing:
+    """run_deep_eval interns every state, so stalls are identity checks."""
+
+    def test_rebuilt_equal_value_is_a_stall(self):
+        """A projection that rebuilds an equal value stalls on the first step."""
+        rebuild = {"pattern": {"a": {"var": "x"}}, "body": {"a": {"var": "x"}}}
+        result, history = run_deep_eval([rebuild], {"a": [1, 2]})
+
+        assert len(history) == 1
+        assert history[0]["after"] is history[0]["before"]
+        assert mu_equal(result, {"a": [1, 2]})
+
+    def test_cycle_states_are_matched_once(self, monkeypatch):
+        """The cycle check stops a two-state cycle before either recurs."""
+        import rcx_pi.deep_eval as deep_eval_mod
+
+        calls = []
+        real_step = deep_eval_mod.step_compiled
+
+        def counting_step(compiled, value):
+            calls.append(value)
+            return real_step(compiled, value)
+
+        monkeypatch.setattr(deep_eval_mod, "step_compiled", counting_step)
+        flip = [
+            {"pattern": {"s": "a"}, "body": {"s": "b"}},
+            {"pattern": {"s": "b"}, "body": {"s": "a"}},
+        ]
+        result, history = run_deep_eval(flip, {"s": "a"}, max_steps=20)
+
+        assert len(calls) == 2
+        assert len(history) == 2
+        assert mu_equal(result, {"s": "a"})
+
+    def test_cycle_stops_at_first_revisit(self):
+        """A cycle ends once a state recurs, however large max_steps is."""
+        cycle = [
+            {"pattern": {"s": "a"}, "body": {"s": "b"}},
+            {"pattern": {"s": "b"}, "body": {"s": "c"}},
+            {"pattern": {"s": "c"}, "body": {"s": "a"}},
+        ]
+        result, history = run_deep_eval(cycle, {"s": "a"}, max_steps=10_000)
+
+        assert len(history) == 3
+        assert mu_equal(history[-1]["after"], {"s": "a"})
+        assert mu_equal(result, {"s": "a"})
+
+    def test_cycle_check_forgets_states_beyond_max_history(self, monkeypatch):
+        """Only the last MAX_HISTORY states are checked, so longer cycles run on."""
+        import rcx_pi.deep_eval as deep_eval_mod
+
+        monkeypatch.setattr(deep_eval_mod, "MAX_HISTORY", 2)
+        cycle = [
+            {"pattern": {"s": "a"}, "body": {"s": "b"}},
+            {"pattern": {"s": "b"}, "body": {"s": "c"}},
+            {"pattern": {"s": "c"}, "body": {"s": "a"}},
+        ]
+        result, history = run_deep_eval(cycle, {"s": "a"}, max_steps=30)
+
+        # Each state has been evicted by the time the cycle returns to it
+        assert [h["step"] for h in history] == [29, 30]
+        assert mu_equal(result, {"s": "a"})
+
+    def test_loaded_state_is_not_mutated(self):
+        """Schema strings of a caller's state are interned on a copy."""
+        import json
+
+        state = json.loads(json.dumps({
+            "mode": "deep_eval",
+            "phase": "root_check",
+            "focus": linked_list(1),
+            "context": [],
+            "changed": False,
+        }))
+        snapshot = json.dumps(state, sort_keys=True)
+        phase = state["phase"]
+
+        result, _ = run_deep_eval(make_deep_eval_projections([]), state)
+
+        assert to_python_list(result) == [1]
+        assert state["phase"] is phase
+        assert json.dumps(state, sort_keys=True) == snapshot
+
+    def test_ascend_steps_skip_projection_matching(self, monkeypatch):
+        """Pure ascend steps are never matched and leave history unchanged."""
+        import rcx_pi.deep_eval as deep_eval_mod
+
+        value = {"op": "append", "xs": linked_list(1, 2), "ys": linked_list(3, 4)}
+        projections = make_deep_eval_projections(DOMAIN_PROJECTIONS)
+        # Same machine, but a renamed wrap id disables the ascend fast path
+        renamed = projections[:-1] + [dict(projections[-1], id="wrap.renamed")]
+        slow_result, slow_history = run_deep_eval(renamed, value)
+
+        stepped = []
+        real_step = deep_eval_mod.step_compiled
+
+        def recording_step(compiled, state):
+            stepped.append(state)
+            return real_step(compiled, state)
+
+        monkeypatch.setattr(deep_eval_mod, "step_compiled", recording_step)
+        result, history = run_deep_eval(projections, value)
+
+        assert mu_equal(result, slow_result)
+        assert mu_equal(history, slow_history)
+        assert len(stepped) < len(history)
+        for state in stepped:
+            if isinstance(state, dict) and state.get("phase") == "ascending":
+                assert state["context"][0]["type"] != "dict_tail"
+
+    def test_compiled_projections_agree_with_apply_projection(self):
+        """compile_projection matches and builds exactly like apply_projection."""
+        projections = make_deep_eval_projections(DOMAIN_PROJECTIONS) + [
+            {"pattern": [{"var": "x"}, {"var": "x"}], "body": {"pair": {"var": "x"}}},
+            {"pattern": {"n": 1, "f": 1.0, "b": True}, "body": [None, "k"]},
+        ]
+        states = [
+            {"mode": "deep_eval", "phase": phase, "focus": focus,
+             "context": context, "changed": changed}
+            for phase in ("traverse", "ascending", "root_check")
+            for focus in (linked_list(1), {"op": "append", "xs": None, "ys": 7})
+            for context in ([], [{"type": "dict_tail", "head_val": 1}, []])
+            for changed in (True, False)
+        ] + [
+            {"op": "append", "xs": linked_list(1), "ys": None},
+            [{"a": 1}, {"a": 1}], [{"a": 1}, {"a": 2}], [1, True],
+            {"n": 1, "f": 1.0, "b": True}, {"n": True, "f": 1.0, "b": True},
+            {"n": 1, "f": 1, "b": True}, None, "deep_eval",
+        ]
+        for proj in projections:
+            apply = compile_projection(proj)
+            for state in states:
+                expected = apply_projection(proj, state)
+                result = apply(state)
+                if expected is NO_MATCH:
+                    assert result is NO_MATCH
+                else:
+                    assert mu_equal(result, expected)
+
+    def test_malformed_projections_fail_like_step(self):
+        """A malformed projection raises as in step(), once a state reaches it."""
+        unbound = {"pattern": {"s": "b"}, "body": {"var": "unbound"}}
+        flip = [{"pattern": {"s": "a"}, "body": {"s": "b"}}, unbound]
+        with pytest.raises(KeyError, match="Unbound variable"):
+            run_deep_eval(flip, {"s": "a"})
+
+        with pytest.raises(KeyError, match="'pattern' and 'body'"):
+            run_deep_eval([{"pattern": {"s": "a"}}], {"s": "a"})
+
+        # Never reached: the first projection stalls on every state
+        unnamed = {"pattern": {"var": ""}, "body": 1}
+        result, _ = run_deep_eval([{"pattern": {"s": "a"}, "body": {"s": "a"}}, unnamed], {"s": "a"})
+        assert mu_equal(result, {"s": "a"})
+
+
 # =============================================================================
 # State Validation Tests
 # =============================================================================
@@ -294,6 +497,26 @@ class TestValidation:
         assert not is_valid
         assert "root_check" in error.lower() or "context" in error.lower()
 
+    def test_malformed_context_frames_rejected(self):
+        """Wrong-arity lists and dict stand-ins are rejected at the right depth."""
+        frame = {"type": "dict_tail", "head_result": 0}
+        cases = [
+            ([frame, [], "extra"], "depth 0 must be [frame, outer], got length 3"),
+            ([frame, [frame]], "depth 1 must be [frame, outer], got length 1"),
+            ([frame, {"a": frame, "b": []}], "depth 1 is not a list"),
+        ]
+        for context, message in cases:
+            state = {
+                "mode": "deep_eval",
+                "phase": "ascending",
+                "focus": 1,
+                "context": context,
+                "changed": False
+            }
+            is_valid, error = validate_deep_eval_state(state)
+            assert not is_valid
+            assert message in error
+
 
 # =============================================================================
 # Adversary Attack Tests
@@ -385,7 +608,7 @@ class TestAdversaryAttacks:
         History should be capped at MAX_HISTORY.
         """
         projections = make_deep_eval_projections([])
-        value = linked_list(*range(10))
+        value = linked_list_from_iterable(range(10))
 
         # Run with many steps
         result, history = run_deep_eval(projections, value, max_steps=MAX_HISTORY + 100)
@@ -393,6 +616,59 @@ class TestAdversaryAttacks:
         # History should be capped
         assert len(history) <= MAX_HISTORY, f"History grew to {len(history)}, expected max {MAX_HISTORY}"
 
+    def test_history_keeps_most_recent_steps(self):
+        """Once full, history drops the oldest steps and keeps the newest."""
+        _, history = run_deep_eval(binary_counter(10), [0] * 10, max_steps=MAX_HISTORY + 10)
+
+        assert len(history) == MAX_HISTORY
+        assert history[0]["step"] == 11
+        assert history[-1]["step"] == MAX_HISTORY + 10
+
+    def test_debug_output_is_capped(self, capsys):
+        """debug=True prints DEBUG_STEP_LIMIT steps, not every step of a long run."""
+        run_deep_eval(binary_counter(7), [0] * 7, max_steps=DEBUG_STEP_LIMIT + 20, debug=True)
+        out = capsys.readouterr().out
+
+        assert out.count("=== Step") == DEBUG_STEP_LIMIT
+        assert out.count("not shown") == 1
+
+        run_deep_eval([], {"s": "a"}, debug=True)
+        assert "STALL" in capsys.readouterr().out
+
+    def test_debug_formatting_matches_json(self):
+        """ASCII states without exponent floats print as json.dumps(indent=2)."""
+        import json
+        from rcx_pi.deep_eval import _format_state
+
+        state = {
+            "mode": "deep_eval",
+            "focus": {"head": 1.5, "tail": [True, None, [], {}, -3]},
+            "context": [],
+            "changed": False,
+        }
+        assert _format_state(state) == json.dumps(state, indent=2)
+
+    def test_debug_formatting_falls_back_to_json(self):
+        """Values orjson rejects are formatted by json.dumps(indent=2)."""
+        import json
+        from rcx_pi.deep_eval import _format_state
+
+        state = {"focus": [1, 2], "wide": 2 ** 70}  # beyond orjson's integer range
+        assert _format_state(state) == json.dumps(state, indent=2)
+
+    def test_debug_formatting_orjson_differences(self):
+        """With orjson, non-ASCII and exponent floats differ from json only in spelling."""
+        import json
+        pytest.importorskip("orjson")
+        from rcx_pi.deep_eval import _format_state
+
+        state = {"name": "μ", "big": 1e20, "small": 1e-7}
+        out = _format_state(state)
+
+        assert '"μ"' in out and "1e20" in out and "1e-7" in out
+        assert out != json.dumps(state, indent=2)
+        assert json.loads(out) == state
+
     def test_attack_invalid_phase_runtime(self):
         """Verify invalid phase values are rejected at runtime."""
         projections = make_deep_eval_projections([])
@@ -510,3 +786,16 @@ class TestProjectionStructure:
         """Wrap projection is last (catches everything)."""
         projections = make_deep_eval_projections([])
         assert projections[-1]["id"] == "wrap"
+
+    def test_phase_index_keeps_order_and_drops_pinned(self):
+        """Each phase keeps its pinned projections plus unpinned ones, in order."""
+        projections = make_deep_eval_projections(DOMAIN_PROJECTIONS)
+        index = index_projections_by_phase(projections)
+
+        ids = {phase: [p["id"] for p in cands] for phase, cands in index.items()}
+        unpinned = ["sibling.to_tail", "ascend.to_context", "ascend.to_root", "wrap"]
+        assert ids["ascending"] == unpinned
+        assert ids["root_check"] == ["restart", "unwrap"] + unpinned
+        assert ids["traverse"] == [
+            "reduce.append.base", "reduce.append.recursive", "descend.dict"
+        ] + unpinned
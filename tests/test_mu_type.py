@@ -16,8 +16,8 @@ from rcx_pi.mu_type import (
     is_mu, validate_mu, assert_mu, mu_type_name,
     has_callable, find_callable_path, assert_no_callables,
     assert_seed_pure, assert_handler_pure, validate_kernel_boundary,
-    mu_equal, mu_hash, mark_bootstrap, get_bootstrap_registry,
-    assert_no_bootstrap_in_production, BOOTSTRAP_REGISTRY
+    mu_equal, mu_hash, mu_key, mark_bootstrap, get_bootstrap_registry,
+    assert_no_bootstrap_in_production, BOOTSTRAP_REGISTRY, MuInterner
 )
 
 
@@ -795,6 +795,79 @@ class TestMuEqual:
         with pytest.raises(TypeError):
             mu_equal({"a": 1}, lambda x: x)
 
+    def test_same_object(self):
+        """A value is equal to itself; the identity fast path still validates."""
+        value = {"x": [1, {"y": True}]}
+        assert mu_equal(value, value) is True
+        fn = lambda x: x  # noqa: E731
+        with pytest.raises(TypeError):
+            mu_equal(fn, fn)
+
+
+class TestMuKey:
+    """Tests for mu_key() - canonical JSON key, equal iff mu_equal."""
+
+    def test_equal_iff_mu_equal(self):
+        """Keys agree with mu_equal, including the anti-coercion cases."""
+        pairs = [
+            ({"z": 1, "a": 2}, {"a": 2, "z": 1}),
+            (True, 1),
+            (1, 1.0),
+            (None, {}),
+            ({"x": [1, {"y": True}]}, {"x": [1, {"y": 1}]}),
+        ]
+        for a, b in pairs:
+            assert (mu_key(a) == mu_key(b)) is mu_equal(a, b)
+
+    def test_hash_is_sha256_of_key(self):
+        """mu_hash is the SHA-256 of the same canonical encoding."""
+        import hashlib
+        value = {"b": "μ", "a": [1, None]}
+        assert mu_hash(value) == hashlib.sha256(mu_key(value).encode("utf-8")).hexdigest()
+
+
+class TestMuInterner:
+    """Tests for MuInterner - hash-consing makes mu_equal an identity check."""
+
+    def test_equal_values_share_one_instance(self):
+        """Structurally equal values intern to the same object."""
+        table = MuInterner()
+        a = table.intern({"z": 1, "a": [1, {"y": True}]})
+        b = table.intern({"a": [1, {"y": True}], "z": 1})
+        assert a is b
+        assert table.intern(a) is a
+
+    def test_distinguishes_like_mu_equal(self):
+        """True/1, 1/1.0 and 0.0/-0.0 stay distinct, as under mu_equal."""
+        table = MuInterner()
+        for x, y in [(True, 1), (1, 1.0), (0.0, -0.0), (None, [])]:
+            assert table.intern([x]) is not table.intern([y])
+
+    def test_shared_subterms(self):
+        """Equal children are shared; the outer node is rebuilt around them."""
+        table = MuInterner()
+        leaf = table.intern({"head": 1, "tail": None})
+        outer = {"p": {"head": 1, "tail": None}, "q": {"head": 1, "tail": None}}
+        result = table.intern(outer)
+        assert result["p"] is leaf and result["q"] is leaf
+        assert mu_equal(result, outer)
+
+    def test_scalars_pass_through(self):
+        """Scalars are returned unchanged and not stored."""
+        table = MuInterner()
+        assert table.intern("s") == "s"
+        assert table.intern(None) is None
+        assert len(table) == 0
+
+    def test_deep_value_does_not_recurse(self):
+        """Interning is iterative, so nesting depth is not a recursion limit."""
+        table = MuInterner()
+        a = b = None
+        for i in range(5000):
+            a = {"head": i, "tail": a}
+            b = {"head": i, "tail": b}
+        assert table.intern(a) is table.intern(b)
+
 
 class TestMuHash:
     """Tests for mu_hash() - deterministic hashing."""
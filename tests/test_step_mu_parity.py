@@ -11,7 +11,7 @@ See docs/core/SelfHosting.v0.md for design.
 import pytest
 
 from rcx_pi.eval_seed import step, apply_projection, NO_MATCH
-from rcx_pi.step_mu import step_mu, apply_mu
+from rcx_pi.step_mu import step_mu, apply_mu, run_mu
 
 
 class TestApplyMuParityWithApplyProjection:
@@ -313,3 +313,87 @@ class TestStepMuErrors:
         # Structural step_mu stalls instead of raising
         result = step_mu(projections, 42)
         assert result == 42  # Returns original input (stall)
+
+
+class TestRunMu:
+    """run_mu memoizes step_mu within a run."""
+
+    def test_recurring_state_is_stepped_once(self, monkeypatch):
+        """A two-state cycle only reaches step_mu once per distinct state."""
+        import rcx_pi.selfhost.step_mu as step_mu_mod
+
+        calls = []
+        real_step_mu = step_mu_mod.step_mu
+
+        def counting_step_mu(projections, value):
+            calls.append(value)
+            return real_step_mu(projections, value)
+
+        monkeypatch.setattr(step_mu_mod, "step_mu", counting_step_mu)
+        flip = [
+            {"pattern": {"s": "a"}, "body": {"s": "b"}},
+            {"pattern": {"s": "b"}, "body": {"s": "a"}},
+        ]
+        result, trace, is_stall = run_mu(flip, {"s": "a"}, max_steps=10)
+
+        assert len(calls) == 2
+        assert len(trace) == 11
+        assert trace[-1]["max_steps"] is True
+        assert is_stall is False
+        assert result == {"s": "a"}
+
+    def test_stall_matches_step(self):
+        """run_mu stops where repeated step() stops."""
+        projections = [{"pattern": {"n": 0}, "body": {"n": 1}}]
+        result, trace, is_stall = run_mu(projections, {"n": 0})
+
+        assert is_stall is True
+        assert result == step(projections, {"n": 0})
+        assert trace[-1] == {"step": 2, "value": {"n": 1}, "stall": True}
+
+    def test_bool_and_int_states_are_distinct(self):
+        """True and 1 are different states (no Python type coercion)."""
+        projections = [{"pattern": True, "body": 1}]
+        result, trace, is_stall = run_mu(projections, True)
+
+        assert is_stall is True
+        assert result == 1 and result is not True
+        assert len(trace) == 3
+
+
+class TestLinkedDomainProjections:
+    """step_kernel_mu encodes each distinct projection list once."""
+
+    def test_equal_projection_lists_normalized_once(self, monkeypatch):
+        """An equal (not identical) projection list reuses the cached encoding."""
+        import rcx_pi.selfhost.step_mu as step_mu_mod
+
+        step_mu_mod.clear_combined_kernel_cache()
+        calls = []
+        real_normalize = step_mu_mod.normalize_projection
+
+        def counting_normalize(proj):
+            calls.append(proj)
+            return real_normalize(proj)
+
+        monkeypatch.setattr(step_mu_mod, "normalize_projection", counting_normalize)
+
+        def make():
+            return [
+                {"pattern": {"s": "a"}, "body": {"s": "b"}},
+                {"pattern": {"s": "b"}, "body": {"s": "c"}},
+            ]
+
+        assert step_mu(make(), {"s": "a"}) == {"s": "b"}
+        assert step_mu(make(), {"s": "b"}) == {"s": "c"}
+        assert len(calls) == 2
+
+        other = [{"pattern": {"s": "a"}, "body": {"s": "z"}}]
+        assert step_mu(other, {"s": "a"}) == {"s": "z"}
+        assert len(calls) == 3
+
+    def test_invalid_projection_is_not_cached(self):
+        """A broken projection still raises on every call."""
+        for _ in range(2):
+            with pytest.raises(KeyError):
+                step_mu([{"pattern": 42}], 42)